@@ -1,43 +1,79 @@
+import csv
+import os
 import time
+from functools import partial
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from scipy import stats
 from src.generators import generate_vertex_cover_graph
-from src.kernel import kernel_vertex_cover_crown
-from src.vcb import vcb_recursive
-
-
-def benchmark_instance(G, k, edge_density):
-    """Benchmark détaillé avec métriques supplémentaires."""
+from src.bitset_solver import BITSET_THRESHOLD, vcb_bitset
+from src.batch import drop_partial_line, run_tasks
+from src.budget import Budget, Unknown
+from src.instrumentation import SolverStats
+from src.kernel import KERNELS
+from src.vcb import ALGORITHMS
+
+
+def benchmark_instance(G, k, edge_density, algo="edge", bounds=(), kernel="crown",
+                       bitset_threshold=BITSET_THRESHOLD, time_limit=None, node_limit=None):
+    """
+    Benchmark détaillé avec métriques supplémentaires.
+    `algo` sélectionne le moteur de branchement (clé de `src.vcb.ALGORITHMS`), `bounds`
+    les bornes inférieures d'élagage (clés de `src.bounds.LOWER_BOUNDS`) et `kernel` la
+    kernelization (clé de `src.kernel.KERNELS`). Les noyaux d'au plus `bitset_threshold`
+    sommets sont résolus par le solveur par bits (0 pour le désactiver).
+
+    `time_limit` (secondes) et `node_limit` bornent séparément la chaîne kernel + VCB et le
+    VCB seul : une exécution interrompue a un résultat vide (None) et la cause de l'arrêt
+    dans les colonnes `kernel_status` / `vcb_status` ("solved", "timeout" ou "node_limit").
+    """
+    vcb = ALGORITHMS[algo]
+    kernelize = KERNELS[kernel]
     results = {
         "n": G.number_of_nodes(),
         "m": G.number_of_edges(),
         "k": k,
         "density": edge_density,
-        "k_n_ratio": k / G.number_of_nodes()
+        "k_n_ratio": k / G.number_of_nodes(),
+        "algo": algo,
+        "bounds": "+".join(bounds),
+        "kernel": kernel
     }
 
     # Kernel + VCB
-    start = time.time()
-    ker_g, ker_k, no_inst = kernel_vertex_cover_crown(G, k)
-    ker_time = time.time() - start
-
-    if not no_inst and ker_g:
-        vcb_start = time.time()
-        vcb_ker_result = vcb_recursive(ker_g, ker_k)
-        ker_vcb_time = time.time() - vcb_start
+    budget = Budget(time_limit, node_limit)
+    start = time.perf_counter()
+    red_stats = SolverStats()
+    ker_g, ker_k, no_inst = kernelize(G, k, red_stats, budget=budget)
+    ker_time = time.perf_counter() - start
+    # Sommets supprimés et temps passé par chaque règle de réduction
+    results.update({f"reduced_{rule}": count for rule, count in red_stats.get("reductions", {}).items()})
+    results.update({f"time_{rule}": elapsed for rule, elapsed in red_stats.get("time", {}).items()})
+    results["crown_iterations"] = red_stats.get("crown_iterations", 0)
+
+    if not no_inst:  # Un noyau vide est une instance positive, pas un échec
+        ker_n = ker_g.number_of_nodes()
+        vcb_start = time.perf_counter()
+        ker_stats = SolverStats()
+        ker_vcb = vcb_bitset if ker_n <= bitset_threshold else vcb
+        vcb_ker_result = ker_vcb(ker_g, ker_k, ker_stats, bounds, budget=budget)
+        ker_vcb_time = time.perf_counter() - vcb_start
 
         results.update({
             "kernel_size": ker_g.number_of_nodes(),
             "kernel_edges": ker_g.number_of_edges(),
-            "kernel_density": ker_g.number_of_edges() / (ker_g.number_of_nodes() * (ker_g.number_of_nodes() - 1) / 2),
+            "kernel_density": ker_g.number_of_edges() / (ker_n * (ker_n - 1) / 2) if ker_n > 1 else 0,
             "kernel_time": ker_time,
             "kernel_vcb_time": ker_vcb_time,
             "total_ker_time": ker_time + ker_vcb_time,
             "reduction_ratio": 1 - (ker_g.number_of_nodes() / G.number_of_nodes()),
-            "edge_reduction_ratio": 1 - (ker_g.number_of_edges() / G.number_of_edges()),
-            "kernel_success": vcb_ker_result
+            "edge_reduction_ratio": 1 - (ker_g.number_of_edges() / G.number_of_edges()) if G.number_of_edges() else 0,
+            "kernel_success": _answer(vcb_ker_result),
+            "kernel_status": _status(vcb_ker_result),
+            "kernel_search_nodes": ker_stats.get("nodes", 0),
+            "kernel_max_depth": ker_stats.get("max_depth", 0),
+            "kernel_solver": "bitset" if ker_vcb is vcb_bitset else algo
         })
     else:
         results.update({
@@ -49,54 +85,221 @@ def benchmark_instance(G, k, edge_density):
             "total_ker_time": ker_time,
             "reduction_ratio": 0,
             "edge_reduction_ratio": 0,
-            "kernel_success": False
+            "kernel_success": False,
+            "kernel_status": "solved",
+            "kernel_search_nodes": 0,
+            "kernel_max_depth": 0,
+            "kernel_solver": None
         })
 
     # VCB seul
-    start = time.time()
-    vcb_result = vcb_recursive(G, k)
-    vcb_time = time.time() - start
+    start = time.perf_counter()
+    vcb_stats = SolverStats()
+    vcb_result = vcb(G, k, vcb_stats, bounds, budget=Budget(time_limit, node_limit))
+    vcb_time = time.perf_counter() - start
 
     results.update({
         "vcb_time": vcb_time,
-        "vcb_success": vcb_result,
+        "vcb_success": _answer(vcb_result),
+        "vcb_status": _status(vcb_result),
+        "search_nodes": vcb_stats.get("nodes", 0),
+        "max_depth": vcb_stats.get("max_depth", 0),
+        "pruned_nodes": sum(vcb_stats.get("pruned", {}).values()),
+        "bound_time": sum(vcb_stats.get("bound_time", {}).values()),
         "speedup": vcb_time / results["total_ker_time"] if results["total_ker_time"] > 0 else 0
     })
 
     return results
 
 
-def run_comprehensive_benchmarks(test_configs, edge_probs=None, samples=5):
-    """Exécute une série complète de tests."""
+def _answer(result):
+    """Réponse d'un solveur pour le tableau de résultats (None si inconnue)."""
+    return None if isinstance(result, Unknown) else result
+
+
+def _status(result) -> str:
+    """Issue d'une exécution : "solved", ou la cause de l'arrêt si le budget est épuisé."""
+    return result.reason if isinstance(result, Unknown) else "solved"
+
+
+# Colonnes qui identifient une exécution (reprise d'un fichier de résultats)
+RUN_KEY = ("n", "k", "density", "type", "sample", "algo", "bounds", "kernel")
+
+
+def run_comprehensive_benchmarks(test_configs, edge_probs=None, samples=5, algo="edge", bounds=(), kernel="crown",
+                                 time_limit=None, node_limit=None, seed=None, workers=1, output=None,
+                                 resume=True):
+    """
+    Exécute une série complète de tests avec le moteur de branchement `algo`, les bornes
+    `bounds` et la kernelization `kernel`, chaque exécution étant limitée à `time_limit`
+    secondes et `node_limit` nœuds (voir `benchmark_instance`).
+
+    Chaque exécution (configuration, densité, échantillon, type de graphe) tourne dans son
+    propre processus, avec au plus `workers` processus simultanés (plusieurs processus se
+    partagent les cœurs : les temps mesurés en parallèle sont moins précis). Un processus
+    qui dépasse son échéance est tué et la ligne correspondante a le statut "killed".
+    Chaque résultat est ajouté au fichier CSV `output` dès qu'il est connu ; relancée sur
+    le même fichier (`resume`), la série saute les exécutions déjà présentes.
+
+    La graine du graphe de chaque exécution est tirée de `seed` et enregistrée dans la
+    colonne `seed` : `replay_benchmark_row` rejoue exactement une ligne.
+
+    Retourne
+    --------
+    pd.DataFrame
+        Les résultats (ceux déjà présents dans `output` compris).
+    """
     if edge_probs is None:
         edge_probs = [0.1, 0.3, 0.5]
+    tasks = benchmark_tasks(test_configs, edge_probs, samples, seed, algo, bounds, kernel)
+    if output is not None:
+        drop_partial_line(output)
+    done = _completed_runs(output) if output is not None and resume else set()
+    pending = [task for task in tasks if _run_key(task) not in done]
+    print(f"{len(pending)} exécutions à lancer ({len(tasks) - len(pending)} déjà présentes)")
+
+    # kernel + VCB puis VCB seul, chacun limité à time_limit
+    deadline = None if time_limit is None else 2 * time_limit
+    solve = partial(run_benchmark_task, time_limit=time_limit, node_limit=node_limit)
     all_results = []
-    total_tests = len(test_configs) * len(edge_probs) * samples * 2  # *2 pour random et guaranteed
-    current = 0
+    for current, (task, results) in enumerate(run_tasks(pending, solve, workers, deadline), 1):
+        if "error" in results:  # Processus tué ou en échec : la ligne garde la tâche et la cause
+            results = {**task, "kernel_status": results["status"], "vcb_status": results["status"],
+                       "error": results["error"]}
+        print(f"n={task['n']}, d={task['density']}, {task['type']} #{task['sample']} "
+              f"(Progress: {current}/{len(pending)})")
+        if output is not None:
+            _append_row(output, results)
+        all_results.append(results)
+
+    if output is not None:
+        return pd.read_csv(output)
+    return pd.DataFrame(all_results)
 
-    for config in test_configs:
-        n, k = config["n"], config["k"]
-        print(f"\nConfiguration: n={n}, k={k}")
 
+def benchmark_tasks(test_configs, edge_probs, samples, seed=None, algo="edge", bounds=(), kernel="crown"):
+    """
+    Liste des exécutions d'une série : une par configuration, densité, échantillon et type
+    de graphe ("random", "guaranteed_vc"), chacune avec sa propre graine tirée de `seed`.
+    """
+    rng = np.random.default_rng(seed)
+    tasks = []
+    for config in test_configs:
         for edge_prob in edge_probs:
-            print(f"Edge probability: {edge_prob}")
-            for i in range(samples):
-                current += 2
-                print(f"Sample {i + 1}/{samples} (Progress: {current}/{total_tests})")
-
-                # Test standard
-                g = generate_vertex_cover_graph(n, k, edge_prob)
-                results = benchmark_instance(g, k, edge_prob)
-                results.update({"type": "random"})
-                all_results.append(results)
-
-                # Test avec VC garanti
-                g = generate_vertex_cover_graph(n, k, edge_prob, guaranteed_vc=True)
-                results = benchmark_instance(g, k, edge_prob)
-                results.update({"type": "guaranteed_vc"})
-                all_results.append(results)
+            for sample in range(samples):
+                for type_g in ("random", "guaranteed_vc"):
+                    tasks.append({"n": config["n"], "k": config["k"], "density": edge_prob, "type": type_g,
+                                  "sample": sample, "algo": algo, "bounds": "+".join(bounds), "kernel": kernel,
+                                  "seed": int(rng.integers(2 ** 63))})
+    return tasks
+
+
+def run_benchmark_task(task, time_limit=None, node_limit=None):
+    """Génère le graphe d'une exécution à partir de sa graine et le mesure (voir `benchmark_instance`)."""
+    g = generate_vertex_cover_graph(task["n"], task["k"], task["density"],
+                                    guaranteed_vc=task["type"] == "guaranteed_vc", seed=task["seed"])
+    bounds = tuple(task["bounds"].split("+")) if task["bounds"] else ()
+    results = benchmark_instance(g, task["k"], task["density"], task["algo"], bounds, task["kernel"],
+                                 time_limit=time_limit, node_limit=node_limit)
+    results.update({"type": task["type"], "sample": task["sample"], "seed": task["seed"]})
+    return results
 
-    return pd.DataFrame(all_results)
+
+def replay_benchmark_row(row, time_limit=None, node_limit=None):
+    """
+    Rejoue une ligne d'un fichier de résultats (dictionnaire ou ligne de DataFrame) : même
+    graphe (colonne `seed`), mêmes moteur, bornes et kernelization.
+    """
+    bounds = row["bounds"] if isinstance(row["bounds"], str) else ""  # Cellule vide lue comme NaN
+    task = {"n": int(row["n"]), "k": int(row["k"]), "density": float(row["density"]), "type": row["type"],
+            "sample": int(row["sample"]), "algo": row["algo"], "bounds": bounds, "kernel": row["kernel"],
+            "seed": int(row["seed"])}
+    return run_benchmark_task(task, time_limit, node_limit)
+
+
+def _run_key(row) -> tuple:
+    """Identifiant d'une exécution, sous forme de chaînes (comme lu dans le fichier CSV)."""
+    return tuple(str(row[column]) for column in RUN_KEY)
+
+
+def _completed_runs(output: str) -> set:
+    """Exécutions déjà présentes dans le fichier de résultats."""
+    if not os.path.exists(output):
+        return set()
+    with open(output, newline="") as f:
+        return {_run_key(row) for row in csv.DictReader(f)}
+
+
+def _append_row(output: str, row: dict):
+    """
+    Ajoute une ligne au fichier CSV. Si elle apporte de nouvelles colonnes (règle de
+    réduction jamais rencontrée, ligne d'échec...), le fichier est réécrit avec l'en-tête
+    élargi (fichier temporaire puis renommage, pour ne jamais laisser de fichier tronqué).
+    """
+    rows, columns = [], []
+    if os.path.exists(output):
+        with open(output, newline="") as f:
+            columns = next(csv.reader(f), [])
+    missing = [column for column in row if column not in columns]
+    if not missing:
+        with open(output, "a", newline="") as f:
+            csv.DictWriter(f, columns).writerow(row)
+        return
+
+    if columns:
+        with open(output, newline="") as f:
+            rows = list(csv.DictReader(f))
+    columns += missing
+    temporary = output + ".tmp"
+    with open(temporary, "w", newline="") as f:
+        writer = csv.DictWriter(f, columns)
+        writer.writeheader()
+        writer.writerows(rows + [row])
+    os.replace(temporary, output)
+
+
+def compare_kernels(G, k, algo="edge"):
+    """
+    Applique chaque kernelization de `src.kernel.KERNELS` au même graphe et mesure la taille
+    du noyau, le temps de kernelization et le temps de branchement sur le noyau.
+    """
+    vcb = ALGORITHMS[algo]
+    row = {"n": G.number_of_nodes(), "m": G.number_of_edges(), "k": k}
+    answers = set()
+    for name, kernelize in KERNELS.items():
+        start = time.perf_counter()
+        ker_g, ker_k, no_inst = kernelize(G, k)
+        row[f"{name}_time"] = time.perf_counter() - start
+        row[f"{name}_size"] = 0 if no_inst else ker_g.number_of_nodes()
+        row[f"{name}_k"] = ker_k
+
+        stats = {}
+        start = time.perf_counter()
+        answers.add(False if no_inst else vcb(ker_g, ker_k, stats))
+        row[f"{name}_vcb_time"] = time.perf_counter() - start
+        row[f"{name}_search_nodes"] = stats.get("nodes", 0)
+
+    assert len(answers) == 1  # Toutes les kernelizations doivent donner la même réponse
+    row["success"] = answers.pop()
+    return row
+
+
+def run_kernel_comparison(test_configs, edge_probs=None, samples=5, algo="edge", seed=None):
+    """Compare les kernelizations sur des graphes aléatoires et à couverture garantie (graine `seed`)."""
+    rng = np.random.default_rng(seed)
+    if edge_probs is None:
+        edge_probs = [0.1, 0.3, 0.5]
+    rows = []
+    for config in test_configs:
+        n, k = config["n"], config["k"]
+        for edge_prob in edge_probs:
+            for _ in range(samples):
+                for type_g, guaranteed in (("random", False), ("guaranteed_vc", True)):
+                    g = generate_vertex_cover_graph(n, k, edge_prob, guaranteed_vc=guaranteed, seed=rng)
+                    row = compare_kernels(g, k, algo)
+                    row.update({"density": edge_prob, "type": type_g})
+                    rows.append(row)
+    return pd.DataFrame(rows)
 
 
 def compute_confidence_intervals(df, column, confidence=0.95):
@@ -120,11 +323,9 @@ def main():
         {"n": 130, "k": 30}
     ]
 
-    # Exécution des benchmarks
-    results_df = run_comprehensive_benchmarks(test_configs)
-
-    # Sauvegarde détaillée
-    results_df.to_csv("benchmark_detailed.csv", index=False)
+    # Exécution des benchmarks (sauvegarde détaillée au fil de l'eau, reprise après interruption)
+    results_df = run_comprehensive_benchmarks(test_configs, time_limit=600, seed=0, workers=os.cpu_count(),
+                                              output="benchmark_detailed.csv")
 
     # Analyse statistique
     print("\nStatistiques par type et densité:")
@@ -149,6 +350,12 @@ def main():
     print("\nImpact de la densité:")
     print(density_impact)
 
+    # Comparaison des kernelizations (couronne 3k vs Nemhauser-Trotter 2k)
+    kernels_df = run_kernel_comparison(test_configs, samples=2)
+    kernels_df.to_csv("benchmark_kernels.csv", index=False)
+    print("\nComparaison des kernelizations (tailles moyennes des noyaux):")
+    print(kernels_df.groupby(['type', 'density'])[[f"{name}_size" for name in KERNELS]].mean())
+
     # Ajout des visualisations détaillées
     plot_detailed_results(results_df)
 
@@ -0,0 +1,83 @@
+"""
+Benchmark de la règle des sommets de haut degré sur des graphes riches en étoiles.
+
+Compare l'implémentation par paquets de degrés (`high_degree_rule`, O(n + m)) avec
+l'ancienne version qui reparcourt tous les sommets et recalcule tous les degrés après
+chaque suppression (O(n·(n + m))).
+"""
+import time
+
+import networkx as nx
+import pandas as pd
+
+from src.reduction_rules import high_degree_rule
+
+
+def high_degree_rule_naive(G: nx.Graph, k: int) -> int:
+    """Version de référence (quadratique) de la règle des sommets de haut degré."""
+    degs = dict(G.degree())
+    changed = True
+
+    while changed:
+        changed = False
+        for v in list(G.nodes()):
+            if degs[v] > k:
+                G.remove_node(v)
+                k -= 1
+                changed = True
+                break
+
+        if changed:
+            degs = dict(G.degree())
+
+    return k
+
+
+def generate_star_heavy_graph(hubs: int, leaves: int) -> nx.Graph:
+    """
+    Génère `hubs` étoiles de `leaves` feuilles chacune, dont les centres forment une clique :
+    tous les centres sont de haut degré pour k < leaves.
+    """
+    g = nx.complete_graph(hubs)
+    for h in range(hubs):
+        g.add_edges_from((h, (h, i)) for i in range(leaves))
+    return g
+
+
+def run_high_degree_benchmark(configs=None, k=10):
+    """Mesure les deux implémentations et vérifie qu'elles donnent le même résultat."""
+    if configs is None:
+        configs = [(50, 20), (100, 20), (200, 20), (400, 20)]
+    rows = []
+
+    for hubs, leaves in configs:
+        g = generate_star_heavy_graph(hubs, leaves)
+
+        g_naive = g.copy()
+        start = time.perf_counter()
+        k_naive = high_degree_rule_naive(g_naive, k)
+        naive_time = time.perf_counter() - start
+
+        g_bucket = g.copy()
+        start = time.perf_counter()
+        k_bucket = high_degree_rule(g_bucket, k)
+        bucket_time = time.perf_counter() - start
+
+        assert k_naive == k_bucket and set(g_naive.nodes()) == set(g_bucket.nodes())
+
+        rows.append({
+            "hubs": hubs,
+            "n": g.number_of_nodes(),
+            "m": g.number_of_edges(),
+            "k": k,
+            "naive_time": naive_time,
+            "bucket_time": bucket_time,
+            "speedup": naive_time / bucket_time if bucket_time > 0 else 0
+        })
+        print(f"hubs={hubs}: naïf {naive_time:.4f}s, paquets {bucket_time:.4f}s")
+
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    print(run_high_degree_benchmark())
@@ -0,0 +1,56 @@
+"""
+Benchmark de la kernelisation entrelacée : compare la taille de l'arbre de recherche et le
+temps de résolution avec et sans réapplication des réductions à chaque nœud.
+"""
+import time
+
+import pandas as pd
+
+from src.generators import generate_random_graph
+from src.kernel import kernel_vertex_cover_crown
+from src.vcb import ALGORITHMS
+
+
+def compare_interleaving(G, k, algo="edge", crown_every=0):
+    """
+    Résout (G, k) après kernelisation, sans puis avec réductions entrelacées, et renvoie
+    les tailles d'arbre, temps et nombres de sommets supprimés par règle.
+    """
+    vcb = ALGORITHMS[algo]
+    ker_g, ker_k, no_inst = kernel_vertex_cover_crown(G, k)
+    row = {"n": G.number_of_nodes(), "m": G.number_of_edges(), "k": k, "algo": algo,
+           "crown_every": crown_every, "kernel_size": 0 if no_inst else ker_g.number_of_nodes()}
+    if no_inst:
+        return row
+
+    for label, interleave in (("plain", False), ("interleaved", True)):
+        stats = {}
+        start = time.perf_counter()
+        row[f"{label}_result"] = vcb(ker_g, ker_k, stats, interleave=interleave, crown_every=crown_every)
+        row[f"{label}_time"] = time.perf_counter() - start
+        row[f"{label}_nodes"] = stats.get("nodes", 0)
+        for rule, count in stats.get("reductions", {}).items():
+            row[f"{label}_{rule}"] = count
+
+    assert row["plain_result"] == row["interleaved_result"]
+    return row
+
+
+def run_interleaving_benchmark(configs=None, samples=3, algo="degree", crown_every=2):
+    """
+    Compare les deux modes sur des graphes aléatoires creux G(n, m), dont les noyaux
+    contiennent encore beaucoup de sommets pendants après suppression d'un sommet.
+    """
+    if configs is None:
+        configs = [(40, 60, 16), (60, 90, 24), (80, 120, 32)]
+    rows = []
+    for n, m, k in configs:
+        for _ in range(samples):
+            g = generate_random_graph(n, m)
+            rows.append(compare_interleaving(g, k, algo, crown_every))
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    df = run_interleaving_benchmark()
+    print(df[["n", "k", "kernel_size", "plain_nodes", "interleaved_nodes", "plain_time", "interleaved_time"]])
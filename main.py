@@ -10,17 +10,45 @@ Permet de :
 
 import argparse
 import networkx as nx
+import sys
 import time
 
-from src.kernel import kernel_vertex_cover_crown
-from src.vcb import vcb_recursive
-from src.generators import generate_vertex_cover_graph
+from src.kernel import KERNELS, auto_bitset_threshold, kernel_vertex_cover, select_solver
+from src.optimize import minimum_vertex_cover
+from src.graph_utils import is_vertex_cover
+from src.instrumentation import SolverStats
+from src.bounds import LOWER_BOUNDS
+from src.budget import Budget, Unknown
+from src.vcb import ALGORITHMS
+from src.generators import generate_random_graph, generate_vertex_cover_graph
+from src.batch import find_jobs, run_batch
+from src.readers import FORMATS, read_graph
+from src.storage import EXTENSION, load_graph, save_graph
 from benchmark.benchmark import run_comprehensive_benchmarks, plot_detailed_results
 
 
-def demo_simple_example():
-    """Démontre l'utilisation sur un petit exemple."""
+def answer_text(result):
+    """Réponse d'un solveur en clair (Oui, Non, ou Inconnu si le budget est épuisé)."""
+    if isinstance(result, Unknown):
+        return f"Inconnu ({result.reason})"
+    return 'Oui' if result else 'Non'
+
+
+def show_cover(g, k, algo=None, kernel="crown", stats=None, **options):
+    """Affiche une couverture relevée depuis le noyau et vérifie sa validité sur g."""
+    cover = kernel_vertex_cover(g, k, kernel, algo or "edge", stats, auto_bitset_threshold(algo), **options)
+    if cover is not None and not isinstance(cover, Unknown):
+        print(f"- Couverture: {sorted(cover)} (valide: {is_vertex_cover(g, cover)})")
+
+
+def demo_simple_example(algo=None, workers=1, kernel="crown", order="recursive", **options):
+    """
+    Démontre l'utilisation sur un petit exemple avec la kernelization `kernel`.
+    Les `options` (bornes, réductions entrelacées...) sont transmises au moteur de branchement.
+    """
     global vcb_result
+    vcb = select_solver(algo, workers, order=order)
+    kernelize = KERNELS[kernel]
     print("\nDémonstration sur un petit graphe:")
     # Créer un petit graphe exemple (triangle + arête)
     g = nx.Graph()
@@ -30,55 +58,140 @@ def demo_simple_example():
     print(f"Graphe initial: {g.number_of_nodes()} sommets, {g.number_of_edges()} arêtes")
 
     # Test Kernel + VCB
-    start = time.time()
-    ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, k)
+    start = time.perf_counter()
+    ker_g, ker_k, no_inst = kernelize(g, k, budget=options.get("budget"))
     if not no_inst:
-        vcb_result = vcb_recursive(ker_g, ker_k)
-    ker_time = time.time() - start
+        vcb_result = select_solver(algo, workers, ker_g.number_of_nodes(), order)(ker_g, ker_k, **options)
+    ker_time = time.perf_counter() - start
 
     print(f"\nKernel + VCB:")
     print(f"- Temps: {ker_time:.3f}s")
     if not no_inst:
         print(f"- Taille kernel: {ker_g.number_of_nodes()} sommets")
-        print(f"- Résultat: {'Oui' if vcb_result else 'Non'}")
+        print(f"- Résultat: {answer_text(vcb_result)}")
+        show_cover(g, k, algo, kernel, **options)
     else:
         print("- Pas de vertex cover de taille k possible")
 
     # Test VCB seul
-    start = time.time()
-    vcb_result = vcb_recursive(g, k)
-    vcb_time = time.time() - start
+    start = time.perf_counter()
+    vcb_result = vcb(g, k, **options)
+    vcb_time = time.perf_counter() - start
 
     print(f"\nVCB seul:")
     print(f"- Temps: {vcb_time:.3f}s")
-    print(f"- Résultat: {'Oui' if vcb_result else 'Non'}")
+    print(f"- Résultat: {answer_text(vcb_result)}")
 
 
-def demo_random_graph(n=30, k=8):
-    """Démontre l'utilisation sur un graphe aléatoire."""
+def demo_random_graph(n=30, k=8, algo=None, workers=1, kernel="crown", order="recursive", show_stats=False,
+                      seed=None, **options):
+    """
+    Démontre l'utilisation sur un graphe aléatoire (mêmes paramètres que `demo_simple_example`).
+    Avec `show_stats`, les statistiques de la chaîne kernel + VCB sont affichées à plat (JSON) ;
+    `seed` rend le graphe généré reproductible.
+    """
     global vcb_result
+    vcb = select_solver(algo, workers, order=order)
+    kernelize = KERNELS[kernel]
     print(f"\nDémonstration sur un graphe aléatoire (n={n}, k={k}):")
-    g = generate_vertex_cover_graph(n, k, edge_prob=0.3)
+    g = generate_vertex_cover_graph(n, k, edge_prob=0.3, seed=seed)
     print(f"Graphe généré: {g.number_of_nodes()} sommets, {g.number_of_edges()} arêtes")
 
     # Test avec kernel
-    start = time.time()
-    ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, k)
+    start = time.perf_counter()
+    ker_g, ker_k, no_inst = kernelize(g, k, budget=options.get("budget"))
     if not no_inst:
-        vcb_result = vcb_recursive(ker_g, ker_k)
-    ker_time = time.time() - start
+        vcb_result = select_solver(algo, workers, ker_g.number_of_nodes(), order)(ker_g, ker_k, **options)
+    ker_time = time.perf_counter() - start
 
     print(f"\nKernel + VCB:")
     print(f"- Temps: {ker_time:.3f}s")
     if not no_inst:
         print(f"- Taille kernel: {ker_g.number_of_nodes()} sommets")
-        print(f"- Résultat: {'Oui' if vcb_result else 'Non'}")
+        print(f"- Résultat: {answer_text(vcb_result)}")
+        stats = SolverStats() if show_stats else None
+        show_cover(g, k, algo, kernel, stats, **options)
+        if show_stats:
+            print(f"- Statistiques: {stats.to_json()}")
     else:
         print("- Pas de vertex cover de taille k possible")
 
 
-def run_benchmarks():
-    """Lance les benchmarks complets."""
+def demo_optimize(n=30, algo=None, search="incremental", kernel="crown", seed=None, **options):
+    """Calcule une couverture minimale d'un graphe aléatoire et affiche les appels au solveur."""
+    print(f"\nCouverture minimale d'un graphe aléatoire (n={n}, parcours {search}):")
+    g = generate_random_graph(n, 2 * n, seed=seed)
+    print(f"Graphe généré: {g.number_of_nodes()} sommets, {g.number_of_edges()} arêtes")
+
+    stats = {}
+    start = time.perf_counter()
+    cover = minimum_vertex_cover(g, algo or "edge", search, kernel, stats, bitset_threshold=auto_bitset_threshold(algo),
+                                 **options)
+    print(f"- Temps: {time.perf_counter() - start:.3f}s")
+    print(f"- Bornes initiales: [{stats['lower']}, {stats['upper']}]")
+    if "status" in stats:
+        print(f"- Budget épuisé ({stats['status']}) : optimum dans {list(stats['gap'])}")
+    print(f"- Taille minimale: {len(cover)} (valide: {is_vertex_cover(g, cover)})")
+    print(f"- Appels au solveur: {stats['calls']}")
+    for k, elapsed in sorted(stats["time_per_k"].items()):
+        print(f"  k={k}: {elapsed:.3f}s")
+
+
+def demo_file(path, k=8, fmt=None, algo=None, kernel="crown", show_stats=False, save_kernel=None,
+              **options):
+    """
+    Cherche une couverture de taille ≤ k d'un graphe lu depuis un fichier (PACE .gr, DIMACS,
+    METIS ou liste d'arêtes, éventuellement compressé gzip, ou format binaire `.vcg`).
+    Avec `save_kernel`, le noyau (paramètre réduit et journal compris) est enregistré au
+    format binaire dans ce fichier.
+    """
+    print(f"\nInstance {path} (k={k}):")
+    start = time.perf_counter()
+    g = load_graph(path) if path.endswith(EXTENSION) else read_graph(path, fmt)
+    print(f"Graphe lu en {time.perf_counter() - start:.3f}s: {g.number_of_nodes()} sommets, "
+          f"{g.number_of_edges()} arêtes")
+
+    if save_kernel is not None:
+        trail = []
+        ker_g, ker_k, no_inst = KERNELS[kernel](g.copy(), k, None, trail, options.get("budget"))
+        if not no_inst:
+            save_graph(save_kernel, ker_g, ker_k, trail)
+            print(f"- Noyau enregistré dans {save_kernel}: {ker_g.number_of_nodes()} sommets, k={ker_k}")
+
+    stats = SolverStats() if show_stats else None
+    start = time.perf_counter()
+    cover = kernel_vertex_cover(g, k, kernel, algo or "edge", stats, auto_bitset_threshold(algo), **options)
+    print(f"- Temps: {time.perf_counter() - start:.3f}s")
+    print(f"- Résultat: {answer_text(cover if isinstance(cover, Unknown) else cover is not None)}")
+    if cover is not None and not isinstance(cover, Unknown):
+        print(f"- Taille de la couverture: {len(cover)} (valide: {is_vertex_cover(g, cover)})")
+    if show_stats:
+        print(f"- Statistiques: {stats.to_json()}")
+
+
+def run_batch_mode(source, output=None, k=None, workers=None, time_limit=None, node_limit=None,
+                   resume=True, **options):
+    """
+    Résout les instances d'un répertoire ou d'un manifeste sur un pool de processus ; les
+    résultats sont écrits au fil de l'eau (JSON Lines) dans `output`.
+    """
+    jobs = find_jobs(source, k)
+    print(f"\nLot de {len(jobs)} instances ({source}) sur {workers or 'tous les'} processus", file=sys.stderr)
+    start = time.perf_counter()
+    results = run_batch(jobs, output, workers, time_limit, node_limit, resume=resume, **options)
+    counts = {}
+    for record in results:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    print(f"{len(results)} instances résolues en {time.perf_counter() - start:.1f}s : {counts}", file=sys.stderr)
+
+
+def run_benchmarks(algo=None, bounds=(), kernel="crown", time_limit=None, node_limit=None, workers=1, seed=None,
+                   output=None):
+    """
+    Lance les benchmarks complets (chaque exécution limitée à `time_limit` s et `node_limit` nœuds,
+    au plus `workers` exécutions simultanées). Avec `output`, chaque résultat est ajouté au
+    fichier CSV dès qu'il est connu, et une série interrompue reprend là où elle s'est arrêtée.
+    """
     print("\nLancement des benchmarks...")
 
     test_configs = [
@@ -87,28 +200,92 @@ def run_benchmarks():
         {"n": 70, "k": 15}
     ]
 
-    results_df = run_comprehensive_benchmarks(test_configs)
+    results_df = run_comprehensive_benchmarks(test_configs, algo=algo or "edge", bounds=bounds, kernel=kernel,
+                                              time_limit=time_limit, node_limit=node_limit, seed=seed,
+                                              workers=workers, output=output)
     plot_detailed_results(results_df)
     print("Benchmarks terminés. Résultats sauvegardés.")
 
 
 def main():
     parser = argparse.ArgumentParser(description="k-Vertex Cover Kernelization Demo")
-    parser.add_argument('--mode', choices=['demo', 'random', 'benchmark'],
+    parser.add_argument('--mode', choices=['demo', 'random', 'optimize', 'file', 'batch', 'benchmark'],
                         default='demo', help='Mode d\'exécution')
     parser.add_argument('--n', type=int, default=30,
                         help='Nombre de sommets pour le graphe aléatoire')
     parser.add_argument('--k', type=int, default=8,
                         help='Paramètre k pour le vertex cover')
+    parser.add_argument('--algo', choices=sorted(ALGORITHMS), default=None,
+                        help='Moteur de branchement (edge : arête arbitraire, degree : sommet de degré max, '
+                             'bitset : ensembles de bits) ; par défaut, bitset pour les petits noyaux et edge sinon')
+    parser.add_argument('--bounds', nargs='*', choices=sorted(LOWER_BOUNDS), default=[],
+                        help='Bornes inférieures utilisées pour élaguer la recherche')
+    parser.add_argument('--interleave', action='store_true',
+                        help='Réappliquer les réductions peu coûteuses à chaque nœud de la recherche')
+    parser.add_argument('--crown-every', type=int, default=0,
+                        help='Avec --interleave, décomposition en couronne tous les N niveaux (0 : jamais)')
+    parser.add_argument('--split-components', action='store_true',
+                        help='Résoudre séparément les composantes connexes (à la racine et pendant la recherche)')
+    parser.add_argument('--table-size', type=int, default=0,
+                        help='Table de transposition : nombre maximal de sous-problèmes mémorisés (0 : désactivée)')
+    parser.add_argument('--kernel', choices=sorted(KERNELS), default='crown',
+                        help='Kernelization (crown : couronne, noyau ≤ 3k ; lp : Nemhauser-Trotter, noyau ≤ 2k)')
+    parser.add_argument('--search', choices=['incremental', 'binary'], default='incremental',
+                        help='Mode optimize : parcours des valeurs de k entre les bornes inférieure et supérieure')
+    parser.add_argument('--order', choices=['recursive', 'dfs', 'best'], default='recursive',
+                        help='Moteur itératif à pile explicite : profondeur d\'abord (dfs) ou meilleur d\'abord (best)')
+    parser.add_argument('--time-limit', type=float, default=None,
+                        help='Temps maximal (secondes) de l\'exécution (mode batch : de chaque instance) ; '
+                             'au-delà, la réponse est inconnue')
+    parser.add_argument('--node-limit', type=int, default=None,
+                        help='Nombre maximal de nœuds de recherche de l\'exécution')
+    parser.add_argument('--stats', action='store_true',
+                        help='Modes random et file : afficher les statistiques de réduction et de recherche (JSON)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Graine du générateur de graphes (modes random, optimize et benchmark)')
+    parser.add_argument('--input', default=None,
+                        help='Mode file : fichier du graphe (.gr, .col, .graph, liste d\'arêtes, .gz, ou binaire .vcg) ; '
+                             'mode batch : répertoire d\'instances ou manifeste ("chemin k" par ligne)')
+    parser.add_argument('--output', default=None,
+                        help='Mode batch : fichier JSON Lines des résultats (sortie standard par défaut) ; '
+                             'mode benchmark : fichier CSV complété au fil de l\'eau')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='Mode batch : relancer aussi les instances ayant déjà un résultat dans --output')
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help='Mode file : format du fichier (déduit de l\'extension par défaut)')
+    parser.add_argument('--save-kernel', default=None,
+                        help='Mode file : enregistrer le noyau au format binaire (.vcg) dans ce fichier')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Nombre de processus pour explorer l\'arbre de recherche en parallèle (modes batch et benchmark : exécutions simultanées)')
 
     args = parser.parse_args()
+    options = {"bounds": args.bounds, "interleave": args.interleave, "crown_every": args.crown_every,
+               "split_components": args.split_components, "table_size": args.table_size}
+    if args.mode == 'batch':
+        if args.input is None:
+            parser.error("--mode batch nécessite --input")
+        run_batch_mode(args.input, args.output, args.k, args.workers, args.time_limit, args.node_limit,
+                       not args.no_resume, algo=args.algo or 'edge', kernel=args.kernel, fmt=args.format,
+                       bitset_threshold=auto_bitset_threshold(args.algo), **options)
+        return
+    if args.time_limit is not None or args.node_limit is not None:
+        options["budget"] = Budget(args.time_limit, args.node_limit)  # Partagé par toute l'exécution
 
     if args.mode == 'demo':
-        demo_simple_example()
+        demo_simple_example(args.algo, args.workers, args.kernel, args.order, **options)
     elif args.mode == 'random':
-        demo_random_graph(args.n, args.k)
+        demo_random_graph(args.n, args.k, args.algo, args.workers, args.kernel, args.order, args.stats,
+                          args.seed, **options)
+    elif args.mode == 'optimize':
+        demo_optimize(args.n, args.algo, args.search, args.kernel, args.seed, **options)
+    elif args.mode == 'file':
+        if args.input is None:
+            parser.error("--mode file nécessite --input")
+        demo_file(args.input, args.k, args.format, args.algo, args.kernel, args.stats, args.save_kernel,
+                  **options)
     else:
-        run_benchmarks()
+        run_benchmarks(args.algo, args.bounds, args.kernel, args.time_limit, args.node_limit, args.workers,
+                       args.seed, args.output)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+"""
+Règles de réduction fortes pour le Vertex Cover (Xiao et Nagamochi) : domination, jumeaux
+et sommets non confinés.
+
+Chaque règle est pilotée par une liste de travail : après une réduction, seuls les sommets
+dont le voisinage (à distance ≤ 2) a changé sont réexaminés, ce qui garde un coût proche
+de linéaire sur les grands graphes. Les règles acceptent un `nx.Graph` ou un `CompactGraph`
+et complètent, si fourni, le journal de réduction lu par `reduction_rules.lift_cover`.
+"""
+import time
+from functools import partial
+from operator import itemgetter
+
+import networkx as nx
+
+from .instrumentation import record_rule
+
+
+def dominance_rule(G: nx.Graph, k: int, candidates=None, trail: list = None) -> int:
+    """
+    Règle de domination : si un voisin u de v vérifie N[u] ⊆ N[v], v domine u et il existe
+    une couverture optimale contenant v (toute couverture sans v contient N(v) ⊇ N[u] - {v}).
+    v est donc supprimé et k décrémenté.
+
+    Le test d'inclusion n'est fait que pour les voisins de degré ≤ deg(v), contre l'ensemble
+    des voisins de v (coût O(deg(u)) par voisin).
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (modifié en place).
+    k : int
+        Valeur actuelle du paramètre k.
+    candidates : list, optionnel
+        Sommets à examiner (par défaut tous) ; la liste est consommée.
+    trail : list, optionnel
+        Journal de réduction complété par les sommets pris dans la couverture.
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    if candidates is None:
+        candidates = list(G.nodes())
+
+    while candidates:
+        v = candidates.pop()
+        if v in G:
+            k, _ = _dominance_step(G, k, v, candidates, trail)
+
+    return k
+
+
+def twin_rule(G: nx.Graph, k: int, candidates=None, trail: list = None) -> int:
+    """
+    Règle des jumeaux : u et v de degré 3, non adjacents, avec N(u) = N(v) = {a, b, c}.
+    - Si N(u) contient une arête, {a, b, c} appartient à une couverture optimale (k - 3).
+    - Sinon, u, v, a, b, c sont fusionnés en un sommet adjacent à N({a, b, c}) - {u, v}
+      (k - 2) : une couverture optimale contient soit {a, b, c}, soit {u, v}. Le sommet
+      fusionné réutilise l'identifiant de u.
+
+    Les jumeaux sont détectés par une table de hachage des voisinages (ensemble figé des
+    voisins) des sommets de degré 3.
+
+    Paramètres
+    ----------
+    Mêmes paramètres que `dominance_rule` (candidats par défaut : les sommets de degré 3).
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    if candidates is None:
+        candidates = [v for v, d in G.degree() if d == 3]
+    signatures = {}  # voisinage -> dernier sommet de degré 3 rencontré avec ce voisinage
+
+    while candidates:
+        v = candidates.pop()
+        if v in G:
+            k, _ = _twin_step(G, k, v, candidates, trail, signatures)
+
+    return k
+
+
+def unconfined_rule(G: nx.Graph, k: int, candidates=None, trail: list = None) -> int:
+    """
+    Règle des sommets non confinés : si v est non confiné (voir `is_unconfined`), il existe
+    une couverture optimale contenant v ; v est supprimé et k décrémenté. Cette règle
+    généralise la domination.
+
+    Paramètres
+    ----------
+    Mêmes paramètres que `dominance_rule`.
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    if candidates is None:
+        candidates = list(G.nodes())
+
+    while candidates:
+        v = candidates.pop()
+        if v in G:
+            k, _ = _unconfined_step(G, k, v, candidates, trail)
+
+    return k
+
+
+def is_unconfined(G, v) -> bool:
+    """
+    Teste si v est non confiné. On part de S = {v} (un ensemble indépendant contenu dans
+    un complémentaire de couverture optimale, s'il en existe un contenant v) et l'on cherche
+    u ∈ N(S) tel que |N(u) ∩ S| = 1, en minimisant |N(u) - N[S]| :
+    - si aucun u n'existe, v est confiné ;
+    - si N(u) - N[S] est vide, v est non confiné ;
+    - si N(u) - N[S] = {w}, w rejoint S et l'on recommence ;
+    - sinon v est confiné.
+    """
+    s = {v}
+    ns = set(G.neighbors(v))  # N(S)
+    while True:
+        best = None
+        for u in ns:
+            inside = 0
+            outside = []
+            for x in G.neighbors(u):
+                if x in s:
+                    inside += 1
+                elif x not in ns:
+                    outside.append(x)
+            if inside != 1:
+                continue
+            if not outside:
+                return True
+            if best is None or len(outside) < len(best):
+                best = outside
+        if best is None or len(best) != 1:
+            return False
+        w = best[0]
+        s.add(w)
+        ns.update(x for x in G.neighbors(w) if x not in s)
+
+
+def strong_reductions(G: nx.Graph, k: int, trail: list = None, stats: dict = None,
+                      candidates=None) -> int:
+    """
+    Applique domination, sommets non confinés et jumeaux jusqu'à stabilisation.
+
+    Les trois règles partagent une seule liste de travail (sans doublons) : chaque sommet
+    retiré est soumis tour à tour à la domination, au test de non-confinement puis à la
+    recherche d'un jumeau, et seuls les sommets à distance ≤ 2 d'un sommet supprimé ou
+    replié y sont remis. Il n'y a donc ni passe complète par règle ni passe finale de
+    vérification : la stabilité est atteinte quand la liste est vide.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (modifié en place).
+    k : int
+        Valeur actuelle du paramètre k.
+    trail : list, optionnel
+        Journal de réduction (voir `reduction_rules.lift_cover`).
+    stats : dict, optionnel
+        `stats["reductions"][règle]` est incrémenté du nombre de sommets supprimés par
+        chaque règle ("dominance", "unconfined", "twin"), et de même `edges_removed`,
+        `applications` et `time` (voir `instrumentation.record_rule`).
+    candidates : iterable, optionnel
+        Sommets à examiner initialement (par défaut tous), par exemple ceux renvoyés par
+        `touched_since` lorsque le graphe a peu changé depuis l'appel précédent.
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    signatures = {}
+    steps = (("dominance", _dominance_step), ("unconfined", _unconfined_step),
+             ("twin", partial(_twin_step, signatures=signatures)))
+    totals = {name: [0, 0, 0.0] for name, _ in steps}  # sommets, arêtes, temps
+
+    work = list(dict.fromkeys(G.nodes() if candidates is None else candidates))
+    queued = set(work)
+    touched = []
+    while work and k >= 0:
+        v = work.pop()
+        queued.discard(v)
+        if v not in G:
+            continue
+        for name, step in steps:
+            before = G.number_of_nodes()
+            start = time.perf_counter()
+            k, edges = step(G, k, v, touched, trail)
+            total = totals[name]
+            total[2] += time.perf_counter() - start
+            if G.number_of_nodes() < before:
+                total[0] += before - G.number_of_nodes()
+                total[1] += edges
+                break
+        for x in touched:
+            if x not in queued:
+                queued.add(x)
+                work.append(x)
+        touched.clear()
+
+    if stats is not None:
+        for name, (removed, edges, elapsed) in totals.items():
+            record_rule(stats, name, removed, edges, elapsed)
+    return k
+
+
+def touched_since(G, degrees: dict) -> list:
+    """
+    Sommets à distance ≤ 2 d'un sommet dont le degré diffère de l'instantané `degrees`
+    (`dict(G.degree())` pris lors d'un appel précédent de `strong_reductions`) : ce sont
+    les seuls dont une règle forte peut avoir changé d'avis après des suppressions.
+    """
+    seen = dict.fromkeys(v for v, d in G.degree() if degrees.get(v) != d)
+    frontier = list(seen)
+    for _ in range(2):
+        frontier = [x for u in frontier for x in G.neighbors(u) if x not in seen]
+        seen.update(dict.fromkeys(frontier))
+    return list(seen)
+
+
+def _dominated_neighbor(G, v):
+    """
+    Un voisin u de v tel que N[u] ⊆ N[v], ou None.
+
+    N[v] est construit une seule fois. Un voisin de degré > deg(v) a forcément un voisin
+    hors de N[v] : il est écarté sans parcourir son voisinage. Les autres sont testés par
+    degré croissant (une feuille est dominée d'emblée), l'inclusion étant vérifiée par
+    `set.issuperset` plutôt que par un test d'appartenance par voisin.
+    """
+    closed = set(G.neighbors(v))
+    degree = len(closed)
+    closed.add(v)
+    small = [(d, u) for d, u in ((G.degree(u), u) for u in closed if u != v) if d <= degree]
+    small.sort(key=itemgetter(0))
+    for _, u in small:
+        if closed.issuperset(G.neighbors(u)):
+            return u
+    return None
+
+
+def _dominance_step(G, k: int, v, touched: list, trail: list = None):
+    """Applique la domination à v ; renvoie (k, arêtes supprimées)."""
+    if _dominated_neighbor(G, v) is None:
+        return k, 0
+    return _take(G, k, v, touched, trail)
+
+
+def _unconfined_step(G, k: int, v, touched: list, trail: list = None):
+    """Supprime v s'il est non confiné ; renvoie (k, arêtes supprimées)."""
+    if G.degree(v) == 0 or not is_unconfined(G, v):
+        return k, 0
+    return _take(G, k, v, touched, trail)
+
+
+def _twin_step(G, k: int, v, touched: list, trail: list, signatures: dict):
+    """
+    Cherche un jumeau de degré 3 de v dans `signatures` (voisinage -> dernier sommet de
+    degré 3 rencontré) et applique la règle des jumeaux ; renvoie (k, arêtes supprimées).
+    """
+    if G.degree(v) != 3:
+        return k, 0
+    key = frozenset(G.neighbors(v))
+    u = signatures.get(key)
+    if u is None or u == v or u not in G or G.degree(u) != 3 or frozenset(G.neighbors(u)) != key:
+        signatures[key] = v
+        return k, 0
+    del signatures[key]
+
+    a, b, c = key
+    around = [x for y in key for x in G.neighbors(y) if x != u and x != v]
+    degrees = G.degree(a) + G.degree(b) + G.degree(c)
+    inner = G.has_edge(a, b) + G.has_edge(b, c) + G.has_edge(a, c)
+    if inner:
+        G.remove_nodes_from((a, b, c, u, v))
+        k -= 3
+        edges = degrees - inner  # Les 6 arêtes vers u et v sont comptées dans les degrés de a, b, c
+        if trail is not None:
+            trail.extend(("cover", x) for x in key)
+    else:
+        G.remove_nodes_from((v, a, b, c))
+        added = set(around)
+        for x in added:
+            G.add_edge(u, x)
+        k -= 2
+        edges = degrees - len(added)  # Arêtes de v, a, b, c moins celles ajoutées à u
+        around.append(u)
+        if trail is not None:
+            trail.append(("fold", u, (a, b, c), (u, v)))
+    touched.extend(around)
+    return k, edges
+
+
+def _take(G, k: int, v, candidates: list, trail: list = None):
+    """
+    Prend v dans la couverture et réexamine les sommets à distance ≤ 2 de v ; renvoie
+    (k, arêtes supprimées).
+    """
+    nbrs = list(G.neighbors(v))
+    candidates.extend(nbrs)
+    candidates.extend(x for u in nbrs for x in G.neighbors(u) if x != v)
+    G.remove_node(v)
+    if trail is not None:
+        trail.append(("cover", v))
+    return k - 1, len(nbrs)
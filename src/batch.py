@@ -0,0 +1,300 @@
+"""
+Résolution par lots d'instances (fichier, k) sur plusieurs processus.
+
+Les instances viennent d'un répertoire (tous les fichiers de graphe reconnus, avec le même
+k) ou d'un manifeste (une ligne "chemin k" par instance). Elles sont lancées de la plus
+grosse à la plus petite (taille du fichier), ce qui évite qu'une grosse instance démarrée
+en dernier retarde la fin du lot. Chaque instance est résolue dans son propre processus,
+avec au plus `workers` processus simultanés :
+- le solveur reçoit un `Budget` de `time_limit` secondes et s'arrête de lui-même avec une
+  réponse inconnue quand il est épuisé ;
+- un processus qui dépasse encore son échéance de `KILL_GRACE` secondes (kernelization
+  trop longue, lecture bloquée...) est tué et l'instance est notée "killed".
+
+Chaque résultat est écrit dès qu'il est connu, sous forme d'une ligne JSON, dans le
+fichier de sortie. Relancé sur le même fichier, le lot saute les instances qui y ont déjà
+un résultat, ce qui permet de reprendre une exécution interrompue.
+
+L'ordonnanceur (`run_tasks` : un processus par tâche, échéance et arrêt forcé) sert aussi
+aux benchmarks (`benchmark/benchmark.py`).
+"""
+import json
+import multiprocessing
+import os
+import sys
+import time
+from functools import partial
+from multiprocessing.connection import wait
+
+from .budget import Budget, Unknown
+from .graph_utils import is_vertex_cover
+from .instrumentation import SolverStats
+from .kernel import kernel_vertex_cover
+from .readers import EXTENSIONS, read_graph
+from .storage import EXTENSION, load_graph
+
+
+# Délai (en secondes) accordé après l'échéance avant de tuer le processus d'une instance
+KILL_GRACE = 5.0
+
+# Extensions des fichiers retenus dans un répertoire d'instances (".gz" accepté en plus)
+GRAPH_EXTENSIONS = tuple(EXTENSIONS) + (".txt", ".edges", EXTENSION)
+
+
+def find_jobs(source: str, k: int = None) -> list:
+    """
+    Liste des instances (chemin, k) d'un répertoire ou d'un manifeste.
+
+    Paramètres
+    ----------
+    source : str
+        Répertoire d'instances, ou manifeste : une instance "chemin k" par ligne (lignes
+        vides et commentaires "#" ignorés, chemins relatifs au répertoire du manifeste).
+    k : int, optionnel
+        Paramètre des instances d'un répertoire (obligatoire dans ce cas).
+
+    Retourne
+    --------
+    list
+        Couples (chemin absolu, k), dans l'ordre du répertoire trié ou du manifeste. Les
+        chemins sont normalisés (`os.path.realpath`) : un même lot relancé depuis un autre
+        répertoire courant ou sous une autre écriture ("./instances") désigne les mêmes
+        instances.
+    """
+    if os.path.isdir(source):
+        if k is None:
+            raise ValueError("Un répertoire d'instances nécessite un paramètre k commun")
+        names = sorted(name for name in os.listdir(source)
+                       if (name[:-3] if name.endswith(".gz") else name).endswith(GRAPH_EXTENSIONS))
+        return [(os.path.realpath(os.path.join(source, name)), k) for name in names]
+
+    jobs = []
+    base = os.path.dirname(source)
+    with open(source) as f:
+        for number, line in enumerate(f, 1):
+            words = line.split("#", 1)[0].split()
+            if not words:
+                continue
+            if len(words) != 2:
+                raise ValueError(f"{source}, ligne {number} : \"chemin k\" attendu")
+            jobs.append((os.path.realpath(os.path.join(base, words[0])), int(words[1])))
+    return jobs
+
+
+def completed_jobs(output: str) -> set:
+    """
+    Instances (chemin normalisé, k) ayant déjà un résultat dans le fichier de sortie. Une
+    dernière ligne tronquée (arrêt brutal pendant l'écriture) est ignorée, puis retirée du
+    fichier avant l'écriture des nouveaux résultats.
+    """
+    done = set()
+    if not os.path.exists(output):
+        return done
+    with open(output) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            done.add((os.path.realpath(record["file"]), record["k"]))
+    return done
+
+
+def run_batch(jobs, output: str = None, workers: int = None, time_limit: float = None,
+              node_limit: int = None, algo: str = "degree", kernel: str = "crown", fmt: str = None,
+              resume: bool = True, **options) -> list:
+    """
+    Résout un lot d'instances en parallèle.
+
+    Paramètres
+    ----------
+    jobs : list
+        Couples (chemin, k) (voir `find_jobs`).
+    output : str, optionnel
+        Fichier JSON Lines des résultats, complété au fur et à mesure (sortie standard si
+        None, sans reprise possible).
+    workers : int, optionnel
+        Nombre maximal de processus simultanés (par défaut le nombre de cœurs).
+    time_limit : float, optionnel
+        Temps maximal de chaque instance (lecture du graphe comprise).
+    node_limit : int, optionnel
+        Nombre maximal de nœuds de recherche de chaque instance.
+    algo, kernel, fmt : str
+        Moteur de branchement, kernelization et format des fichiers (voir `solve_instance`).
+    resume : bool
+        Si True, les instances ayant déjà un résultat dans `output` sont sautées.
+    **options
+        Options transmises à `kernel_vertex_cover` (bounds, interleave, table_size...).
+
+    Retourne
+    --------
+    list
+        Les résultats de ce lot (dictionnaires), dans leur ordre d'arrivée.
+    """
+    done = completed_jobs(output) if output is not None and resume else set()
+    pending = [(path, k) for path, k in jobs if (os.path.realpath(path), k) not in done]
+    pending.sort(key=lambda job: _file_size(job[0]), reverse=True)  # Plus grosses instances d'abord
+    solve = partial(_solve_job, (algo, kernel, fmt, time_limit, node_limit, options))
+
+    results = []
+    out = _open_output(output) if output is not None else sys.stdout
+    try:
+        for (path, k), record in run_tasks(pending, solve, workers, time_limit):
+            record = {"file": path, "k": k, **record}
+            out.write(json.dumps(record) + "\n")  # Écrit immédiatement (une ligne JSON)
+            out.flush()
+            results.append(record)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return results
+
+
+def run_tasks(tasks, solve, workers: int = None, time_limit: float = None):
+    """
+    Exécute `solve(tâche)` pour chaque tâche, chacune dans son propre processus, avec au
+    plus `workers` processus simultanés ; les tâches sont lancées dans l'ordre de la liste.
+
+    Paramètres
+    ----------
+    tasks : list
+        Tâches (sérialisables).
+    solve : callable
+        Fonction (de niveau module, ou `functools.partial` d'une telle fonction) qui renvoie
+        un dictionnaire de résultats.
+    workers : int, optionnel
+        Nombre maximal de processus simultanés (par défaut le nombre de cœurs).
+    time_limit : float, optionnel
+        Échéance de chaque tâche : un processus qui la dépasse de `KILL_GRACE` secondes est
+        tué.
+
+    Retourne
+    --------
+    générateur
+        Couples (tâche, résultat) dans l'ordre de fin des tâches. Une tâche en échec a pour
+        résultat {"status": "error" ou "killed", "error": message}. Les processus encore
+        actifs sont tués si le générateur est fermé avant la fin.
+    """
+    workers = workers or os.cpu_count() or 1
+    pending = list(reversed(tasks))
+    ctx = multiprocessing.get_context()
+    running = {}  # Extrémité de lecture -> (processus, tâche, échéance de destruction)
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                task = pending.pop()
+                reader, writer = ctx.Pipe(duplex=False)
+                process = ctx.Process(target=_child, args=(writer, solve, task), daemon=True)
+                process.start()
+                writer.close()
+                deadline = None if time_limit is None else time.monotonic() + time_limit + KILL_GRACE
+                running[reader] = (process, task, deadline)
+
+            deadlines = [d for _, _, d in running.values() if d is not None]
+            timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            for reader in wait(list(running), timeout):
+                process, task, _ = running.pop(reader)
+                try:
+                    record = reader.recv()
+                except EOFError:  # Processus mort sans résultat
+                    process.join()
+                    record = {"status": "error", "error": f"code de sortie {process.exitcode}"}
+                reader.close()
+                process.join()
+                yield task, record
+
+            now = time.monotonic()
+            for reader, (process, task, deadline) in list(running.items()):
+                if deadline is not None and now > deadline:
+                    process.kill()
+                    process.join()
+                    reader.close()
+                    del running[reader]
+                    yield task, {"status": "killed", "error": f"échéance dépassée de {KILL_GRACE} s"}
+    finally:
+        for reader, (process, _, _) in running.items():  # Interruption : arrêt des processus
+            process.kill()
+            process.join()
+            reader.close()
+
+
+def solve_instance(path: str, k: int, algo: str = "degree", kernel: str = "crown", fmt: str = None,
+                   budget=None, **options) -> dict:
+    """
+    Lit une instance et cherche une couverture de taille ≤ k.
+
+    Retourne
+    --------
+    dict
+        Résultat sérialisable en JSON : `file`, `k`, `status` ("yes", "no", ou cause de
+        l'épuisement du budget), `n`, `m`, `cover_size` et `valid` (si une couverture a été
+        trouvée), `read_time`, `time` et les statistiques à plat (`stats`).
+    """
+    start = time.perf_counter()
+    g = load_graph(path) if path.endswith(EXTENSION) else read_graph(path, fmt)
+    record = {"file": path, "k": k, "n": g.number_of_nodes(), "m": g.number_of_edges(),
+              "read_time": time.perf_counter() - start}
+
+    stats = SolverStats()
+    start = time.perf_counter()
+    cover = kernel_vertex_cover(g, k, kernel, algo, stats, budget=budget, **options)
+    record["time"] = time.perf_counter() - start
+    if isinstance(cover, Unknown):
+        record["status"] = cover.reason
+    elif cover is None:
+        record["status"] = "no"
+    else:
+        record.update(status="yes", cover_size=len(cover), valid=is_vertex_cover(g, cover))
+    record["stats"] = stats.flatten()
+    return record
+
+
+def _solve_job(settings, job) -> dict:
+    """Résout une instance (chemin, k) avec un budget propre (voir `run_batch`)."""
+    path, k = job
+    algo, kernel, fmt, time_limit, node_limit, options = settings
+    budget = Budget(time_limit, node_limit) if time_limit is not None or node_limit is not None else None
+    return solve_instance(path, k, algo, kernel, fmt, budget, **options)
+
+
+def _child(writer, solve, task):
+    """Processus d'une tâche : envoie le résultat de `solve(task)` au processus parent."""
+    try:
+        record = solve(task)
+    except Exception as error:  # Fichier illisible, format invalide...
+        record = {"status": "error", "error": f"{type(error).__name__}: {error}"}
+    writer.send(record)
+    writer.close()
+
+
+def _open_output(output: str):
+    """Ouvre le fichier de sortie en ajout, après avoir retiré une dernière ligne tronquée."""
+    drop_partial_line(output)
+    return open(output, "a")
+
+
+def drop_partial_line(path: str):
+    """
+    Retire la dernière ligne d'un fichier de résultats si elle n'est pas terminée (arrêt
+    brutal pendant l'écriture), pour que les lignes ajoutées ensuite restent intactes.
+    """
+    if os.path.exists(path):
+        with open(path, "rb+") as f:
+            size = end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                cut = f.read(end - start).rfind(b"\n")
+                if cut >= 0:
+                    end = start + cut + 1
+                    break
+                end = start
+            if end < size:
+                f.truncate(end)
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
@@ -0,0 +1,176 @@
+"""
+Solveur exact par ensembles de bits, destiné aux petits noyaux (quelques centaines de sommets).
+
+Les sommets sont numérotés de 0 à n-1 et chaque voisinage est un entier Python dont le bit i
+vaut 1 si le sommet i est voisin. L'ensemble des sommets présents est lui aussi un masque :
+supprimer un sommet, calculer un degré (popcount de N(v) & présents) ou tester une arête
+sont des opérations bit à bit, et le retour arrière est gratuit (le masque du nœud parent
+est simplement conservé).
+"""
+import networkx as nx
+
+from .budget import BudgetExceeded, Unknown, unknown
+from .instrumentation import record_max
+
+try:
+    _popcount = int.bit_count  # Python ≥ 3.10
+except AttributeError:  # pragma: no cover
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+# Taille de noyau (en sommets) en dessous de laquelle la chaîne kernel + VCB utilise ce solveur
+BITSET_THRESHOLD = 512
+
+
+def vcb_bitset(G: nx.Graph, k: int, stats: dict = None, bounds=(), budget=None, **options):
+    """
+    Détermine si G possède une couverture de sommets de taille ≤ k (solveur par bits).
+
+    Même interface que `vcb.vcb_recursive` ; les options du moteur générique (bornes,
+    réductions entrelacées, composantes) sont ignorées : le solveur applique lui-même à
+    chaque nœud les règles des sommets isolés, pendants et de haut degré, la borne
+    |E| ≤ k · Δ et la résolution exacte des graphes de degré ≤ 2. Renvoie `Unknown` si le
+    budget est épuisé.
+    """
+    cover = bitset_vertex_cover(G, k, stats, budget)
+    return cover if isinstance(cover, Unknown) else cover is not None
+
+
+def bitset_vertex_cover(G: nx.Graph, k: int, stats: dict = None, budget=None):
+    """
+    Recherche une couverture de sommets de taille ≤ k par branchement sur un sommet de
+    degré maximum (v ou N(v)), sur la représentation par bits de G.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Le graphe d'entrée (non modifié).
+    k : int
+        Taille maximale autorisée du vertex cover.
+    stats : dict, optionnel
+        Si fourni, `stats["nodes"]` est incrémenté à chaque nœud de l'arbre de recherche et
+        `stats["max_depth"]` reçoit la profondeur maximale atteinte.
+    budget : Budget, optionnel
+        Limites de temps et de nœuds (voir `budget.py`), débitées à chaque nœud.
+
+    Retourne
+    --------
+    set, None ou Unknown
+        Une couverture de taille ≤ k (sommets de G), None s'il n'en existe pas, ou `Unknown`
+        si le budget est épuisé.
+    """
+    nodes = list(G.nodes())
+    index = {v: i for i, v in enumerate(nodes)}
+    adj = [0] * len(nodes)
+    for u, v in G.edges():
+        i, j = index[u], index[v]
+        adj[i] |= 1 << j
+        adj[j] |= 1 << i
+
+    try:
+        cover = _BitsetSearch(adj, stats, budget).solve((1 << len(nodes)) - 1, k)
+    except BudgetExceeded as exc:
+        return unknown(exc.reason, stats)
+    return None if cover is None else {nodes[i] for i in cover}
+
+
+class _BitsetSearch:
+    """Voisinages (masques), statistiques et budget partagés par les nœuds de la recherche."""
+
+    def __init__(self, adj: list, stats: dict = None, budget=None):
+        self.adj = adj
+        self.stats = stats
+        self.budget = budget
+
+    def solve(self, alive: int, k: int, depth: int = 0):
+        """Couverture (liste d'indices) de taille ≤ k du sous-graphe induit par `alive`, ou None."""
+        if self.stats is not None:
+            self.stats["nodes"] = self.stats.get("nodes", 0) + 1
+            record_max(self.stats, "max_depth", depth)
+        if self.budget is not None:
+            self.budget.charge()
+        if k < 0:  # Budget négatif : même le graphe vide n'a pas de couverture de taille ≤ k
+            return None
+        adj = self.adj
+        taken = []
+
+        # Réductions jusqu'à stabilisation, puis choix d'un sommet de degré maximum
+        reduced = True
+        while reduced:
+            reduced = False
+            best, best_d, degree_sum = -1, 0, 0
+            rest = alive
+            while rest:
+                low = rest & -rest
+                rest ^= low
+                if not alive & low:  # Supprimé pendant cette passe
+                    continue
+                v = low.bit_length() - 1
+                nbrs = adj[v] & alive
+                d = _popcount(nbrs)
+                if d == 0:  # Sommet isolé
+                    alive ^= low
+                elif d == 1 or d > k:  # Voisin d'un sommet pendant, ou sommet de haut degré
+                    u = nbrs.bit_length() - 1 if d == 1 else v
+                    alive &= ~(1 << u)
+                    taken.append(u)
+                    k -= 1
+                    if k < 0:
+                        return None
+                    reduced = True
+                else:
+                    degree_sum += d
+                    if d > best_d:
+                        best, best_d = v, d
+
+        if best < 0:
+            return taken  # Plus d'arêtes
+
+        # Chaque sommet couvre au plus Δ arêtes
+        if degree_sum // 2 > k * best_d:
+            return None
+
+        if best_d <= 2:
+            cover = self.degree_two_cover(alive)
+            return taken + cover if len(cover) <= k else None
+
+        # Première branche : v dans la couverture
+        cover = self.solve(alive & ~(1 << best), k - 1, depth + 1)
+        if cover is not None:
+            return taken + [best] + cover
+
+        # Seconde branche : N(v) dans la couverture
+        nbrs = adj[best] & alive
+        if best_d > k:
+            return None
+        cover = self.solve(alive & ~nbrs, k - best_d, depth + 1)
+        if cover is not None:
+            return taken + _members(nbrs) + cover
+        return None
+
+    def degree_two_cover(self, alive: int) -> list:
+        """Couverture minimale d'un sous-graphe de degré ≤ 2 (chemins et cycles)."""
+        cover = []
+        seen = 0
+        for pass_degree in (1, 2):  # Chemins depuis une extrémité, puis cycles
+            for v in _members(alive):
+                if seen >> v & 1 or _popcount(self.adj[v] & alive) != pass_degree:
+                    continue
+                order = []
+                while v >= 0:
+                    seen |= 1 << v
+                    order.append(v)
+                    v = (self.adj[v] & alive & ~seen).bit_length() - 1
+                cover.extend(order[1::2] if pass_degree == 1 else order[0::2])
+        return cover
+
+
+def _members(mask: int) -> list:
+    """Indices des bits à 1 d'un masque."""
+    members = []
+    while mask:
+        low = mask & -mask
+        members.append(low.bit_length() - 1)
+        mask ^= low
+    return members
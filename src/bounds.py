@@ -0,0 +1,215 @@
+"""
+Bornes inférieures sur la taille d'une couverture de sommets, utilisées pour élaguer
+l'arbre de recherche (branch-and-bound) : un sous-arbre est coupé dès qu'une borne
+dépasse le budget k restant.
+"""
+import time
+import weakref
+from collections import deque
+
+from .crown_decomp import maximal_matching
+
+
+def matching_bound(G) -> int:
+    """
+    Taille d'un couplage maximal glouton : chaque arête du couplage demande un sommet
+    distinct dans toute couverture. Coût O(n + m).
+    """
+    return len(maximal_matching(G))
+
+
+def maximum_matching_bound(G) -> int:
+    """
+    Taille d'un couplage maximum. Borne au moins aussi forte que `matching_bound`.
+
+    Le couplage du dernier appel sur le même graphe est conservé : entre deux nœuds de la
+    recherche, le graphe ne fait que perdre des sommets (ou les retrouver au retour
+    arrière). Une suppression fait baisser le couplage maximum d'au plus un, un ajout le
+    fait croître d'au plus un, et dans les deux cas seul le sommet libéré (partenaire du
+    sommet supprimé) ou ajouté peut être l'extrémité d'un chemin augmentant. Ces sommets
+    sont donc traités un par un, les autres restant provisoirement appariés à un sommet
+    fictif qui les neutralise, et chacun lance une seule recherche de chemin augmentant
+    (`_augment`, algorithme d'Edmonds) au lieu d'un recalcul complet à chaque nœud. Le
+    premier appel part d'un couplage glouton. Le cache suppose que le graphe ne gagne pas
+    d'arêtes entre sommets déjà présents d'un appel à l'autre.
+    """
+    nodes = set(G.nodes())
+    previous, known = _MATCHINGS.get(G, (None, None))
+    if previous is None:
+        # Edmonds classique : une recherche par sommet libre ; l'arbre d'une recherche
+        # infructueuse ne peut plus porter de chemin augmentant et est écarté.
+        mate = {}
+        for u, w in maximal_matching(G):
+            mate[u] = w
+            mate[w] = u
+        dead = set()
+        for v in nodes:
+            if v not in mate and v not in dead:
+                _augment(G, mate, v, dead)
+    else:
+        mate = {u: w for u, w in previous.items() if u in G and w in G}
+        roots = [v for v in nodes if v not in mate and (v not in known or v in previous)]
+        for v in roots:
+            mate[v] = _PHANTOM
+        for v in roots:
+            del mate[v]
+            _augment(G, mate, v)
+    _MATCHINGS[G] = (mate, nodes)
+    return len(mate) // 2
+
+
+_MATCHINGS = weakref.WeakKeyDictionary()  # graphe -> (couplage maximum, sommets) du dernier appel
+_PHANTOM = object()  # Partenaire fictif d'un sommet pas encore traité
+
+
+def _augment(G, mate: dict, root, dead: set = None) -> bool:
+    """
+    Cherche un chemin augmentant depuis le sommet libre `root` (parcours en largeur
+    d'Edmonds, les fleurs étant contractées via un tableau de bases) et l'applique à `mate`.
+    Coût O(n + m) hors contractions ; ne lit que les sommets atteints. En cas d'échec, les
+    sommets de l'arbre sont ajoutés à `dead` (s'il est fourni) et ignorés ensuite.
+    """
+    parent = {}  # sommet impair -> prédécesseur pair dans l'arbre alterné
+    base = {}  # sommet -> base de sa fleur (lui-même par défaut)
+    members = {}  # base -> sommets de sa fleur contractée
+    even = {root}
+    queue = deque([root])
+
+    def lca(a, b):
+        seen = set()
+        while True:
+            a = base.get(a, a)
+            seen.add(a)
+            if a not in mate:
+                break
+            a = parent[mate[a]]
+        while True:
+            b = base.get(b, b)
+            if b in seen:
+                return b
+            b = parent[mate[b]]
+
+    def mark_path(v, b, child, blossom):
+        while base.get(v, v) != b:
+            blossom.add(base.get(v, v))
+            blossom.add(base.get(mate[v], mate[v]))
+            parent[v] = child
+            child = mate[v]
+            v = parent[child]
+
+    while queue:
+        v = queue.popleft()
+        for to in G.neighbors(v):
+            if base.get(v, v) == base.get(to, to) or mate.get(v) == to or (dead and to in dead):
+                continue
+            if to == root or (to in mate and mate[to] in parent):
+                # Cycle impair : contraction de la fleur sur sa base
+                b = lca(v, to)
+                blossom = set()
+                mark_path(v, b, to, blossom)
+                mark_path(to, b, v, blossom)
+                for c in blossom - {b}:
+                    for x in members.pop(c, (c,)):
+                        base[x] = b
+                        members.setdefault(b, [b]).append(x)
+                        if x not in even:
+                            even.add(x)
+                            queue.append(x)
+            elif to not in parent and mate.get(to) is not _PHANTOM:
+                parent[to] = v
+                if to not in mate:
+                    # Chemin augmentant trouvé : inversion le long de l'arbre
+                    while to is not None:
+                        v = parent[to]
+                        nxt = mate.get(v)
+                        mate[to] = v
+                        mate[v] = to
+                        to = nxt
+                    return True
+                even.add(mate[to])
+                queue.append(mate[to])
+    if dead is not None:
+        dead.update(even)
+        dead.update(parent)
+    return False
+
+
+def clique_cover_bound(G) -> int:
+    """
+    Borne par couverture en cliques : une couverture contient au moins |Q| - 1 sommets de
+    chaque clique Q. Les sommets non isolés sont répartis gloutonnement en cliques (par
+    degré croissant, chaque sommet rejoignant la plus grande clique entièrement contenue
+    dans son voisinage) et la borne vaut Σ (|Q| - 1). Coût O(n + m) hors tri.
+    """
+    clique_of = {}  # sommet -> indice de sa clique
+    cliques = []  # indice -> taille de la clique
+
+    for v, _ in sorted(((v, d) for v, d in G.degree() if d > 0), key=lambda x: x[1]):
+        # Nombre de voisins de v dans chaque clique déjà formée
+        counts = {}
+        for u in G.neighbors(v):
+            q = clique_of.get(u)
+            if q is not None:
+                counts[q] = counts.get(q, 0) + 1
+
+        # Cliques entièrement adjacentes à v : v peut les rejoindre
+        best = max((q for q, c in counts.items() if c == cliques[q]), key=lambda q: cliques[q], default=None)
+        if best is None:
+            clique_of[v] = len(cliques)
+            cliques.append(1)
+        else:
+            clique_of[v] = best
+            cliques[best] += 1
+
+    return sum(size - 1 for size in cliques)
+
+
+LOWER_BOUNDS = {
+    "matching": matching_bound,
+    "max_matching": maximum_matching_bound,
+    "clique_cover": clique_cover_bound,
+}
+
+
+def resolve_bounds(bounds) -> list:
+    """
+    Normalise une liste de bornes en couples (nom, fonction).
+    Chaque élément est soit un nom de `LOWER_BOUNDS`, soit une fonction G -> int.
+    """
+    resolved = []
+    for bound in bounds or ():
+        if callable(bound):
+            resolved.append((getattr(bound, "__name__", repr(bound)), bound))
+        else:
+            resolved.append((bound, LOWER_BOUNDS[bound]))
+    return resolved
+
+
+def prune_by_bounds(G, k: int, bounds: list, stats: dict = None) -> bool:
+    """
+    Évalue les bornes (dans l'ordre) et renvoie True dès que l'une d'elles dépasse k.
+
+    Si `stats` est fourni, on y comptabilise pour chaque borne le nombre de nœuds élagués
+    (`stats["pruned"]`), le nombre d'évaluations (`stats["bound_calls"]`) et le temps passé
+    (`stats["bound_time"]`, en secondes).
+    """
+    for name, bound in bounds:
+        if stats is None:
+            if bound(G) > k:
+                return True
+            continue
+
+        start = time.perf_counter()
+        value = bound(G)
+        elapsed = time.perf_counter() - start
+
+        calls = stats.setdefault("bound_calls", {})
+        calls[name] = calls.get(name, 0) + 1
+        times = stats.setdefault("bound_time", {})
+        times[name] = times.get(name, 0.0) + elapsed
+        if value > k:
+            pruned = stats.setdefault("pruned", {})
+            pruned[name] = pruned.get(name, 0) + 1
+            return True
+
+    return False
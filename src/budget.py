@@ -0,0 +1,105 @@
+"""
+Budgets de calcul (temps et nombre de nœuds) et arrêt coopératif des solveurs.
+
+Un `Budget` est passé aux points d'entrée (kernelization, branchement, solveur par bits,
+moteur itératif, couverture minimale). Les moteurs le débitent à chaque nœud de l'arbre de
+recherche : le coût sur le chemin critique est un incrément et une comparaison, l'horloge
+n'étant lue que tous les `CHECK_INTERVAL` nœuds. Quand le budget est épuisé, la recherche
+est abandonnée et le point d'entrée renvoie un résultat `Unknown` au lieu de True/False ;
+les statistiques déjà accumulées (nœuds, élagages, réductions) restent disponibles et
+`stats["status"]` indique la cause de l'arrêt.
+"""
+import time
+
+
+# Nombre de nœuds entre deux lectures de l'horloge
+CHECK_INTERVAL = 256
+
+
+class BudgetExceeded(Exception):
+    """Levée par `Budget.charge` pour interrompre une recherche (cause dans `reason`)."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class Unknown:
+    """
+    Réponse inconnue : le budget a été épuisé avant la fin de la recherche.
+
+    `reason` vaut "timeout" (limite de temps) ou "node_limit" (limite de nœuds). La
+    conversion en booléen est interdite, pour qu'un résultat inconnu ne soit jamais
+    confondu avec une réponse NON : tester `isinstance(result, Unknown)`.
+    """
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+    def __bool__(self):
+        raise TypeError(f"Réponse inconnue ({self.reason}) : tester isinstance(result, Unknown)")
+
+    def __eq__(self, other):
+        return isinstance(other, Unknown) and other.reason == self.reason
+
+    def __hash__(self):
+        return hash(("Unknown", self.reason))
+
+    def __repr__(self):
+        return f"Unknown({self.reason!r})"
+
+
+class Budget:
+    """
+    Limite de temps (en secondes, à partir de la création) et/ou de nœuds de recherche.
+
+    Paramètres
+    ----------
+    time_limit : float, optionnel
+        Temps maximal (horloge murale, `time.perf_counter`).
+    node_limit : int, optionnel
+        Nombre maximal de nœuds de recherche, tous moteurs confondus.
+
+    Attributs
+    ---------
+    nodes : int
+        Nœuds débités jusqu'ici.
+    exceeded : str ou None
+        Cause de l'épuisement ("timeout" ou "node_limit"), None tant que le budget tient.
+    """
+
+    def __init__(self, time_limit: float = None, node_limit: int = None):
+        self.deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.node_limit = node_limit
+        self.nodes = 0
+        self.exceeded = None
+        self._countdown = 1  # Première lecture de l'horloge dès le premier nœud
+
+    def charge(self):
+        """Débite un nœud ; lève `BudgetExceeded` si le budget est épuisé."""
+        self.nodes += 1
+        if self.node_limit is not None and self.nodes > self.node_limit:
+            self.exceeded = "node_limit"
+            raise BudgetExceeded(self.exceeded)
+        self._countdown -= 1
+        if self._countdown == 0:
+            self._countdown = CHECK_INTERVAL
+            if self.expired():
+                raise BudgetExceeded(self.exceeded)
+
+    def expired(self) -> bool:
+        """Lit l'horloge (sans débiter de nœud) et indique si le budget est épuisé."""
+        if self.exceeded is None and self.deadline is not None and time.perf_counter() > self.deadline:
+            self.exceeded = "timeout"
+        return self.exceeded is not None
+
+    def remaining(self):
+        """Temps restant en secondes (None sans limite de temps)."""
+        return None if self.deadline is None else max(0.0, self.deadline - time.perf_counter())
+
+
+def unknown(reason: str, stats: dict = None) -> Unknown:
+    """Construit le résultat inconnu et reporte la cause dans `stats["status"]`."""
+    if stats is not None:
+        stats["status"] = reason
+    return Unknown(reason)
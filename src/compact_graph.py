@@ -0,0 +1,412 @@
+import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+class CompactGraph:
+    """
+    Graphe non orienté compact, stocké au format CSR (Compressed Sparse Row).
+
+    - `offsets[v]:offsets[v + 1]` délimite, dans `neighbors`, la liste triée des voisins de v.
+    - Un masque `alive` indique les sommets encore présents : supprimer un sommet ne touche
+      jamais aux tableaux CSR, seuls le masque et le tableau des degrés sont mis à jour.
+    - Les arêtes ajoutées après la construction (repliement de sommets, voir
+      `reduction_rules.degree_two_rule`) sont stockées dans une table annexe `_extra`.
+    - Chaque suppression de sommet et chaque ajout d'arête est enregistré dans un journal
+      (`mark` / `undo`), ce qui permet de restaurer le graphe lors d'un retour arrière.
+    - Les tableaux CSR peuvent être projetés en mémoire depuis un fichier binaire (voir
+      `storage.py`) ; le graphe se sérialise alors par le chemin du fichier.
+    - Sur demande (`enable_fingerprint`), une empreinte de Zobrist de l'état courant est
+      tenue à jour à chaque suppression, ajout et annulation (voir `transposition.py`).
+
+    Les sommets sont les entiers 0..n-1. Les étiquettes d'origine (celles du `nx.Graph`
+    converti) sont conservées dans `labels` et ne sont utilisées qu'aux bords de l'API.
+
+    La classe expose le sous-ensemble de l'interface de `nx.Graph` utilisé par les modules
+    de `src/` (nodes, edges, degree, neighbors, remove_node, copy, ...), ce qui permet de
+    l'utiliser directement à la place d'un `nx.Graph`.
+    """
+
+    def __init__(self, offsets, neighbors, labels=None):
+        self._offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+        self._neighbors = np.ascontiguousarray(neighbors, dtype=_index_dtype(len(self._offsets) - 1))
+        # Les tableaux CSR sont partagés entre les copies : on les protège en écriture.
+        self._offsets.flags.writeable = False
+        self._neighbors.flags.writeable = False
+
+        n = len(self._offsets) - 1
+        self._alive = np.ones(n, dtype=bool)
+        self._deg = np.diff(self._offsets)
+        self._n_alive = n
+        self._m = len(self._neighbors) // 2
+        self._extra = {}  # Arêtes ajoutées : sommet -> liste de voisins supplémentaires
+        self._trail = []  # Journal : sommet supprimé, ou couple (u, v) pour une arête ajoutée
+        self._keys = None  # Clés de Zobrist des sommets (empreinte désactivée par défaut)
+        self.fingerprint = 0
+        self.labels = labels
+        self._source = None  # (chemin, identité) du fichier dont les tableaux CSR sont projetés (voir `storage.py`)
+
+    # ------------------------------------------------------------------
+    # Construction et conversions
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, n: int, edges, labels=None):
+        """
+        Construit un graphe compact à partir d'un tableau d'arêtes de forme (m, 2).
+
+        Les boucles sont ignorées et les arêtes multiples fusionnées.
+
+        Paramètres
+        ----------
+        n : int
+            Nombre de sommets (numérotés de 0 à n-1).
+        edges : array-like
+            Arêtes (u, v) du graphe.
+        labels : list, optionnel
+            Étiquettes d'origine des sommets.
+
+        Retourne
+        --------
+        CompactGraph
+            Le graphe compact correspondant.
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        u, v = edges[:, 0], edges[:, 1]
+        keep = u != v  # Suppression des boucles
+        u, v = np.minimum(u[keep], v[keep]), np.maximum(u[keep], v[keep])
+
+        # Suppression des arêtes multiples via une clé unique par arête
+        keys = np.unique(u * n + v)
+        u, v = keys // n, keys % n
+
+        # Chaque arête apparaît dans la liste d'adjacence de ses deux extrémités
+        src = np.concatenate((u, v))
+        dst = np.concatenate((v, u))
+        order = np.lexsort((dst, src))
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        return cls(offsets, dst[order], labels)
+
+    @classmethod
+    def from_networkx(cls, G: nx.Graph):
+        """
+        Convertit un `nx.Graph` en graphe compact.
+
+        Les sommets sont renumérotés de 0 à n-1 dans l'ordre de `G.nodes()` ; les étiquettes
+        d'origine sont conservées sauf si elles coïncident déjà avec cette numérotation.
+        """
+        nodes = list(G.nodes())
+        index = {v: i for i, v in enumerate(nodes)}
+        edges = np.fromiter((index[x] for e in G.edges() for x in e), dtype=np.int64,
+                            count=2 * G.number_of_edges())
+        labels = None if nodes == list(range(len(nodes))) else nodes
+        return cls.from_edges(len(nodes), edges, labels)
+
+    def to_networkx(self) -> nx.Graph:
+        """
+        Convertit les sommets et arêtes encore présents en `nx.Graph` (étiquettes d'origine).
+        """
+        g = nx.Graph()
+        g.add_nodes_from(self.to_labels(self.nodes()))
+        src, dst = self.edge_array().T.tolist()
+        g.add_edges_from(zip(self.to_labels(src), self.to_labels(dst)))
+        return g
+
+    def to_labels(self, vertices) -> list:
+        """Traduit des indices de sommets en étiquettes d'origine."""
+        if self.labels is None:
+            return list(vertices)
+        return [self.labels[v] for v in vertices]
+
+    def copy(self):
+        """
+        Copie le graphe. Les tableaux CSR (en lecture seule) sont partagés ; seuls le masque
+        de présence et les degrés sont dupliqués. Le journal de la copie est vide.
+        """
+        g = CompactGraph.__new__(CompactGraph)
+        g._offsets = self._offsets
+        g._neighbors = self._neighbors
+        g._alive = self._alive.copy()
+        g._deg = self._deg.copy()
+        g._n_alive = self._n_alive
+        g._m = self._m
+        g._extra = {v: list(extra) for v, extra in self._extra.items()}
+        g._trail = []
+        g._keys = self._keys
+        g.fingerprint = self.fingerprint
+        g.labels = self.labels
+        g._source = self._source
+        return g
+
+    def enable_fingerprint(self, keys=None, seed: int = 0):
+        """
+        Active l'empreinte de Zobrist : chaque sommet reçoit une clé aléatoire de 64 bits et
+        `fingerprint` vaut le XOR des clés des sommets présents (et des arêtes ajoutées
+        depuis l'activation). Deux états ayant le même ensemble de sommets présents ont la
+        même empreinte, quel que soit l'ordre des suppressions.
+
+        Paramètres
+        ----------
+        keys : np.ndarray, optionnel
+            Clés des sommets (uint64) ; par défaut tirées avec la graine `seed`.
+        seed : int
+            Graine du tirage des clés.
+        """
+        if keys is None:
+            keys = np.random.default_rng(seed).integers(0, 2 ** 64, self.capacity, dtype=np.uint64,
+                                                        endpoint=False)
+        self._keys = keys
+        self.fingerprint = int(np.bitwise_xor.reduce(keys[self._alive])) if self._n_alive else 0
+
+    @property
+    def capacity(self) -> int:
+        """Nombre total de sommets, y compris ceux qui ont été supprimés."""
+        return len(self._alive)
+
+    @property
+    def nbytes(self) -> int:
+        """Mémoire occupée par les tableaux NumPy du graphe (en octets)."""
+        return self._offsets.nbytes + self._neighbors.nbytes + self._alive.nbytes + self._deg.nbytes
+
+    # ------------------------------------------------------------------
+    # Interface compatible avec nx.Graph
+    # ------------------------------------------------------------------
+
+    def nodes(self) -> list:
+        """Liste des sommets encore présents."""
+        return np.flatnonzero(self._alive).tolist()
+
+    def number_of_nodes(self) -> int:
+        return self._n_alive
+
+    def number_of_edges(self) -> int:
+        return self._m
+
+    def degree(self, v=None):
+        """
+        Degré courant de v, ou liste des couples (sommet, degré) si v n'est pas précisé
+        (comme `nx.Graph.degree`).
+        """
+        if v is not None:
+            return int(self._deg[v])
+        alive = np.flatnonzero(self._alive)
+        return list(zip(alive.tolist(), self._deg[alive].tolist()))
+
+    def degree_array(self) -> np.ndarray:
+        """Tableau des degrés courants (0 pour les sommets supprimés), en lecture seule."""
+        view = self._deg.view()
+        view.flags.writeable = False
+        return view
+
+    def neighbors(self, v):
+        """Itérateur sur les voisins encore présents de v."""
+        return iter(self._live_neighbors(v).tolist())
+
+    def edges(self):
+        """Itérateur sur les arêtes (u, v), u < v, dont les deux extrémités sont présentes."""
+        src, dst = self.edge_array().T.tolist()
+        return zip(src, dst)
+
+    def edge_array(self) -> np.ndarray:
+        """Tableau (m, 2) des arêtes encore présentes, chaque arête apparaissant une fois."""
+        src = np.repeat(np.arange(self.capacity, dtype=self._neighbors.dtype), np.diff(self._offsets))
+        dst = self._neighbors
+        if self._extra:
+            src = np.concatenate((src, np.fromiter((u for u, extra in self._extra.items() for _ in extra),
+                                                   dtype=src.dtype)))
+            dst = np.concatenate((dst, np.fromiter((v for extra in self._extra.values() for v in extra),
+                                                   dtype=dst.dtype)))
+        keep = (src < dst) & self._alive[src] & self._alive[dst]
+        return np.column_stack((src[keep], dst[keep]))
+
+    def has_edge(self, u, v) -> bool:
+        if not (u in self and v in self):
+            return False
+        nbrs = self._neighbors[self._offsets[u]:self._offsets[u + 1]]
+        i = np.searchsorted(nbrs, v)
+        return bool(i < len(nbrs) and nbrs[i] == v) or v in self._extra.get(u, ())
+
+    def add_edge(self, u, v):
+        """
+        Ajoute l'arête (u, v) entre deux sommets présents, en l'enregistrant dans le journal.
+        Sans effet si l'arête existe déjà.
+        """
+        if u not in self or v not in self or u == v:
+            raise nx.NetworkXError(f"Cannot add edge ({u}, {v}) to a compact graph.")
+        if self.has_edge(u, v):
+            return
+        self._extra.setdefault(u, []).append(v)
+        self._extra.setdefault(v, []).append(u)
+        self._deg[u] += 1
+        self._deg[v] += 1
+        self._m += 1
+        self._trail.append((u, v))
+        if self._keys is not None:
+            self.fingerprint ^= self._edge_key(u, v)
+
+    def remove_node(self, v):
+        """Supprime le sommet v (et ses arêtes incidentes), en l'enregistrant dans le journal."""
+        if v not in self:
+            raise nx.NetworkXError(f"The node {v} is not in the graph.")
+        live = self._live_neighbors(v)
+        self._deg[live] -= 1
+        self._m -= len(live)
+        self._deg[v] = 0
+        self._alive[v] = False
+        self._n_alive -= 1
+        self._trail.append(v)
+        if self._keys is not None:
+            self.fingerprint ^= int(self._keys[v])
+
+    def remove_nodes_from(self, vertices):
+        """Supprime les sommets donnés ; les sommets absents sont ignorés (comme networkx)."""
+        for v in vertices:
+            if v in self:
+                self.remove_node(v)
+
+    def max_degree_vertex(self):
+        """
+        Couple (v, deg(v)) pour un sommet v de degré maximum (le plus petit indice en cas
+        d'égalité), ou None si le graphe n'a plus d'arêtes.
+        """
+        if self._m == 0:
+            return None
+        v = int(np.argmax(self._deg))
+        return v, int(self._deg[v])
+
+    def any_edge(self):
+        """Une arête (u, v) encore présente, ou None si le graphe n'a plus d'arêtes."""
+        if self._m == 0:
+            return None
+        u = int(np.argmax(self._deg > 0))
+        return u, int(self._live_neighbors(u)[0])
+
+    def isolates(self) -> list:
+        """Liste des sommets présents de degré nul."""
+        return np.flatnonzero(self._alive & (self._deg == 0)).tolist()
+
+    def component_subgraphs(self) -> list:
+        """
+        Décompose le graphe courant en composantes connexes (sommets isolés exclus).
+
+        Chaque composante est renvoyée sous forme d'un nouveau `CompactGraph` renuméroté,
+        dont les étiquettes sont celles du graphe courant (ou ses indices s'il n'en a pas).
+        Coût O(n + m log m), une seule passe sur les arêtes pour toutes les composantes.
+        """
+        edges = self.edge_array()
+        if len(edges) == 0:
+            return []
+        n = self.capacity
+        adj = coo_matrix((np.ones(len(edges), dtype=np.int8), (edges[:, 0], edges[:, 1])), shape=(n, n))
+        _, comp = connected_components(adj, directed=False)
+
+        # Regroupement des sommets non isolés et des arêtes par composante
+        vertices = np.flatnonzero(self._deg > 0)
+        vertices = vertices[np.argsort(comp[vertices], kind="stable")]
+        edges = edges[np.argsort(comp[edges[:, 0]], kind="stable")]
+        v_bounds = np.searchsorted(comp[vertices], np.unique(comp[vertices]))
+        e_bounds = np.searchsorted(comp[edges[:, 0]], np.unique(comp[vertices]))
+
+        index = np.empty(n, dtype=np.int64)
+        subgraphs = []
+        for i in range(len(v_bounds)):
+            part = vertices[v_bounds[i]:v_bounds[i + 1] if i + 1 < len(v_bounds) else len(vertices)]
+            sub_edges = edges[e_bounds[i]:e_bounds[i + 1] if i + 1 < len(e_bounds) else len(edges)]
+            index[part] = np.arange(len(part))
+            labels = part.tolist() if self.labels is None else self.to_labels(part.tolist())
+            sub = CompactGraph.from_edges(len(part), index[sub_edges], labels)
+            if self._keys is not None:  # Mêmes clés : l'empreinte ne dépend que des sommets présents
+                sub.enable_fingerprint(self._keys[part])
+            subgraphs.append(sub)
+        return subgraphs
+
+    def __getstate__(self):
+        # Graphe projeté depuis un fichier : on transmet le chemin (et l'identité du fichier)
+        # plutôt que les tableaux CSR
+        state = self.__dict__.copy()
+        if self._source is not None:
+            state["_offsets"] = state["_neighbors"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._source is not None:
+            from .storage import map_csr
+            self._offsets, self._neighbors = map_csr(*self._source)  # ValueError si le fichier a changé
+
+    def __contains__(self, v) -> bool:
+        # Comme nx.Graph : tout objet qui n'est pas un indice entier est absent (1.5, "a", None...)
+        if not isinstance(v, (int, np.integer)):
+            return False
+        return 0 <= v < len(self._alive) and bool(self._alive[v])
+
+    def __iter__(self):
+        return iter(self.nodes())
+
+    def __len__(self) -> int:
+        return self._n_alive
+
+    def __getitem__(self, v) -> list:
+        return self._live_neighbors(v).tolist()
+
+    # ------------------------------------------------------------------
+    # Journal de suppressions
+    # ------------------------------------------------------------------
+
+    def mark(self) -> int:
+        """Position courante dans le journal, à passer à `undo` pour revenir à cet état."""
+        return len(self._trail)
+
+    def undo(self, mark: int):
+        """Annule, dans l'ordre inverse, toutes les suppressions et tous les ajouts depuis `mark`."""
+        trail = self._trail
+        while len(trail) > mark:
+            v = trail.pop()
+            if isinstance(v, tuple):  # Arête ajoutée : les deux extrémités sont présentes
+                for x in v:
+                    extra = self._extra[x]
+                    extra.pop()
+                    if not extra:
+                        del self._extra[x]
+                    self._deg[x] -= 1
+                self._m -= 1
+                if self._keys is not None:
+                    self.fingerprint ^= self._edge_key(*v)
+                continue
+            self._alive[v] = True
+            live = self._live_neighbors(v)
+            self._deg[live] += 1
+            self._deg[v] = len(live)
+            self._m += len(live)
+            self._n_alive += 1
+            if self._keys is not None:
+                self.fingerprint ^= int(self._keys[v])
+
+    def _edge_key(self, u, v) -> int:
+        """Clé (symétrique) d'une arête ajoutée, dérivée des clés de ses extrémités."""
+        return ((int(self._keys[u]) + int(self._keys[v])) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+
+    def _live_neighbors(self, v) -> np.ndarray:
+        nbrs = self._neighbors[self._offsets[v]:self._offsets[v + 1]]
+        if self._extra:
+            extra = self._extra.get(v)
+            if extra:
+                nbrs = np.concatenate((nbrs, np.asarray(extra, dtype=nbrs.dtype)))
+        return nbrs[self._alive[nbrs]]
+
+
+def _index_dtype(n: int):
+    """Plus petit type entier permettant d'indexer n sommets."""
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def as_compact_graph(G) -> CompactGraph:
+    """
+    Renvoie G s'il est déjà compact, sinon sa conversion en `CompactGraph`.
+    """
+    if isinstance(G, CompactGraph):
+        return G
+    return CompactGraph.from_networkx(G)
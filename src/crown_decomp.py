@@ -1,6 +1,8 @@
 import networkx as nx
 from networkx.algorithms import bipartite
 
+from .instrumentation import count
+
 
 def maximal_matching(G: nx.Graph):
     """
@@ -41,15 +43,31 @@ def build_bipartite_subgraph(G: nx.Graph, matched_vertices: set, unmatched: set)
     return b
 
 
-def crown_decomposition(G: nx.Graph, k: int):
+def crown_decomposition(G: nx.Graph, k: int, stats: dict = None):
     """
-    Tente de trouver une décomposition en couronne (C, H, R) du graphe G.
+    Tente de trouver une décomposition en couronne (C, H, R) du graphe G (lemme de la
+    couronne, Cygan et al. p. 28).
     Retourne un triplet (C, H, is_no_instance) où :
     - C'est l'ensemble couronne (un ensemble indépendant de sommets).
-    - H est la tête de la couronne.
+    - H est la tête de la couronne (|H| ≤ k), couplée dans C et telle que N(C) ⊆ H.
     - is_no_instance est un booléen indiquant si l'on peut conclure qu'aucune couverture de sommets de taille k n'existe.
+
+    Démarche :
+    1. Couplage maximal glouton M ; si |M| > k, réponse négative.
+    2. Graphe biparti entre les sommets V_M couverts par M et les autres sommets I
+       (I est un ensemble indépendant puisque M est maximal).
+    3. Couplage maximum M' de ce graphe biparti (Hopcroft-Karp) ; si |M'| > k, réponse négative.
+    4. Couverture minimale X obtenue par le théorème de König à partir de M'.
+       H = X ∩ V_M et C = I - X forment une couronne : chaque arête issue de C est couverte
+       par X donc aboutit dans H, et chaque sommet de H est couplé par M' à un sommet de C.
+
+    Si `stats` est fourni, `stats["crown_iterations"]` compte les appels et
+    `stats["matching"]` reçoit les tailles des couplages maximal et maximum de cet appel.
     """
     m = maximal_matching(G)
+    if stats is not None:
+        count(stats, "crown_iterations")
+        stats.setdefault("matching", {})["maximal"] = len(m)
 
     # Si le couplage contient plus de k arêtes, alors il est impossible d'obtenir une couverture de taille k
     if len(m) > k:
@@ -68,25 +86,20 @@ def crown_decomposition(G: nx.Graph, k: int):
     # Construction du sous-graphe biparti entre sommets appariés et non appariés
     b = build_bipartite_subgraph(G, matched_vertices, unmatched)
 
-    match_dict = {}
-
-    try:
-        for component in nx.connected_components(b):
-            sub = b.subgraph(component)
-            if not sub.nodes():
-                continue
-            top, _ = bipartite.sets(sub)
-            matching_sub = bipartite.maximum_matching(sub, top_nodes=top)
-            match_dict.update(matching_sub)
-    except nx.AmbiguousSolution:
-        pass  # Si la bipartition est ambiguë, on ignore cette exception
-
-    # Vérification de l'existence d'un sommet non apparié avec un voisinage vide
-    for x in unmatched:
-        neigh = set(b[x])
-        if len(neigh) == 0:
-            c = {x}  # Candidat pour l'ensemble couronne
-            h = set()  # La tête de la couronne est vide.
-            return c, h, False
-
-    return None, None, False
+    # Couplage maximum (Hopcroft-Karp) ; le dictionnaire contient les deux sens de chaque arête
+    match_dict = bipartite.hopcroft_karp_matching(b, top_nodes=unmatched)
+    if stats is not None:
+        stats["matching"]["maximum"] = len(match_dict) // 2
+    if len(match_dict) // 2 > k:
+        return None, None, True
+
+    # Couverture de König : les chemins alternés partent des sommets de I non couplés,
+    # ce qui place la couverture du côté de V_M autant que possible et maximise C.
+    cover = bipartite.to_vertex_cover(b, match_dict, top_nodes=unmatched)
+
+    c = unmatched - cover  # Couronne : sommets de I hors de la couverture
+    h = cover & matched_vertices  # Tête : sommets de V_M dans la couverture
+    if not c:
+        return None, None, False
+
+    return c, h, False
@@ -1,30 +1,52 @@
-import random
+"""
+Générateurs de graphes tests.
 
+Les arêtes sont tirées de façon vectorisée avec NumPy : les paires candidates sont
+numérotées, et les paires retenues par des tirages de Bernoulli indépendants sont obtenues
+par sauts géométriques (l'écart entre deux succès consécutifs suit une loi géométrique),
+en O(m) plutôt qu'en O(n²). Chaque générateur accepte une graine `seed` (entier ou
+`np.random.Generator`) qui rend le graphe reproductible, et peut renvoyer un `nx.Graph`,
+un tableau d'arêtes (m, 2) ou directement un `CompactGraph` (CSR), sans construire de
+`nx.Graph`.
+"""
 import networkx as nx
+import numpy as np
 
+from .compact_graph import CompactGraph
 
-def generate_random_graph(n: int, m: int) -> nx.Graph:
+
+OUTPUTS = ("networkx", "edges", "csr")
+
+
+def generate_random_graph(n: int, m: int, seed=None, output: str = "networkx"):
     """
-    Génère un graphe aléatoire de n sommets et m arêtes.
-    Utilise le modèle G(n, m) de NetworkX pour créer un graphe aléatoire avec un nombre
-    d'arêtes fixe.
+    Génère un graphe aléatoire de n sommets et m arêtes (modèle G(n, m)) : m paires
+    distinctes sont tirées uniformément parmi les n(n-1)/2 paires possibles.
 
     Paramètres
     ----------
     n : int
         Nombre total de sommets dans le graphe.
     m : int
-        Nombre total d'arêtes à inclure dans le graphe.
+        Nombre total d'arêtes à inclure dans le graphe (ramené à n(n-1)/2 au plus).
+    seed : int ou np.random.Generator, optionnel
+        Graine du tirage (None : non reproductible).
+    output : str
+        "networkx" (`nx.Graph`), "edges" (tableau (m, 2) d'entiers) ou "csr" (`CompactGraph`).
 
     Retourne
     --------
-    nx.Graph
+    nx.Graph, np.ndarray ou CompactGraph
         Un graphe aléatoire non orienté contenant n sommets et m arêtes.
     """
-    return nx.gnm_random_graph(n, m, seed=None)
+    rng = np.random.default_rng(seed)
+    total = n * (n - 1) // 2
+    index = rng.choice(total, size=min(m, total), replace=False)
+    return _as_output(n, np.stack(_pair_from_index(index, n), axis=1), output)
 
 
-def generate_vertex_cover_graph(n: int, k: int, edge_prob: float = 0.5, guaranteed_vc: bool = False) -> nx.Graph:
+def generate_vertex_cover_graph(n: int, k: int, edge_prob: float = 0.5, guaranteed_vc: bool = False,
+                                seed=None, output: str = "networkx"):
     """
     Génère un graphe aléatoire ayant (avec forte probabilité) un vertex cover de taille ≤ k.
     Si `guaranteed_vc` est activé, la structure du graphe est modifiée pour assurer l'existence
@@ -40,39 +62,93 @@ def generate_vertex_cover_graph(n: int, k: int, edge_prob: float = 0.5, guarante
         Probabilité d'ajouter une arête entre deux sommets admissibles.
     guaranteed_vc : bool, optionnel (par défaut False)
         Si True, assure la construction d'un vertex cover de taille k en forçant les connexions.
+    seed : int ou np.random.Generator, optionnel
+        Graine du tirage (None : non reproductible).
+    output : str
+        "networkx" (`nx.Graph`), "edges" (tableau (m, 2) d'entiers) ou "csr" (`CompactGraph`).
 
     Retourne
     --------
-    nx.Graph
+    nx.Graph, np.ndarray ou CompactGraph
         Un graphe non orienté généré selon les critères spécifiés.
     """
-    g = nx.Graph()
-    g.add_nodes_from(range(n))
+    rng = np.random.default_rng(seed)
 
     # Sélection aléatoire de k sommets qui formeront le vertex cover
-    cover = set(random.sample(range(n), min(k, n)))
+    is_cover = np.zeros(n, dtype=bool)
+    is_cover[rng.choice(n, size=min(k, n), replace=False)] = True
+    cover = np.flatnonzero(is_cover)
+    non_cover = np.flatnonzero(~is_cover)
+
+    # Paires (sommet du cover, sommet hors cover), chacune retenue avec probabilité edge_prob
+    index = _bernoulli_indices(rng, len(cover) * len(non_cover), edge_prob)
+    parts = [np.stack((cover[index // len(non_cover)], non_cover[index % len(non_cover)]), axis=1)
+             if len(non_cover) else np.empty((0, 2), dtype=np.int64)]
 
     if guaranteed_vc:
-        # Assurer que le vertex cover est bien de taille k :
-        # 1. Chaque sommet hors du cover est connecté à au moins un sommet du cover.
-        non_cover = set(range(n)) - cover
-        for u in non_cover:
-            # Connexion obligatoire à un sommet du cover pour garantir un recouvrement
-            v = random.choice(list(cover))
-            g.add_edge(u, v)
-
-            # Ajout d'arêtes supplémentaires aléatoires entre le sommet hors cover et d'autres sommets du cover
-            for v in cover:
-                if random.random() < edge_prob:
-                    g.add_edge(u, v)
+        # Chaque sommet hors du cover est connecté à au moins un sommet du cover
+        if len(cover):
+            parts.append(np.stack((cover[rng.integers(len(cover), size=len(non_cover))], non_cover), axis=1))
     else:
-        # Version sans garantie stricte du vertex cover : arêtes générées de manière aléatoire
-        list(range(n))
-        for i in range(n):
-            for j in range(i + 1, n):
-                # On favorise les connexions impliquant des sommets du vertex cover
-                if (i in cover) or (j in cover):
-                    if random.random() < edge_prob:
-                        g.add_edge(i, j)
+        # Paires internes au cover : les arêtes impliquent toujours un sommet du cover
+        index = _bernoulli_indices(rng, len(cover) * (len(cover) - 1) // 2, edge_prob)
+        i, j = _pair_from_index(index, len(cover))
+        parts.append(np.stack((cover[i], cover[j]), axis=1))
+
+    return _as_output(n, np.concatenate(parts), output)
+
 
+def _bernoulli_indices(rng, total: int, p: float) -> np.ndarray:
+    """
+    Indices (croissants) des succès de `total` tirages de Bernoulli de paramètre p, obtenus
+    par sauts géométriques : coût proportionnel au nombre de succès.
+    """
+    if total <= 0 or p <= 0:
+        return np.empty(0, dtype=np.int64)
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+
+    expected = total * p
+    chunks = []
+    position = -1
+    while True:
+        size = int(expected + 5 * np.sqrt(expected)) + 16
+        index = position + np.cumsum(rng.geometric(p, size=size))
+        if index[-1] >= total:
+            chunks.append(index[:np.searchsorted(index, total)])
+            break
+        chunks.append(index)
+        position = int(index[-1])
+    return np.concatenate(chunks).astype(np.int64)
+
+
+def _pair_from_index(t: np.ndarray, n: int):
+    """
+    Paires (i, j), i < j, de rang t dans l'énumération ligne par ligne des paires de
+    {0, ..., n-1} : la ligne i commence au rang i(2n - i - 1)/2.
+    """
+    t = np.asarray(t, dtype=np.int64)
+    b = 2 * n - 1
+    i = np.floor((b - np.sqrt(np.maximum(b * b - 8 * t.astype(np.float64), 0))) / 2).astype(np.int64)
+    # Correction des erreurs d'arrondi de la racine carrée
+    i -= (i * (b - i) // 2 > t)
+    i += ((i + 1) * (b - i - 1) // 2 <= t)
+    j = t - i * (b - i) // 2 + i + 1
+    return i, j
+
+
+def _as_output(n: int, edges: np.ndarray, output: str):
+    """Met les arêtes générées au format demandé (voir `OUTPUTS`)."""
+    edges = edges.astype(np.int64, copy=False)
+    if output == "edges":
+        u, v = np.minimum(edges[:, 0], edges[:, 1]), np.maximum(edges[:, 0], edges[:, 1])
+        keys = np.unique(u * n + v)  # Suppression des arêtes multiples
+        return np.stack((keys // n, keys % n), axis=1)
+    if output == "csr":
+        return CompactGraph.from_edges(n, edges)
+    if output != "networkx":
+        raise ValueError(f"Format de sortie inconnu : {output} (attendu : {', '.join(OUTPUTS)})")
+    g = nx.Graph()
+    g.add_nodes_from(range(n))
+    g.add_edges_from(edges.tolist())
     return g
@@ -1,4 +1,23 @@
+"""
+Fonctions utilitaires sur les graphes : suppression des sommets isolés et vérification de
+vertex covers.
+
+La vérification est vectorisée avec NumPy : le graphe est mis sous forme d'un tableau
+d'arêtes (m, 2) d'indices, la couverture sous forme d'un masque booléen d'appartenance, et
+une arête est couverte si `mask[u] | mask[v]`. Les arêtes sont parcourues par blocs de
+`CHUNK_SIZE`, ce qui arrête la vérification dès le premier bloc contenant une arête non
+couverte. Les variantes `_batch` vérifient plusieurs couvertures candidates en un seul
+passage sur les arêtes : les masques sont empaquetés en bits (un bit par candidat), et un
+ET bit à bit sur les arêtes ne laisse à 1 que les candidats valides.
+"""
 import networkx as nx
+import numpy as np
+
+from .compact_graph import CompactGraph
+
+
+# Nombre d'arêtes vérifiées par bloc (arrêt anticipé entre deux blocs)
+CHUNK_SIZE = 1 << 16
 
 
 def remove_isolated_vertices(G: nx.Graph):
@@ -6,11 +25,101 @@ def remove_isolated_vertices(G: nx.Graph):
     Supprime les sommets isolés du graphe G.
 
     Un sommet est considéré comme isolé s'il n'a aucune arête incidente.
+    Accepte un `nx.Graph` ou un `CompactGraph`.
     """
-    isolated = list(nx.isolates(G))  # Identifie les sommets isolés
+    if isinstance(G, CompactGraph):
+        isolated = G.isolates()  # Calcul vectorisé sur le tableau des degrés
+    else:
+        isolated = list(nx.isolates(G))  # Identifie les sommets isolés
     G.remove_nodes_from(isolated)  # Supprime ces sommets du graphe
 
 
+def edge_array(G):
+    """
+    Met le graphe G sous la forme d'un tableau d'arêtes d'indices.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe à convertir.
+
+    Retourne
+    --------
+    tuple (np.ndarray, int, dict ou None)
+        Le tableau (m, 2) des arêtes, le nombre d'indices n (taille des masques) et la
+        correspondance sommet -> indice (None pour un `CompactGraph`, dont les sommets
+        sont déjà les indices 0..capacity-1).
+    """
+    if isinstance(G, CompactGraph):
+        return G.edge_array().astype(np.int64, copy=False), G.capacity, None
+    index = {v: i for i, v in enumerate(G.nodes())}
+    m = G.number_of_edges()
+    edges = np.fromiter((index[x] for e in G.edges() for x in e), dtype=np.int64, count=2 * m)
+    return edges.reshape(m, 2), len(index), index
+
+
+def cover_mask(n: int, cover_set, index: dict = None) -> np.ndarray:
+    """
+    Masque booléen d'appartenance de taille n d'un ensemble de sommets. Les sommets absents
+    de `index` (ou hors de 0..n-1 sans `index`) sont ignorés.
+    """
+    if index is not None:
+        positions = [index[v] for v in cover_set if v in index]
+    else:
+        positions = [v for v in cover_set if 0 <= v < n]
+    mask = np.zeros(n, dtype=bool)
+    mask[np.asarray(positions, dtype=np.int64)] = True
+    return mask
+
+
+def covers_edges(edges: np.ndarray, mask: np.ndarray, chunk: int = CHUNK_SIZE) -> bool:
+    """
+    Vérifie que chaque arête du tableau (m, 2) `edges` a une extrémité dans le masque
+    `mask`, en s'arrêtant au premier bloc de `chunk` arêtes qui en contient une non couverte.
+    """
+    for start in range(0, len(edges), chunk):
+        block = edges[start:start + chunk]
+        if not (mask[block[:, 0]] | mask[block[:, 1]]).all():
+            return False
+    return True
+
+
+def uncovered_edges(edges: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Sous-tableau (r, 2) des arêtes de `edges` dont aucune extrémité n'est dans `mask`."""
+    return edges[~(mask[edges[:, 0]] | mask[edges[:, 1]])]
+
+
+def covers_edges_batch(edges: np.ndarray, masks: np.ndarray, chunk: int = CHUNK_SIZE) -> np.ndarray:
+    """
+    Vérifie b couvertures candidates d'un coup.
+
+    Paramètres
+    ----------
+    edges : np.ndarray
+        Tableau (m, 2) des arêtes.
+    masks : np.ndarray
+        Masques booléens (b, n), un par candidat.
+    chunk : int
+        Nombre d'arêtes par bloc ; la vérification s'arrête dès que tous les candidats ont
+        été invalidés.
+
+    Retourne
+    --------
+    np.ndarray
+        Tableau booléen (b,) : True pour les candidats qui couvrent toutes les arêtes.
+    """
+    masks = np.asarray(masks, dtype=bool)
+    # bits[v] : octets dont le bit i vaut 1 si v appartient au candidat i
+    bits = np.ascontiguousarray(np.packbits(masks, axis=0, bitorder="little").T)
+    valid = np.full(bits.shape[1], 0xFF, dtype=np.uint8)
+    for start in range(0, len(edges), chunk):
+        block = edges[start:start + chunk]
+        valid &= np.bitwise_and.reduce(bits[block[:, 0]] | bits[block[:, 1]], axis=0)
+        if not valid.any():
+            break
+    return np.unpackbits(valid, bitorder="little")[:len(masks)].astype(bool)
+
+
 def is_vertex_cover(G: nx.Graph, cover_set) -> bool:
     """
     Vérifie si un ensemble de sommets donné constitue un vertex cover valide pour G.
@@ -20,7 +129,7 @@ def is_vertex_cover(G: nx.Graph, cover_set) -> bool:
 
     Paramètres
     ----------
-    G : nx.Graph
+    G : nx.Graph ou CompactGraph
         Graphe sur lequel la vérification est effectuée.
     cover_set : iterable
         Ensemble de sommets candidats pour être un vertex cover.
@@ -30,12 +139,29 @@ def is_vertex_cover(G: nx.Graph, cover_set) -> bool:
     bool
         True si cover_set est un vertex cover valide, False sinon.
     """
-    covered_edges = 0
-    total_edges = G.number_of_edges()
-    cover_set = set(cover_set)  # Conversion en ensemble pour accès rapide
+    edges, n, index = edge_array(G)
+    return covers_edges(edges, cover_mask(n, cover_set, index))
+
 
-    for (u, v) in G.edges():
-        if (u in cover_set) or (v in cover_set):  # Vérifie si l'arête est couverte
-            covered_edges += 1
+def is_vertex_cover_batch(G: nx.Graph, covers) -> np.ndarray:
+    """
+    Vérifie plusieurs ensembles de sommets contre le même graphe G, en ne convertissant
+    le graphe qu'une fois.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe sur lequel la vérification est effectuée.
+    covers : iterable
+        Ensembles de sommets candidats.
 
-    return covered_edges == total_edges
+    Retourne
+    --------
+    np.ndarray
+        Tableau booléen : True pour chaque candidat qui est un vertex cover de G.
+    """
+    edges, n, index = edge_array(G)
+    masks = [cover_mask(n, cover_set, index) for cover_set in covers]
+    if not masks:
+        return np.zeros(0, dtype=bool)
+    return covers_edges_batch(edges, np.stack(masks))
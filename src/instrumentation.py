@@ -0,0 +1,85 @@
+"""
+Instrumentation des réductions et de la recherche.
+
+Les statistiques sont un dictionnaire passé en paramètre `stats` aux points d'entrée : sans
+dictionnaire (stats=None), aucune mesure n'est faite et le seul coût est un test par
+étape. Les fonctions de ce module mettent à jour n'importe quel `dict` ; la classe
+`SolverStats` (un `dict`) ajoute l'export à plat vers un système de métriques.
+
+Clés produites (selon les modules traversés) :
+- `reductions[règle]`, `edges_removed[règle]`, `applications[règle]`, `time[règle]` :
+  sommets et arêtes supprimés, nombre de passes efficaces et temps (perf_counter) par règle ;
+- `crown_iterations`, `matching["maximal" | "maximum"]` : décompositions en couronne et
+  tailles des couplages de la dernière décomposition ;
+- `nodes`, `max_depth`, `time["search"]` : nœuds, profondeur maximale et durée de la recherche ;
+- `pruned`, `bound_calls`, `bound_time`, `table`, `status` (voir `bounds`, `transposition`, `budget`).
+"""
+import json
+import time
+from contextlib import contextmanager
+
+
+class SolverStats(dict):
+    """
+    Dictionnaire de statistiques exportable : `flatten` produit des couples
+    "clé.sous_clé" -> nombre, `to_json` leur sérialisation.
+    """
+
+    def flatten(self, prefix: str = "") -> dict:
+        return flatten_stats(self, prefix)
+
+    def to_json(self) -> str:
+        return json.dumps(self.flatten(), sort_keys=True)
+
+
+def count(stats: dict, name: str, value=1, key=None):
+    """Ajoute `value` au compteur `stats[name]` (ou `stats[name][key]`)."""
+    if key is not None:
+        stats = stats.setdefault(name, {})
+        name = key
+    stats[name] = stats.get(name, 0) + value
+
+
+def record_max(stats: dict, name: str, value):
+    """Conserve dans `stats[name]` le maximum des valeurs observées."""
+    if name not in stats or value > stats[name]:
+        stats[name] = value
+
+
+def record_rule(stats: dict, rule: str, vertices: int, edges: int, elapsed: float):
+    """Comptabilise une passe de la règle `rule` : sommets, arêtes supprimés et temps."""
+    count(stats, "reductions", vertices, rule)
+    count(stats, "edges_removed", edges, rule)
+    count(stats, "applications", int(vertices > 0), rule)
+    count(stats, "time", elapsed, rule)
+
+
+@contextmanager
+def phase(stats: dict, name: str):
+    """Mesure la durée du bloc dans `stats["time"][name]` (aucune mesure si stats est None)."""
+    if stats is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        count(stats, "time", time.perf_counter() - start, name)
+
+
+def flatten_stats(stats: dict, prefix: str = "") -> dict:
+    """
+    Aplatit des statistiques imbriquées : {"time": {"crown": 0.1}} devient
+    {"time.crown": 0.1}. Les booléens et les valeurs non numériques (cause d'arrêt...) sont
+    conservés tels quels, les tuples et listes sont indexés.
+    """
+    flat = {}
+    for key, value in stats.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_stats(value, name + "."))
+        elif isinstance(value, (list, tuple)):
+            flat.update(flatten_stats(dict(enumerate(value)), name + "."))
+        else:
+            flat[name] = value
+    return flat
@@ -0,0 +1,215 @@
+"""
+Moteur de branchement itératif : l'état de la recherche est conservé dans une pile (ou une
+file de priorité) explicite plutôt que dans la pile d'appels Python.
+
+- Aucune limite de profondeur : k peut dépasser la limite de récursion de Python.
+- Pas de cadre d'appel par nœud : un cadre de pile est un couple (position dans le journal
+  du graphe, branches restantes).
+- La recherche peut être interrompue après un nombre donné de nœuds puis reprise, et
+  l'objet de recherche (graphe compact, pile, chemin courant) est sérialisable avec pickle,
+  ce qui sert de base à la reprise sur point de contrôle des longues exécutions.
+"""
+import heapq
+
+import networkx as nx
+
+from .budget import BudgetExceeded, unknown
+from .bounds import matching_bound, prune_by_bounds, resolve_bounds
+from .compact_graph import CompactGraph, as_compact_graph
+from .vcb import min_cover_max_degree_two
+
+
+def vcb_iterative(G: nx.Graph, k: int, stats: dict = None, bounds=(), algo: str = "degree",
+                  order: str = "dfs", budget=None, **options):
+    """
+    Version itérative de `vcb_recursive` / `vcb_degree` (voir `IterativeSearch`).
+    Les options propres au moteur récursif (réductions entrelacées, composantes) sont ignorées.
+
+    Retourne
+    --------
+    bool ou Unknown
+        True si un vertex cover de taille ≤ k existe, False sinon ; `Unknown` si le budget
+        est épuisé.
+    """
+    return IterativeSearch(G, k, algo, order, bounds, stats, budget).run()
+
+
+class IterativeSearch:
+    """
+    Recherche d'une couverture de taille ≤ k avec une pile explicite.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Le graphe d'entrée (non modifié).
+    k : int
+        Taille maximale autorisée du vertex cover.
+    algo : str
+        Règle de branchement : "edge" (u ou v) ou "degree" (v ou N(v), degré ≤ 2 résolu
+        en temps polynomial).
+    order : str
+        Ordre d'exploration :
+        - "dfs" : profondeur d'abord ; le graphe est modifié en place et chaque cadre ne
+          retient que sa position dans le journal d'annulation (mémoire O(k)) ;
+        - "best" : meilleur d'abord, en développant le nœud dont la marge k - borne est la
+          plus grande (première borne de `bounds`, couplage maximal par défaut). Chaque nœud
+          en attente est stocké sous la forme (sommets supprimés, budget).
+    bounds : iterable, optionnel
+        Bornes inférieures d'élagage (voir `bounds.resolve_bounds`).
+    stats : dict, optionnel
+        Reçoit `nodes` et les statistiques des bornes.
+    budget : Budget, optionnel
+        Limites de temps et de nœuds, débitées avant chaque pas de la recherche (nœud
+        développé ou cadre dépilé). Une recherche arrêtée par le budget reste reprenable
+        (avec un nouveau budget).
+
+    Attributs
+    ---------
+    result : bool ou None
+        Réponse, ou None tant que la recherche n'est pas terminée.
+    cover : set ou None
+        Couverture trouvée (sommets de G) si la réponse est True.
+    """
+
+    def __init__(self, G, k: int, algo: str = "degree", order: str = "dfs", bounds=(), stats: dict = None,
+                 budget=None):
+        self.g = as_compact_graph(G).copy()
+        self.labelled = not isinstance(G, CompactGraph)
+        self.algo = algo
+        self.order = order
+        self.bounds = resolve_bounds(bounds)
+        self.stats = stats
+        self.budget = budget
+        self.result = None
+        self.cover = None
+
+        self._path = []  # DFS : sommets pris pour atteindre chaque cadre (hors racine)
+        self._stack = []  # DFS : cadres [position dans le journal, branches restantes]
+        self._heap = []  # Meilleur d'abord : (-marge, numéro, sommets supprimés, budget)
+        self._count = 0
+        self._open((), k)
+
+    def run(self, max_nodes: int = None):
+        """
+        Poursuit la recherche. S'arrête après `max_nodes` nœuds développés (si précisé) et
+        renvoie alors None ; un nouvel appel reprend là où la recherche s'était arrêtée.
+
+        Retourne
+        --------
+        bool, None ou Unknown
+            La réponse, None si la recherche a été interrompue par `max_nodes`, ou `Unknown`
+            si le budget est épuisé.
+        """
+        step = self._step_dfs if self.order == "dfs" else self._step_best
+        expanded = 0
+        while self.result is None:
+            if max_nodes is not None and expanded >= max_nodes:
+                return None
+            if self.budget is not None:
+                try:
+                    self.budget.charge()  # Avant le pas : aucun nœud n'est perdu à l'arrêt
+                except BudgetExceeded as exc:
+                    return unknown(exc.reason, self.stats)
+            step()
+            expanded += 1
+        return self.result
+
+    @property
+    def pending(self) -> int:
+        """Nombre de nœuds en attente (cadres de pile ou entrées de la file)."""
+        return len(self._stack) if self.order == "dfs" else len(self._heap)
+
+    # ------------------------------------------------------------------
+    # Parcours
+    # ------------------------------------------------------------------
+
+    def _step_dfs(self):
+        """Développe la prochaine branche du cadre au sommet de la pile."""
+        if not self._stack:
+            self.result = False
+            return
+        mark, children = self._stack[-1]
+        if not children:
+            self._stack.pop()
+            if self._path:
+                self._path.pop()
+            return
+        vertices, k = children.pop()
+        self.g.undo(mark)
+        self.g.remove_nodes_from(vertices)
+        self._open(vertices, k)
+
+    def _step_best(self):
+        """Développe le nœud en attente de plus grande marge."""
+        if not self._heap:
+            self.result = False
+            return
+        _, _, deleted, k = heapq.heappop(self._heap)
+        self.g.undo(0)
+        self.g.remove_nodes_from(deleted)
+        self._open(deleted, k)
+
+    def _open(self, vertices: tuple, k: int):
+        """
+        Évalue le nœud courant (graphe g après suppression de `vertices`) : feuille OUI,
+        échec, ou ajout de ses branches à la pile / à la file.
+        """
+        found, children = self._expand(k)
+        if found:
+            taken = vertices if self.order == "best" else [v for path in self._path for v in path] + list(vertices)
+            cover = set(taken) | set(children)
+            self.cover = set(self.g.to_labels(cover)) if self.labelled else cover
+            self.result = True
+        elif children is None:
+            return
+        elif self.order == "dfs":
+            if self._stack:
+                self._path.append(vertices)
+            self._stack.append([self.g.mark(), children[::-1]])  # Première branche en fin de liste
+        else:
+            bound = self.bounds[0][1] if self.bounds else matching_bound
+            mark = self.g.mark()
+            for extra, budget in children:
+                self.g.remove_nodes_from(extra)
+                slack = budget - bound(self.g)
+                self.g.undo(mark)
+                if slack >= 0:
+                    self._count += 1
+                    heapq.heappush(self._heap, (-slack, self._count, vertices + extra, budget))
+
+    def _expand(self, k: int):
+        """
+        Renvoie (True, couverture de la feuille) pour une feuille OUI, (False, None) pour un
+        échec, ou (None, branches) où chaque branche est un couple (sommets pris, budget).
+        """
+        g = self.g
+        if self.stats is not None:
+            self.stats["nodes"] = self.stats.get("nodes", 0) + 1
+        if k < 0:
+            return False, None
+
+        if self.algo == "edge":
+            edge = g.any_edge()
+            if edge is None:
+                return True, []
+            if k == 0 or self._pruned(k):
+                return False, None
+            return None, [((x,), k - 1) for x in edge]
+
+        best = g.max_degree_vertex()
+        if best is None:
+            return True, []
+        v, d = best
+        if d <= 2:
+            cover = min_cover_max_degree_two(g)
+            return (True, cover) if len(cover) <= k else (False, None)
+        if self._pruned(k):
+            return False, None
+        children = [((v,), k - 1)]
+        neighbors = g[v]
+        if len(neighbors) <= k:
+            children.append((tuple(neighbors), k - len(neighbors)))
+        return None, children
+
+    def _pruned(self, k: int) -> bool:
+        return bool(self.bounds) and prune_by_bounds(self.g, k, self.bounds, self.stats)
@@ -1,34 +1,101 @@
+import time
+from functools import partial
+
 import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import maximum_bipartite_matching
+from .advanced_rules import strong_reductions, touched_since
+from .bitset_solver import BITSET_THRESHOLD, bitset_vertex_cover, vcb_bitset
+from .budget import Unknown, unknown
+from .compact_graph import CompactGraph, as_compact_graph
 from .graph_utils import remove_isolated_vertices
-from .reduction_rules import high_degree_rule
+from .instrumentation import phase, record_rule
+from .reduction_rules import degree_two_rule, high_degree_rule, lift_cover
 from .crown_decomp import crown_decomposition
+from .iterative import vcb_iterative
+from .parallel import vcb_parallel
+from .vcb import ALGORITHMS, find_vertex_cover
 
 
-def crown_reduction(g: nx.Graph, k: int):
+def crown_reduction(g: nx.Graph, k: int, stats: dict = None, strong: bool = True, trail: list = None,
+                    budget=None):
     """
     Applique la réduction par décomposition en couronne de manière itérative jusqu'à ce que :
     - La taille du graphe soit ≤ 3k (noyau trouvé).
     - Aucune réduction supplémentaire ne soit possible.
     - Il soit établi qu'aucune couverture de sommets de taille k n'existe.
 
+    Avant chaque décomposition, les règles des sommets de degré 1 et 2 (repliement compris,
+    voir `degree_two_rule`) réduisent les chemins et arbres pendants, fréquents dans les
+    graphes peu denses de type réseau routier. Les règles fortes de `advanced_rules`
+    (domination, sommets non confinés, jumeaux) sont ensuite appliquées ; si elles ont
+    supprimé des sommets, les règles peu coûteuses sont relancées avant la couronne. À partir
+    du deuxième tour, seuls les sommets proches d'un changement depuis l'appel précédent
+    leur sont soumis (voir `advanced_rules.touched_since`).
+
     Paramètres
     ----------
-    G : nx.Graph
+    G : nx.Graph ou CompactGraph
         Graphe d'entrée sur lequel les réductions sont appliquées.
     k : int
         Paramètre indiquant la taille maximale du vertex cover recherché.
+    stats : dict, optionnel
+        `stats["reductions"][règle]` est incrémenté du nombre de sommets supprimés par chaque
+        règle ("isolated", "high_degree", "degree_two", "dominance", "unconfined", "twin", "crown"),
+        et de même `edges_removed`, `applications` et `time` (voir `instrumentation.py`) ;
+        `crown_iterations` et `matching` décrivent les décompositions en couronne.
+    strong : bool, optionnel
+        Si False, les règles fortes ne sont pas appliquées.
+    trail : list, optionnel
+        Journal de réduction : sommets pris par les règles (haut degré, degré 1 et 2, règles
+        fortes, têtes de couronne) et repliements. Une couverture du noyau se relève en une
+        couverture du graphe d'entrée avec `reduction_rules.lift_cover`.
+    budget : Budget, optionnel
+        Échéance vérifiée à chaque tour de boucle. Si elle est dépassée, le graphe
+        partiellement réduit est renvoyé (instance équivalente, sans garantie de taille) et
+        `budget.exceeded` indique l'arrêt.
 
     Retourne
     --------
-    tuple (nx.Graph ou None, int, bool)
-        - Le graphe réduit si un noyau est trouvé, sinon None.
+    tuple (graphe ou None, int, bool)
+        - Le graphe réduit (du même type que l'entrée) si un noyau est trouvé, sinon None.
         - La nouvelle valeur de k après réduction.
         - Un booléen indiquant si l'instance est invalide (aucun vertex cover de taille ≤ k).
     """
     g = g.copy()  # Copie pour éviter de modifier l'original
+    degrees = None  # Degrés à la fin du dernier appel des règles fortes
     while True:
+        if budget is not None and k >= 0 and budget.expired():
+            return g, k, False  # Noyau partiel : toutes les réductions appliquées sont sûres
+
+        start = _measure(stats, g)
         remove_isolated_vertices(g)  # Suppression des sommets isolés
-        k = high_degree_rule(g, k)  # Application de la règle des sommets de haut degré
+        _count(stats, "isolated", g, start)
+
+        start = _measure(stats, g)
+        k = high_degree_rule(g, k, trail)  # Application de la règle des sommets de haut degré
+        _count(stats, "high_degree", g, start)
+
+        start = _measure(stats, g)
+        remove_isolated_vertices(g)  # Sommets isolés par la règle de haut degré
+        _count(stats, "isolated", g, start)
+
+        start = _measure(stats, g)
+        k = degree_two_rule(g, k, trail=trail, stats=stats)  # Pendants, triangles et repliements de degré 2
+        _count(stats, "degree_two", g, start)
+
+        start = _measure(stats, g)
+        remove_isolated_vertices(g)  # Sommets isolés par les règles de degré 1 et 2
+        _count(stats, "isolated", g, start)
+
+        if strong and k >= 0:
+            n = g.number_of_nodes()
+            candidates = None if degrees is None else touched_since(g, degrees)
+            k = strong_reductions(g, k, trail, stats, candidates)
+            degrees = dict(g.degree())
+            if g.number_of_nodes() < n:
+                continue  # Relance des règles peu coûteuses sur le graphe réduit
 
         if k < 0:
             return None, 0, True  # Impossible de trouver une couverture valide
@@ -37,37 +104,273 @@ def crown_reduction(g: nx.Graph, k: int):
             return g, k, False  # Noyau obtenu
 
         # Décomposition en couronne
-        c, h, no_inst = crown_decomposition(g, k)
+        start = _measure(stats, g)
+        c, h, no_inst = crown_decomposition(g, k, stats)
 
         if no_inst:
             return None, 0, True  # Aucune solution possible
         if c is None:
+            _count(stats, "crown", g, start)
             return g, k, False  # Aucune réduction supplémentaire possible
 
-        # Suppression des sommets de la couronne et ajustement de k
-        g.remove_nodes_from(c)
+        # La tête H fait partie d'une couverture optimale : suppression de C ∪ H et ajustement de k
+        g.remove_nodes_from(c | h)
         k -= len(h)
+        if trail is not None:
+            trail.extend(("cover", v) for v in h)
+        _count(stats, "crown", g, start)
 
         if k < 0:
             return None, 0, True  # Instance invalide après réduction
 
 
-def kernel_vertex_cover_crown(G: nx.Graph, k: int):
+def _measure(stats: dict, g):
+    """Point de départ de la mesure d'une règle (sommets, arêtes, instant), None sans statistiques."""
+    if stats is None:
+        return None
+    return g.number_of_nodes(), g.number_of_edges(), time.perf_counter()
+
+
+def _count(stats: dict, rule: str, g, start):
+    """Comptabilise les sommets et arêtes supprimés par `rule` depuis `start`, et son temps."""
+    if start is not None:
+        n, m, t = start
+        record_rule(stats, rule, n - g.number_of_nodes(), m - g.number_of_edges(), time.perf_counter() - t)
+
+
+def kernel_vertex_cover_crown(G: nx.Graph, k: int, stats: dict = None, trail: list = None, budget=None):
     """
     Fonction principale de kernelization pour le problème du vertex cover.
 
     Paramètres
     ----------
-    G : nx.Graph
+    G : nx.Graph ou CompactGraph
         Graphe d'entrée.
     k : int
         Taille maximale du vertex cover recherché.
+    stats : dict, optionnel
+        Reçoit le nombre de sommets supprimés par chaque règle (voir `crown_reduction`).
+    trail : list, optionnel
+        Journal de réduction permettant de relever une couverture du noyau (voir `crown_reduction`).
+    budget : Budget, optionnel
+        Échéance de la kernelization (voir `crown_reduction`).
 
     Retourne
     --------
-    tuple (nx.Graph ou None, int, bool)
-        - Le graphe réduit après kernelization, ou None si l'instance est invalide.
+    tuple (graphe ou None, int, bool)
+        - Le graphe réduit (du même type que l'entrée) après kernelization, ou None si l'instance est invalide.
         - La nouvelle valeur de k après les réductions.
         - Un booléen indiquant si aucun vertex cover de taille ≤ k n'existe.
     """
-    return crown_reduction(G, k)
+    return crown_reduction(G, k, stats, trail=trail, budget=budget)
+
+
+def kernel_vertex_cover_lp(G: nx.Graph, k: int, stats: dict = None, trail: list = None, budget=None):
+    """
+    Kernelization de Nemhauser-Trotter (noyau à au plus 2k sommets).
+
+    L'optimum demi-entier du relâchement linéaire du vertex cover s'obtient à partir d'une
+    couverture minimale X du double biparti de G (sommets (v, 0) et (v, 1), arêtes
+    (u, 0)-(v, 1) pour chaque arête uv), calculée par Hopcroft-Karp et le théorème de König :
+    x_v = |X ∩ {(v, 0), (v, 1)}| / 2.
+    - Si la valeur de l'optimum (|X| / 2) dépasse k, aucune couverture de taille k n'existe.
+    - Les sommets à 1 appartiennent à une couverture optimale : ils sont retirés et k diminue.
+    - Les sommets à 0 n'y appartiennent pas : ils sont retirés.
+    - Le noyau est le sous-graphe induit par les sommets à ½, de taille ≤ 2k.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée.
+    k : int
+        Taille maximale du vertex cover recherché.
+    stats : dict, optionnel
+        `stats["reductions"]["lp"]` reçoit le nombre de sommets à 0 ou à 1 supprimés (et de
+        même `edges_removed`, `applications`, `time`), `stats["matching"]["lp"]` la taille
+        du couplage maximum du double biparti.
+    trail : list, optionnel
+        Journal de réduction complété par les sommets à 1.
+    budget : Budget, optionnel
+        Si l'échéance est déjà dépassée, le graphe est renvoyé sans réduction (le calcul du
+        couplage lui-même n'est pas interruptible).
+
+    Retourne
+    --------
+    tuple (graphe ou None, int, bool)
+        Même convention que `kernel_vertex_cover_crown`.
+    """
+    if budget is not None and budget.expired():
+        return G.copy(), k, False
+
+    start = _measure(stats, G)
+    ones, zeros, lp_value = lp_half_integral_solution(G)
+    if stats is not None:  # Couplage maximum du double biparti (König : |M| = 2 · optimum)
+        stats.setdefault("matching", {})["lp"] = int(2 * lp_value)
+
+    # L'optimum du relâchement est une borne inférieure de la couverture minimale
+    if lp_value > k:
+        return None, 0, True
+
+    g = G.copy()
+    g.remove_nodes_from(ones | zeros)
+    _count(stats, "lp", g, start)
+    if trail is not None:
+        trail.extend(("cover", v) for v in ones)
+    return g, k - len(ones), False
+
+
+def lp_half_integral_solution(G: nx.Graph):
+    """
+    Solution demi-entière optimale du relâchement linéaire du vertex cover.
+
+    Le double biparti de G (copies gauche et droite de chaque sommet, arêtes (u, 0)-(v, 1)
+    et (v, 0)-(u, 1) pour chaque arête uv) est construit directement comme matrice CSR n × n
+    à partir des arêtes du graphe compact, sans graphe NetworkX intermédiaire. Le couplage
+    maximum est calculé par Hopcroft-Karp (`scipy.sparse.csgraph.maximum_bipartite_matching`)
+    et la couverture de König par un parcours alterné en largeur sur les tableaux CSR.
+
+    Retourne
+    --------
+    tuple (set, set, float)
+        - Les sommets à 1.
+        - Les sommets à 0.
+        - La valeur de l'optimum (les autres sommets valent ½).
+    """
+    g = as_compact_graph(G)
+    n = g.capacity
+    edges = g.edge_array()
+    rows = np.concatenate((edges[:, 0], edges[:, 1]))
+    cols = np.concatenate((edges[:, 1], edges[:, 0]))
+    double = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+
+    # right_match[j] : sommet gauche couplé au sommet droit j (-1 s'il est libre)
+    right_match = maximum_bipartite_matching(double, perm_type="row")
+    matched = right_match[right_match >= 0]
+
+    # König : Z = sommets atteints depuis les sommets gauches libres par des chemins alternés
+    # (arête quelconque de gauche à droite, arête du couplage de droite à gauche) ;
+    # couverture = (gauche - Z) ∪ (droite ∩ Z)
+    left_seen = np.zeros(n, dtype=bool)
+    right_seen = np.zeros(n, dtype=bool)
+    left_free = np.ones(n, dtype=bool)
+    left_free[matched] = False
+    front = np.flatnonzero(left_free)
+    left_seen[front] = True
+    while len(front):
+        right = np.unique(double.indices[_csr_positions(double.indptr, front)])
+        right = right[~right_seen[right]]
+        right_seen[right] = True
+        front = right_match[right]  # Tous couplés : le couplage est maximum
+        front = front[~left_seen[front]]
+        left_seen[front] = True
+
+    count = (~left_seen).astype(np.int8) + right_seen
+    alive = np.asarray(g._alive, dtype=bool)
+    ones = np.flatnonzero(alive & (count == 2))
+    zeros = np.flatnonzero(alive & (count == 0))
+    if isinstance(G, CompactGraph):
+        return set(ones.tolist()), set(zeros.tolist()), len(matched) / 2
+    return set(g.to_labels(ones.tolist())), set(g.to_labels(zeros.tolist())), len(matched) / 2
+
+
+def _csr_positions(indptr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Positions, dans le tableau `indices` d'une matrice CSR, des entrées des lignes `rows`."""
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(len(offsets))
+
+
+KERNELS = {
+    "crown": kernel_vertex_cover_crown,
+    "lp": kernel_vertex_cover_lp,
+}
+
+
+def kernel_vertex_cover(G: nx.Graph, k: int, kernel: str = "crown", algo: str = "degree", stats: dict = None,
+                        bitset_threshold: int = BITSET_THRESHOLD, budget=None, **options):
+    """
+    Calcule une couverture de taille ≤ k par kernelization puis branchement sur le noyau.
+
+    La couverture du noyau renvoyée par `find_vertex_cover` est relevée en une couverture
+    du graphe d'entrée par le journal de réduction (`lift_cover`), en temps linéaire en la
+    longueur du journal : le graphe d'origine n'est jamais résolu.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (non modifié).
+    k : int
+        Taille maximale du vertex cover recherché.
+    kernel : str
+        Kernelization utilisée (clé de `KERNELS`).
+    algo : str
+        Règle de branchement : "edge" ou "degree".
+    stats : dict, optionnel
+        Reçoit les statistiques de réduction puis de recherche, et la durée des phases
+        `time["kernel"]`, `time["search"]` et `time["lift"]`.
+    bitset_threshold : int
+        Un noyau d'au plus `bitset_threshold` sommets est résolu par le solveur par bits
+        (`bitset_solver`), plus rapide sur les petits graphes ; 0 pour toujours utiliser `algo`.
+    budget : Budget, optionnel
+        Limites de temps et de nœuds communes à la kernelization et au branchement.
+    **options
+        Options du moteur de branchement (bounds, interleave, crown_every, split_components,
+        table_size).
+
+    Retourne
+    --------
+    set, None ou Unknown
+        Une couverture de G de taille ≤ k, None s'il n'en existe pas, ou `Unknown` si le
+        budget est épuisé (statistiques partielles dans `stats`).
+    """
+    trail = []
+    with phase(stats, "kernel"):
+        ker_g, ker_k, no_inst = KERNELS[kernel](G, k, stats, trail, budget)
+    if no_inst:
+        return None
+    if budget is not None and budget.exceeded:
+        return unknown(budget.exceeded, stats)
+    cover = solve_kernel(ker_g, ker_k, algo, stats, bitset_threshold, budget, **options)
+    if cover is None or isinstance(cover, Unknown):
+        return cover
+    with phase(stats, "lift"):
+        return lift_cover(trail, cover)
+
+
+def solve_kernel(ker_g, ker_k: int, algo: str = "degree", stats: dict = None,
+                 bitset_threshold: int = BITSET_THRESHOLD, budget=None, **options):
+    """
+    Cherche une couverture de taille ≤ ker_k d'un noyau : solveur par bits jusqu'à
+    `bitset_threshold` sommets, branchement `algo` au-delà (mêmes paramètres que
+    `kernel_vertex_cover`). La couverture renvoyée est celle du noyau, non relevée.
+    """
+    if ker_g.number_of_nodes() <= bitset_threshold:
+        with phase(stats, "search"):
+            return bitset_vertex_cover(ker_g, ker_k, stats, budget)
+    return find_vertex_cover(ker_g, ker_k, algo, stats, budget=budget, **options)
+
+
+def select_solver(algo: str = None, workers: int = 1, size: int = None, order: str = "recursive"):
+    """
+    Moteur de branchement : séquentiel, ou parallèle sur `workers` processus si workers > 1.
+    Si aucun moteur n'est imposé (`algo` None), un graphe (noyau) d'au plus `BITSET_THRESHOLD`
+    sommets est confié au solveur par bits, et les autres au branchement sur une arête.
+    Avec `order` = "dfs" ou "best", le moteur itératif (pile explicite) remplace le moteur récursif.
+    """
+    if algo is None:
+        if size is not None and size <= BITSET_THRESHOLD:
+            return vcb_bitset
+        algo = "edge"
+    if algo == "bitset":  # Solveur séquentiel uniquement
+        return vcb_bitset
+    if workers > 1:
+        return partial(vcb_parallel, workers=workers, algo=algo)
+    if order != "recursive" and algo in ("edge", "degree"):
+        return partial(vcb_iterative, algo=algo, order=order)
+    return ALGORITHMS[algo]
+
+
+def auto_bitset_threshold(algo: str = None) -> int:
+    """Taille de noyau jusqu'à laquelle le solveur par bits est utilisé : 0 si `algo` est imposé."""
+    return BITSET_THRESHOLD if algo is None else 0
@@ -0,0 +1,194 @@
+"""
+Recherche d'une couverture de sommets minimale (version optimisation du problème).
+
+Plutôt que d'appeler la kernelization et le branchement pour k = 1, 2, ..., on applique
+une seule fois les réductions qui ne dépendent pas de k (degré 1 et 2, règles fortes,
+Nemhauser-Trotter), on encadre l'optimum entre une borne inférieure (couplage, relaxation
+linéaire) et une borne supérieure (couverture gloutonne), puis on parcourt l'écart entre
+les deux bornes, de façon incrémentale ou par dichotomie.
+
+Le noyau est lui aussi calculé une seule fois, pour la plus grande valeur de k essayée :
+la règle de haut degré (degré > k) ne retient alors que des sommets de degré supérieur à
+tous les k essayés, et les autres règles ne dépendent pas de k. Le noyau (G', k') vaut donc
+pour tout k plus petit, avec le paramètre k' - (K - k) ; tous les appels au solveur portent
+sur le même graphe et partagent la même table de transposition.
+"""
+import heapq
+import itertools
+import math
+import time
+
+import networkx as nx
+
+from .advanced_rules import strong_reductions, touched_since
+from .bounds import matching_bound
+from .bitset_solver import BITSET_THRESHOLD
+from .budget import Unknown, unknown
+from .graph_utils import remove_isolated_vertices
+from .kernel import KERNELS, lp_half_integral_solution, solve_kernel
+from .reduction_rules import degree_two_rule, lift_cover
+from .transposition import TranspositionTable
+
+
+def minimum_vertex_cover(G: nx.Graph, algo: str = "degree", search: str = "incremental", kernel: str = "crown",
+                         stats: dict = None, budget=None, bitset_threshold: int = BITSET_THRESHOLD,
+                         table_size: int = 0, **options) -> set:
+    """
+    Calcule une couverture de sommets de taille minimale.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (non modifié).
+    algo : str
+        Règle de branchement : "edge" ou "degree".
+    search : str
+        Parcours de l'écart entre les bornes :
+        - "incremental" : k croissant depuis la borne inférieure, la première réponse OUI
+          est l'optimum (seuls les appels NON, plus coûteux, précèdent la solution) ;
+        - "binary" : dichotomie, chaque réponse OUI ramenant la borne supérieure à la taille
+          de la couverture trouvée.
+    kernel : str
+        Kernelization appliquée une fois, pour le plus grand k essayé (clé de `kernel.KERNELS`).
+    stats : dict, optionnel
+        Reçoit `lower` et `upper` (bornes initiales), `calls` (nombre d'appels au solveur),
+        `time_per_k` (k -> secondes), `nodes_per_k` (k -> nœuds de recherche), `optimum`, et
+        les compteurs de réduction.
+    budget : Budget, optionnel
+        Limites de temps et de nœuds pour l'ensemble des appels au solveur. S'il est épuisé,
+        la meilleure couverture connue est renvoyée (sans garantie d'optimalité) :
+        `stats["status"]` donne la cause et `stats["gap"]` l'encadrement (borne inférieure,
+        taille de la couverture) atteint.
+    bitset_threshold : int
+        Un noyau d'au plus `bitset_threshold` sommets est résolu par le solveur par bits
+        (voir `kernel.kernel_vertex_cover`).
+    table_size : int
+        Taille de la table de transposition commune à tous les appels (0 : désactivée).
+    **options
+        Options du moteur de branchement (bounds, interleave, crown_every, split_components).
+
+    Retourne
+    --------
+    set
+        Une couverture de sommets minimale de G (la meilleure connue si le budget est épuisé).
+    """
+    stats = {} if stats is None else stats
+    g = G.copy()
+    trail = []
+    forced = independent_reductions(g, trail, stats)
+
+    # Encadrement de l'optimum du graphe réduit : après Nemhauser-Trotter, la relaxation
+    # linéaire du graphe restant vaut n / 2
+    best = greedy_vertex_cover(g)
+    lower = max(matching_bound(g), math.ceil(g.number_of_nodes() / 2))
+    stats["lower"] = lower + forced
+    stats["upper"] = len(best) + forced
+    stats["calls"] = 0
+    times = stats.setdefault("time_per_k", {})
+    nodes = stats.setdefault("nodes_per_k", {})
+
+    # Noyau commun à tous les appels, calculé pour le plus grand k essayé
+    top = len(best) - 1
+    ker_trail = []
+    ker_g, ker_k, no_inst = KERNELS[kernel](g, top, stats, ker_trail, budget) if lower <= top else (None, 0, True)
+    if budget is not None and budget.exceeded:
+        return _interrupted(unknown(budget.exceeded), stats, lower + forced, best, forced, trail)
+    shift = top - ker_k
+    table = TranspositionTable(table_size) if table_size else None
+
+    # Un NON pour k vaut pour tout k' < k, un OUI pour tout k' ≥ |couverture| : chaque
+    # réponse resserre l'encadrement et aucun k n'est résolu deux fois
+    def solve(k):
+        if no_inst or k < shift:
+            return None  # Aucune couverture de taille ≤ top, a fortiori ≤ k
+        start = time.perf_counter()
+        probe = {}
+        cover = solve_kernel(ker_g, k - shift, algo, probe, bitset_threshold, budget, table=table, **options)
+        times[k + forced] = times.get(k + forced, 0.0) + time.perf_counter() - start
+        nodes[k + forced] = nodes.get(k + forced, 0) + probe.get("nodes", 0)
+        stats["calls"] += 1
+        return cover if cover is None or isinstance(cover, Unknown) else lift_cover(ker_trail, cover)
+
+    low = lower
+    if search == "binary":
+        high = len(best)
+        while low < high:
+            mid = (low + high) // 2
+            cover = solve(mid)
+            if isinstance(cover, Unknown):
+                return _interrupted(cover, stats, low + forced, best, forced, trail)
+            if cover is None:
+                low = mid + 1
+            else:
+                best, high = cover, len(cover)
+    else:
+        for k in range(lower, len(best)):
+            cover = solve(k)
+            if isinstance(cover, Unknown):
+                return _interrupted(cover, stats, k + forced, best, forced, trail)
+            if cover is not None:
+                best = cover
+                break
+
+    stats["optimum"] = len(best) + forced
+    return lift_cover(trail, best)
+
+
+def _interrupted(result: Unknown, stats: dict, lower: int, best: set, forced: int, trail: list) -> set:
+    """Budget épuisé : renvoie la meilleure couverture connue et l'encadrement atteint."""
+    stats["status"] = result.reason
+    stats["gap"] = (lower, len(best) + forced)
+    return lift_cover(trail, best)
+
+
+def independent_reductions(G, trail: list = None, stats: dict = None) -> int:
+    """
+    Applique jusqu'à stabilisation les réductions valables pour tout k : sommets isolés,
+    degré 1 et 2 (repliement compris), règles fortes et Nemhauser-Trotter.
+
+    Retourne
+    --------
+    int
+        Nombre de sommets pris dans la couverture (diminution de l'optimum).
+    """
+    k = G.number_of_nodes()  # Budget fictif : aucune règle ne dépend de sa valeur
+    start = k
+    degrees = None  # Degrés à la fin du dernier appel des règles fortes
+    while True:
+        n = G.number_of_nodes()
+        remove_isolated_vertices(G)
+        k = degree_two_rule(G, k, trail=trail, stats=stats)
+        k = strong_reductions(G, k, trail, stats, None if degrees is None else touched_since(G, degrees))
+        degrees = dict(G.degree())
+
+        ones, zeros, _ = lp_half_integral_solution(G)
+        G.remove_nodes_from(ones | zeros)
+        k -= len(ones)
+        if trail is not None:
+            trail.extend(("cover", v) for v in ones)
+
+        if G.number_of_nodes() == n:
+            return start - k
+
+
+def greedy_vertex_cover(G) -> set:
+    """
+    Couverture gloutonne : prend à chaque étape un sommet de degré maximum (file de priorité
+    avec mise à jour paresseuse des degrés). Coût O(m log n).
+    """
+    degree = dict(G.degree())
+    tie = itertools.count()  # Départage des égalités sans comparer les sommets
+    heap = [(-d, next(tie), v) for v, d in degree.items() if d > 0]
+    heapq.heapify(heap)
+    cover = set()
+    while heap:
+        d, _, v = heapq.heappop(heap)
+        if v in cover or -d != degree[v]:
+            if v not in cover and degree[v] > 0:  # Entrée périmée : degré mis à jour
+                heapq.heappush(heap, (-degree[v], next(tie), v))
+            continue
+        cover.add(v)
+        for u in G.neighbors(v):
+            if u not in cover:
+                degree[u] -= 1
+    return cover
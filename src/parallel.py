@@ -0,0 +1,171 @@
+"""
+Exploration parallèle de l'arbre de recherche sur plusieurs cœurs.
+
+Le haut de l'arbre est développé en largeur jusqu'à obtenir assez de sous-problèmes
+indépendants (ensemble de sommets à supprimer, budget restant). Ceux-ci sont distribués
+dynamiquement à un pool de processus (chaque processus prend une nouvelle tâche dès qu'il
+a fini la précédente) et tous les processus sont arrêtés dès qu'un sous-problème répond OUI.
+"""
+import multiprocessing
+import os
+from collections import deque
+
+import networkx as nx
+
+from .budget import Unknown, unknown
+from .compact_graph import as_compact_graph
+from .vcb import _Search, min_cover_size_max_degree_two
+
+
+def vcb_parallel(G: nx.Graph, k: int, stats: dict = None, workers: int = None, algo: str = "edge",
+                 tasks_per_worker: int = 16, **options) -> "bool | Unknown":
+    """
+    Version parallèle de `vcb_recursive` / `vcb_degree`.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Le graphe d'entrée (non modifié).
+    k : int
+        Taille maximale autorisée du vertex cover.
+    stats : dict, optionnel
+        Reçoit `nodes` (somme des nœuds explorés par les processus, arbre initial compris),
+        `subproblems` et `solved_subproblems`.
+    workers : int, optionnel
+        Nombre de processus (par défaut le nombre de cœurs).
+    algo : str
+        Règle de branchement : "edge" ou "degree".
+    tasks_per_worker : int
+        Nombre cible de sous-problèmes par processus ; plus il est grand, mieux la charge
+        est répartie entre des sous-arbres de tailles très différentes.
+    **options
+        Options transmises au moteur de chaque processus (bounds, interleave, crown_every,
+        split_components, table_size, budget). Avec un `budget`, l'échéance est commune à
+        tous les processus, la limite de nœuds s'applique à chacun d'eux.
+
+    Retourne
+    --------
+    bool ou Unknown
+        True si un vertex cover de taille ≤ k existe, False sinon ; `Unknown` si le budget
+        est épuisé sans qu'un sous-problème ait trouvé de couverture. Comme `Unknown` refuse
+        la conversion en booléen (voir `budget.py`), tester `isinstance(result, Unknown)`
+        avant d'utiliser le résultat comme une condition.
+    """
+    workers = workers or os.cpu_count() or 1
+    g = as_compact_graph(G).copy()
+
+    frontier = split_search_tree(g, k, algo, workers * tasks_per_worker, stats)
+    if isinstance(frontier, bool):
+        return frontier
+    if stats is not None:
+        stats["subproblems"] = len(frontier)
+        stats["solved_subproblems"] = 0
+
+    if workers == 1:
+        _init_worker(g, algo, options)
+        results = map(_solve_subproblem, frontier)
+        return _collect(results, stats, options.get("budget"))
+
+    ctx = multiprocessing.get_context()
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(g, algo, options)) as pool:
+        # chunksize=1 : chaque processus tire une nouvelle tâche dès qu'il est libre
+        results = pool.imap_unordered(_solve_subproblem, frontier, chunksize=1)
+        found = _collect(results, stats, options.get("budget"))
+        pool.terminate()  # Arrêt immédiat des processus encore occupés
+    return found
+
+
+def split_search_tree(g, k: int, algo: str, count: int, stats: dict = None):
+    """
+    Développe en largeur le haut de l'arbre de recherche jusqu'à obtenir au moins `count`
+    sous-problèmes (tuple de sommets supprimés, budget restant).
+
+    Renvoie directement True/False si la réponse est trouvée pendant le développement
+    (feuille OUI rencontrée, ou toutes les branches épuisées).
+    """
+    frontier = deque([((), k)])
+    while frontier and len(frontier) < count:
+        deleted, budget = frontier.popleft()
+        if stats is not None:
+            stats["nodes"] = stats.get("nodes", 0) + 1
+
+        mark = g.mark()
+        g.remove_nodes_from(deleted)
+        children = _children(g, budget, algo)
+        g.undo(mark)
+
+        if children is True:
+            return True
+        frontier.extend((deleted + extra, b) for extra, b in children)
+
+    return list(frontier) if frontier else False
+
+
+def _children(g, k: int, algo: str):
+    """Branches issues du nœud courant (ou True si le nœud est une feuille OUI)."""
+    if k < 0:
+        return []
+
+    if algo == "edge":
+        edge = g.any_edge()
+        if edge is None:
+            return True
+        if k == 0:
+            return []
+        return [((x,), k - 1) for x in edge]
+
+    best = g.max_degree_vertex()
+    if best is None:
+        return True
+    v, d = best
+    if d <= 2:
+        return True if min_cover_size_max_degree_two(g) <= k else []
+    neighbors = g[v]
+    children = [((v,), k - 1)]
+    if len(neighbors) <= k:
+        children.append((tuple(neighbors), k - len(neighbors)))
+    return children
+
+
+def _collect(results, stats: dict = None, budget=None):
+    """
+    Consomme les résultats au fil de l'eau et s'arrête au premier OUI, ou dès que l'échéance
+    du budget est dépassée. Un sous-problème inconnu rend la réponse inconnue, sauf OUI.
+    """
+    reason = None
+    for found, nodes in results:
+        if stats is not None:
+            stats["nodes"] = stats.get("nodes", 0) + nodes
+            stats["solved_subproblems"] += 1
+        if isinstance(found, Unknown):
+            reason = found.reason
+        elif found:
+            return True
+        if budget is not None and budget.expired():
+            reason = budget.exceeded
+            break
+    return False if reason is None else unknown(reason, stats)
+
+
+# État propre à chaque processus : graphe (transmis une seule fois) et paramètres du moteur
+_worker = {}
+
+
+def _init_worker(g, algo: str, options: dict):
+    _worker["graph"] = g
+    _worker["algo"] = algo
+    _worker["options"] = options
+
+
+def _solve_subproblem(task):
+    """Résout un sous-problème (sommets supprimés, budget) sur le graphe du processus."""
+    deleted, k = task
+    g = _worker["graph"]
+    stats = {}
+    search = _Search(_worker["algo"], stats, **_worker["options"])
+
+    mark = g.mark()
+    g.remove_nodes_from(deleted)
+    found = search.run(g, k)
+    g.undo(mark)
+    return found, stats.get("nodes", 0)
@@ -0,0 +1,274 @@
+"""
+Lecture de graphes depuis des fichiers texte : PACE 2019 (.gr), DIMACS, METIS et listes
+d'arêtes, éventuellement compressés (gzip, extension .gz).
+
+Les fichiers sont lus par blocs de `BLOCK_SIZE` octets, coupés à la dernière fin de ligne.
+Chaque bloc est analysé de façon vectorisée avec NumPy (aucun objet Python par ligne) :
+- les lignes à ignorer (commentaires, lignes autres que les arêtes) sont retirées par une
+  expression régulière ;
+- les jetons (suites de caractères non blancs) sont repérés sur le tableau des octets ;
+  leurs valeurs sont converties par `np.fromstring` quand le bloc ne contient que des
+  chiffres, et calculées chiffre par chiffre sinon (poids décimaux, mots-clés) ; un jeton
+  qui contient autre chose que des chiffres ("-3", "a7") n'est accepté que dans une
+  colonne inutilisée, sinon la lecture échoue (ValueError donnant le fichier et la ligne) ;
+- chaque jeton reçoit son numéro de ligne et sa position dans la ligne, ce qui suffit à
+  extraire les colonnes utiles de tous les formats.
+
+Les arêtes sont écrites dans un tableau préalloué quand l'en-tête annonce leur nombre, puis
+passées à `CompactGraph.from_edges` : aucun `nx.Graph` intermédiaire n'est construit et la
+mémoire de travail d'un bloc est bornée, indépendamment de la taille du fichier.
+
+Formats (les sommets sont renumérotés à partir de 0) :
+- "pace" : lignes de commentaire "c ...", en-tête "p td n m", puis une arête "u v" par
+  ligne (sommets numérotés à partir de 1) ;
+- "dimacs" : commentaires "c ...", en-tête "p edge n m" (ou "p col n m"), arêtes "e u v"
+  (à partir de 1) ; les autres lignes sont ignorées ;
+- "metis" : commentaires "% ...", en-tête "n m [fmt [ncon]]", puis la ligne i donne les
+  voisins du sommet i (à partir de 1), précédés de la taille et des poids du sommet et
+  suivis du poids de chaque arête selon `fmt` ;
+- "edgelist" : une arête "u v" par ligne (colonnes supplémentaires ignorées), sommets
+  numérotés à partir de 0, commentaires "#", "%" ou "c" ; n vaut le plus grand sommet + 1.
+"""
+import gzip
+import os
+import re
+
+import numpy as np
+
+from .compact_graph import CompactGraph
+
+
+# Taille des blocs lus dans le fichier (en octets)
+BLOCK_SIZE = 1 << 22
+
+FORMATS = ("pace", "dimacs", "metis", "edgelist")
+
+# Lignes retirées de chaque bloc avant l'analyse, et premiers caractères qui les signalent
+# (None : expression toujours appliquée)
+_SKIPPED_LINES = {
+    "pace": (re.compile(rb"(?m)^[cp].*\n"), (b"c", b"p")),
+    "dimacs": (re.compile(rb"(?m)^[^e\n].*\n"), None),
+    "metis": (re.compile(rb"(?m)^%.*\n"), (b"%",)),
+    "edgelist": (re.compile(rb"(?m)^[#%c].*\n"), (b"#", b"%", b"c")),
+}
+
+# Extensions reconnues par `detect_format`
+EXTENSIONS = {".gr": "pace", ".dimacs": "dimacs", ".col": "dimacs", ".clq": "dimacs",
+               ".graph": "metis", ".metis": "metis"}
+
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+_WHITESPACE = np.zeros(256, dtype=bool)
+_WHITESPACE[list(b" \t\r\n\v\f")] = True
+_NUMERIC = b"0123456789 \t\r\n\v\f"
+
+
+def detect_format(path: str) -> str:
+    """Format déduit de l'extension du fichier (".gz" ignoré) ; "edgelist" par défaut."""
+    name = path[:-3] if path.endswith(".gz") else path
+    return EXTENSIONS.get(os.path.splitext(name)[1].lower(), "edgelist")
+
+
+def read_graph(path: str, fmt: str = None, block_size: int = BLOCK_SIZE) -> CompactGraph:
+    """
+    Lit un graphe depuis un fichier texte, sans passer par un `nx.Graph`.
+
+    Paramètres
+    ----------
+    path : str
+        Chemin du fichier (compressé gzip si son nom se termine par ".gz").
+    fmt : str, optionnel
+        Format du fichier (voir `FORMATS`) ; déduit de l'extension par défaut.
+    block_size : int
+        Taille des blocs lus dans le fichier.
+
+    Retourne
+    --------
+    CompactGraph
+        Le graphe lu (boucles ignorées, arêtes multiples fusionnées).
+    """
+    n, edges = read_edges(path, fmt, block_size)
+    return CompactGraph.from_edges(n, edges)
+
+
+def read_edges(path: str, fmt: str = None, block_size: int = BLOCK_SIZE):
+    """
+    Lit les arêtes d'un fichier texte.
+
+    Retourne
+    --------
+    tuple (int, np.ndarray)
+        Le nombre de sommets et le tableau (m, 2) des arêtes (indices à partir de 0).
+    """
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Format inconnu : {fmt} (attendu : {', '.join(FORMATS)})")
+
+    with _open(path) as f:
+        header = _read_header(f, fmt)
+        n, m = (header[0], header[1]) if header else (None, None)
+        if fmt == "metis":
+            m *= 2  # Chaque arête apparaît dans la liste des deux extrémités
+        edges = np.empty((m, 2), dtype=np.int64) if m is not None else None
+        parts, size, line = [], 0, 0
+        for tokens in _blocks(f, fmt, block_size):
+            try:
+                block, line = _block_edges(tokens, fmt, header, line)
+            except ValueError as error:
+                raise ValueError(f"{path} : {error}") from None
+            if edges is not None and size + len(block) <= len(edges):
+                edges[size:size + len(block)] = block
+            else:
+                # En-tête absent ou incorrect : accumulation des blocs
+                if edges is not None:
+                    parts.append(edges[:size])
+                    edges = None
+                parts.append(block)
+            size += len(block)
+
+    edges = edges[:size] if edges is not None else (np.concatenate(parts) if parts else
+                                                    np.empty((0, 2), dtype=np.int64))
+    if fmt == "edgelist":
+        n = int(edges.max()) + 1 if len(edges) else 0
+    elif len(edges) and (edges.min() < 0 or edges.max() >= n):
+        raise ValueError(f"{path} : sommet hors de l'intervalle 1..{n} annoncé par l'en-tête")
+    return n, edges
+
+
+def _open(path: str):
+    """Ouvre le fichier en binaire, en le décompressant à la volée si nécessaire."""
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _read_header(f, fmt: str):
+    """
+    Lit les lignes qui précèdent les arêtes jusqu'à l'en-tête inclus, et renvoie les
+    entiers de l'en-tête (None pour une liste d'arêtes, qui n'en a pas).
+    """
+    if fmt == "edgelist":
+        return None
+    comment = b"%" if fmt == "metis" else b"c"
+    for raw in iter(f.readline, b""):
+        words = raw.split()
+        if not words or raw.startswith(comment):
+            continue
+        if fmt == "metis":
+            return [int(w) for w in words]
+        if words[0] == b"p" and len(words) >= 4:
+            return [int(words[2]), int(words[3])]
+        raise ValueError(f"En-tête {fmt} attendu, lu : {raw[:80]!r}")
+    raise ValueError(f"Fichier {fmt} sans en-tête")
+
+
+def _blocks(f, fmt: str, block_size: int):
+    """
+    Découpe la suite du fichier en blocs de lignes complètes, débarrassés des lignes
+    ignorées, et renvoie pour chacun ses jetons (voir `_tokenize`).
+    """
+    skipped = _SKIPPED_LINES[fmt]
+    rest = b""
+    while True:
+        data = f.read(block_size)
+        if not data:
+            if rest:
+                yield _tokenize(_clean(skipped, rest + b"\n", fmt))
+            return
+        data = rest + data
+        cut = data.rfind(b"\n") + 1
+        if cut == 0:  # Ligne plus longue qu'un bloc
+            rest = data
+            continue
+        rest = data[cut:]
+        yield _tokenize(_clean(skipped, data[:cut], fmt))
+
+
+def _clean(skipped, chunk: bytes, fmt: str) -> bytes:
+    """Retire les lignes ignorées d'un bloc, ainsi que le mot-clé "e" des arêtes DIMACS."""
+    pattern, markers = skipped
+    if markers is None or any(chunk.startswith(c) or b"\n" + c in chunk for c in markers):
+        chunk = pattern.sub(b"", chunk)
+    return chunk.replace(b"e", b" ") if fmt == "dimacs" else chunk
+
+
+def _tokenize(chunk: bytes):
+    """
+    Jetons d'un bloc de lignes complètes.
+
+    Retourne
+    --------
+    tuple (np.ndarray, np.ndarray ou None, np.ndarray, np.ndarray, int)
+        Valeurs entières des jetons, masque des jetons qui ne sont pas des entiers (None si
+        le bloc ne contient que des chiffres), numéro de ligne de chaque jeton dans le bloc,
+        position de chaque jeton dans sa ligne et nombre de lignes du bloc.
+    """
+    b = np.frombuffer(chunk, dtype=np.uint8)
+    solid = ~_WHITESPACE[b]
+    starts = np.flatnonzero(solid & ~np.concatenate(([False], solid[:-1])))
+    newlines = np.flatnonzero(b == ord("\n"))
+
+    if not chunk.translate(None, _NUMERIC):
+        # Cas courant (chiffres et blancs uniquement) : conversion directe par NumPy
+        values, invalid = np.fromstring(chunk, dtype=np.int64, sep=" "), None
+    else:
+        values, invalid = _token_values(b, solid, starts)
+
+    lines = np.searchsorted(newlines, starts)
+    first = np.concatenate(([True], lines[1:] != lines[:-1]))
+    index = np.arange(len(starts))
+    column = index - np.maximum.accumulate(np.where(first, index, 0))
+    return values, invalid, lines, column, len(newlines)
+
+
+def _token_values(b: np.ndarray, solid: np.ndarray, starts: np.ndarray):
+    """
+    Valeurs entières de jetons quelconques : somme des chiffres pondérés par la puissance de
+    10 de leur rang. Renvoie aussi le masque des jetons contenant un autre caractère qu'un
+    chiffre, dont la valeur n'a pas de sens.
+    """
+    ends = np.flatnonzero(solid & ~np.concatenate((solid[1:], [False]))) + 1
+    positions = np.flatnonzero(solid)
+    is_start = np.zeros(len(b), dtype=bool)
+    is_start[starts] = True
+    first_char = np.flatnonzero(is_start[positions])
+    token = np.cumsum(is_start[positions]) - 1
+    digits = b[positions].astype(np.int64) - ord("0")
+    rank = np.minimum(ends[token] - 1 - positions, len(_POW10) - 1)
+    is_digit = (digits >= 0) & (digits <= 9)
+    weighted = np.where(is_digit, digits * _POW10[rank], 0)
+    if not len(starts):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+    return np.add.reduceat(weighted, first_char), np.add.reduceat(~is_digit, first_char) > 0
+
+
+def _block_edges(tokens, fmt: str, header, line: int):
+    """
+    Arêtes (indices à partir de 0) d'un bloc de jetons ; `line` est le numéro de la
+    première ligne du bloc (utile au format METIS). Renvoie aussi le numéro de ligne suivant.
+    Lève ValueError si un sommet n'est pas un entier positif.
+    """
+    values, invalid, lines, column, n_lines = tokens
+    if fmt == "metis":
+        code = f"{header[2]:03d}" if len(header) > 2 else "000"
+        size, vertex_weights, edge_weights = (int(c) for c in code[-3:])
+        ncon = header[3] if len(header) > 3 else 1
+        skip = size + ncon * vertex_weights
+        keep = (column >= skip) & ((column - skip) % (1 + edge_weights) == 0)
+        _check_vertices(invalid, keep, lines, line)
+        block = np.stack((line + lines[keep], values[keep] - 1), axis=1)
+        return block, line + n_lines
+
+    first, second = column == 0, column == 1
+    if first.sum() != second.sum():
+        bad = np.setdiff1d(lines[first], lines[second])[0]
+        raise ValueError(f"Ligne d'arête incomplète (ligne {line + bad + 1} après filtrage)")
+    _check_vertices(invalid, first | second, lines, line)
+    block = np.stack((values[first], values[second]), axis=1)
+    if fmt != "edgelist":
+        block -= 1
+    return block, line + n_lines
+
+
+def _check_vertices(invalid, used: np.ndarray, lines: np.ndarray, line: int):
+    """Lève ValueError si un jeton d'une colonne de sommets (`used`) n'est pas un entier."""
+    if invalid is not None and (invalid & used).any():
+        bad = lines[np.flatnonzero(invalid & used)[0]]
+        raise ValueError(f"Sommet non entier (ligne {line + bad + 1} après filtrage)")
@@ -1,19 +1,29 @@
 import networkx as nx
 
+from .instrumentation import count
 
-def high_degree_rule(G: nx.Graph, k: int) -> int:
+
+def high_degree_rule(G: nx.Graph, k: int, trail: list = None) -> int:
     """
     Applique la règle de réduction des sommets de haut degré :
     - Si un sommet v a un degré strictement supérieur à k, il doit obligatoirement
       appartenir à toute couverture de sommets de taille k.
     - Il est donc supprimé du graphe et k est décrémenté.
 
+    Un sommet de haut degré le reste après toute autre suppression (son degré baisse
+    d'au plus 1 quand k baisse de 1), le résultat ne dépend donc pas de l'ordre des
+    suppressions. Les degrés sont rangés par paquets et mis à jour incrémentalement :
+    quand k passe à k-1, seuls les sommets du paquet de degré k deviennent de haut degré.
+    Complexité totale O(n + m).
+
     Paramètres
     ----------
-    G : nx.Graph
+    G : nx.Graph ou CompactGraph
         Graphe d'entrée (modifié en place).
     k : int
         Valeur actuelle du paramètre k (taille maximale du vertex cover).
+    trail : list, optionnel
+        Journal de réduction complété par les sommets supprimés (voir `lift_cover`).
 
     Retourne
     --------
@@ -21,18 +31,194 @@ def high_degree_rule(G: nx.Graph, k: int) -> int:
         Nouvelle valeur de k après l'application des réductions.
     """
     degs = dict(G.degree())  # Dictionnaire des degrés des sommets
-    changed = True  # Indicateur pour suivre les modifications
+    buckets = {}  # Paquets : degré -> sommets de ce degré (pas encore de haut degré)
+    queue = []  # Sommets de haut degré en attente de suppression
+
+    for v, d in degs.items():
+        if d > k:
+            queue.append(v)
+        else:
+            buckets.setdefault(d, set()).add(v)
+
+    while queue:
+        v = queue.pop()
+        for u in G.neighbors(v):
+            d = degs[u]
+            degs[u] = d - 1
+            bucket = buckets.get(d)
+            if bucket is not None and u in bucket:  # u n'est pas encore en file
+                bucket.remove(u)
+                buckets.setdefault(d - 1, set()).add(u)
+        G.remove_node(v)  # Suppression du sommet
+        del degs[v]
+        if trail is not None:
+            trail.append(("cover", v))
+        k -= 1  # Ajustement du paramètre k
+
+        # Les sommets de degré k + 1 (ancien k) dépassent désormais le seuil
+        queue.extend(buckets.pop(k + 1, ()))
+
+    return k
+
+
+def degree_one_rule(G: nx.Graph, k: int, candidates=None, trail: list = None) -> int:
+    """
+    Applique la règle des sommets pendants :
+    - Si un sommet v est de degré 1, de voisin u, il existe une couverture optimale
+      contenant u (toute couverture contient u ou v, et u couvre au moins autant d'arêtes).
+    - u est donc supprimé du graphe (k est décrémenté), puis v, devenu isolé.
+
+    La règle est appliquée jusqu'à ce qu'il n'existe plus de sommet pendant ; seuls les
+    voisins des sommets supprimés sont réexaminés.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (modifié en place).
+    k : int
+        Valeur actuelle du paramètre k.
+    candidates : list, optionnel
+        Sommets à examiner (par défaut tous les sommets pendants). Permet une application
+        incrémentale après la suppression de quelques sommets ; la liste est consommée.
+    trail : list, optionnel
+        Journal de réduction complété par les sommets pris dans la couverture
+        (voir `lift_cover`).
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    if candidates is None:
+        candidates = [v for v, d in G.degree() if d == 1]
+
+    while candidates:
+        v = candidates.pop()
+        if v not in G or G.degree(v) != 1:
+            continue
+        k = _take_pendant(G, k, v, candidates, trail)
+
+    return k
+
 
-    while changed:
-        changed = False
-        for v in list(G.nodes()):
-            if degs[v] > k:  # Si un sommet a un degré > k, il doit être dans le vertex cover
-                G.remove_node(v)  # Suppression du sommet
-                k -= 1  # Ajustement du paramètre k
-                changed = True
-                break  # Redémarrer l'itération après modification
+def degree_two_rule(G: nx.Graph, k: int, candidates=None, trail: list = None, stats: dict = None) -> int:
+    """
+    Applique les règles des sommets de degré 1 et 2 jusqu'à stabilisation :
+    - Degré 1 : comme `degree_one_rule`, le voisin u du sommet pendant est pris.
+    - Degré 2, voisins u et w adjacents (triangle) : u et w sont pris, v est supprimé (k - 2).
+    - Degré 2, voisins u et w non adjacents (repliement) : u, v et w sont fusionnés en un
+      sommet unique adjacent à N(u) ∪ N(w) - {v}, et k diminue de 1. Une couverture optimale
+      contient soit v, soit u et w ; le sommet fusionné représente ce second choix.
+
+    Le sommet fusionné réutilise l'identifiant de v, ce qui évite de créer des sommets (le
+    repliement ajoute seulement des arêtes, journalisées dans le cas d'un `CompactGraph`).
+    La boucle est pilotée par une liste de travail : un sommet n'est réexaminé que si son
+    voisinage a changé. Chaque règle appliquée est enregistrée dans `trail`, ce qui permet
+    de reconstruire une couverture du graphe d'origine avec `lift_cover`.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe d'entrée (modifié en place).
+    k : int
+        Valeur actuelle du paramètre k.
+    candidates : list, optionnel
+        Sommets à examiner (par défaut tous les sommets de degré 1 ou 2) ; la liste est consommée.
+    trail : list, optionnel
+        Journal de réduction complété par les règles appliquées.
+    stats : dict, optionnel
+        `stats["applications"]` reçoit le nombre d'applications de chaque cas
+        ("pendant", "triangle", "fold").
+
+    Retourne
+    --------
+    new_k : int
+        Nouvelle valeur de k après l'application des réductions.
+    """
+    if candidates is None:
+        candidates = [v for v, d in G.degree() if d in (1, 2)]
+    pendant = triangle = fold = 0
 
-        if changed:
-            degs = dict(G.degree())  # Mise à jour des degrés après suppression
+    while candidates:
+        v = candidates.pop()
+        if v not in G:
+            continue
+        d = G.degree(v)
+        if d == 1:
+            k = _take_pendant(G, k, v, candidates, trail)
+            pendant += 1
+        elif d == 2:
+            u, w = G.neighbors(v)
+            if G.has_edge(u, w):  # Triangle : u et w appartiennent à la couverture
+                triangle += 1
+                candidates.extend(x for x in (*G.neighbors(u), *G.neighbors(w)) if x != v)
+                G.remove_nodes_from((u, w, v))
+                k -= 2
+                if trail is not None:
+                    trail.append(("cover", u))
+                    trail.append(("cover", w))
+            else:
+                fold += 1
+                merged = (set(G.neighbors(u)) | set(G.neighbors(w))) - {v}
+                G.remove_node(u)
+                G.remove_node(w)
+                for x in merged:
+                    G.add_edge(v, x)
+                k -= 1
+                candidates.extend(merged)
+                candidates.append(v)
+                if trail is not None:
+                    trail.append(("fold", v, (u, w), (v,)))
 
+    if stats is not None:
+        for case, applied in (("pendant", pendant), ("triangle", triangle), ("fold", fold)):
+            count(stats, "applications", applied, case)
     return k
+
+
+def _take_pendant(G, k: int, v, candidates: list, trail: list = None) -> int:
+    """Prend le voisin u du sommet pendant v dans la couverture, puis supprime v."""
+    u = next(iter(G.neighbors(v)))
+    candidates.extend(G.neighbors(u))  # Les voisins de u perdent une arête
+    G.remove_node(u)  # u appartient à la couverture
+    G.remove_node(v)  # v est désormais isolé
+    if trail is not None:
+        trail.append(("cover", u))
+    return k - 1
+
+
+def lift_cover(trail: list, cover) -> set:
+    """
+    Reconstruit une couverture du graphe d'origine à partir d'une couverture du graphe réduit.
+
+    Le journal est parcouru en sens inverse :
+    - ("cover", u) : u a été pris par une règle, il est ajouté ;
+    - ("fold", v, inside, outside) : si le sommet fusionné v est dans la couverture, il est
+      remplacé par les sommets de `inside`, sinon ceux de `outside` sont ajoutés (pour un
+      repliement de degré 2 : inside = (u, w), outside = (v,)).
+    Une couverture minimale du graphe réduit donne une couverture minimale du graphe d'origine.
+
+    Paramètres
+    ----------
+    trail : list
+        Journal rempli par les règles de réduction.
+    cover : iterable
+        Couverture du graphe réduit.
+
+    Retourne
+    --------
+    set
+        Couverture du graphe d'origine.
+    """
+    cover = set(cover)
+    for entry in reversed(trail):
+        if entry[0] == "cover":
+            cover.add(entry[1])
+        else:
+            _, v, inside, outside = entry
+            if v in cover:
+                cover.discard(v)
+                cover.update(inside)
+            else:
+                cover.update(outside)
+    return cover
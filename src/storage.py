@@ -0,0 +1,235 @@
+"""
+Format binaire des graphes et des noyaux, ouvert par projection en mémoire (`np.memmap`).
+
+Un fichier contient :
+- un en-tête de `HEADER_SIZE` octets : signature, version, taille des indices de voisins,
+  nombre de sommets n, nombre d'entrées de la liste des voisins, nombre d'étiquettes,
+  longueur du journal de réduction et paramètre k (-1 s'il n'y en a pas) ;
+- les tableaux CSR `offsets` (int64, n + 1 entrées) et `neighbors` (int32 ou int64) ;
+- éventuellement les étiquettes des sommets (int64) et le journal de réduction (int64).
+Chaque section commence à un multiple de 8 octets ; les entiers sont en petit-boutiste.
+
+À l'ouverture, `offsets` et `neighbors` sont projetés en lecture seule sans être copiés :
+le chargement est instantané et les processus qui ouvrent le même fichier partagent les
+mêmes pages du cache du système. Un `CompactGraph` chargé ainsi se sérialise (pickle) par
+le chemin de son fichier et non par ses tableaux : les processus d'un `Pool` (voir
+`parallel.py`) rouvrent le fichier au lieu d'en recevoir une copie. L'identité du fichier
+relevée à l'ouverture (`file_identity`) accompagne le chemin, et un fichier remplacé entre
+temps est refusé plutôt que de projeter silencieusement un autre graphe.
+
+Un noyau s'enregistre avec son paramètre réduit et le journal de `crown_reduction` : les
+sommets du noyau enregistré sont renumérotés de 0 à n'-1, et ses étiquettes donnent les
+sommets correspondants du graphe d'origine, ceux qu'emploie le journal. Une couverture du
+noyau rechargé se relève donc par `lift_cover(trail, kernel.to_labels(cover))`.
+
+Le fichier est écrit sous un nom temporaire du même répertoire puis renommé : un fichier
+existant n'est jamais laissé tronqué, et les graphes qui le projettent encore en mémoire
+gardent l'ancien contenu.
+"""
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from .compact_graph import CompactGraph, _index_dtype, as_compact_graph
+
+
+EXTENSION = ".vcg"
+MAGIC = b"VCKG"
+VERSION = 1
+HEADER_SIZE = 64
+
+# Signature, version, taille des indices, n, taille de neighbors, étiquettes, journal, k
+_HEADER = struct.Struct("<4sII5q")
+
+# Codes des entrées du journal de réduction
+_COVER, _FOLD = 0, 1
+
+
+def save_graph(path: str, G, k: int = None, trail: list = None):
+    """
+    Enregistre un graphe (ou un noyau) au format binaire.
+
+    Seuls les sommets et arêtes encore présents sont enregistrés. Les étiquettes
+    enregistrées sont celles des sommets de G : sommets d'un `nx.Graph`, étiquettes propres
+    d'un `CompactGraph` (composées avec les indices des sommets restants si des sommets ont
+    été supprimés, ce qui renumérote le graphe), indices d'origine pour un `CompactGraph`
+    sans étiquettes dont des sommets ont été supprimés. Le journal d'un `CompactGraph`
+    étiqueté, écrit en indices, est traduit en étiquettes.
+
+    Paramètres
+    ----------
+    path : str
+        Chemin du fichier créé.
+    G : nx.Graph ou CompactGraph
+        Graphe à enregistrer (sommets ou étiquettes entiers).
+    k : int, optionnel
+        Paramètre (réduit) associé au graphe.
+    trail : list, optionnel
+        Journal de réduction ("cover" / "fold") : sommets de G, ou indices pour un
+        `CompactGraph`.
+    """
+    g = as_compact_graph(G)
+    labels = None if g.labels is None else np.asarray(g.labels, dtype=np.int64)
+    if G is g and labels is not None:
+        trail = _relabel_trail(trail, g.labels)
+    if g.number_of_nodes() < g.capacity or g._extra:
+        alive = np.flatnonzero(g._alive)
+        index = np.empty(g.capacity, dtype=np.int64)
+        index[alive] = np.arange(len(alive))
+        g = CompactGraph.from_edges(len(alive), index[g.edge_array()])
+        labels = alive if labels is None else labels[alive]
+    offsets = g._offsets
+    neighbors = g._neighbors.astype(_index_dtype(g.capacity), copy=False)
+    trail = _encode_trail(trail)
+
+    fd, temporary = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, neighbors.itemsize, g.capacity, len(neighbors),
+                                 0 if labels is None else len(labels), len(trail),
+                                 -1 if k is None else k).ljust(HEADER_SIZE, b"\0"))
+            for array in (offsets, neighbors, labels, trail):
+                if array is not None and len(array):
+                    data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+                    data.tofile(f)
+                    f.write(b"\0" * (-data.nbytes % 8))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_graph(path: str) -> CompactGraph:
+    """
+    Ouvre un graphe enregistré par `save_graph`, sans copier ses tableaux CSR.
+
+    Retourne
+    --------
+    CompactGraph
+        Le graphe, dont les étiquettes sont celles enregistrées.
+    """
+    return load_kernel(path)[0]
+
+
+def load_kernel(path: str):
+    """
+    Ouvre un noyau enregistré par `save_graph`.
+
+    Retourne
+    --------
+    tuple (CompactGraph, int ou None, list)
+        Le graphe du noyau, le paramètre réduit (None s'il n'a pas été enregistré) et le
+        journal de réduction (liste vide s'il n'a pas été enregistré).
+    """
+    identity = file_identity(path)
+    header = read_header(path)
+    offsets, neighbors, labels, trail = _sections(path, header, "r")
+    g = CompactGraph(offsets, neighbors, None if labels is None else labels.tolist())
+    g._source = path, identity
+    return g, header["k"], _decode_trail(trail)
+
+
+def read_header(path: str) -> dict:
+    """
+    En-tête d'un fichier binaire, sous forme de dictionnaire (sans lire les tableaux) ;
+    `k` vaut None si aucun paramètre n'a été enregistré.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or raw[:4] != MAGIC:
+        raise ValueError(f"{path} n'est pas un graphe binaire (signature {MAGIC!r} attendue)")
+    _, version, itemsize, n, nnz, n_labels, trail, k = _HEADER.unpack_from(raw)
+    if version != VERSION:
+        raise ValueError(f"{path} : version {version} non prise en charge (attendue : {VERSION})")
+    return {"itemsize": itemsize, "n": n, "nnz": nnz, "labels": n_labels, "trail": trail,
+            "k": k if k >= 0 else None}
+
+
+def file_identity(path: str) -> tuple:
+    """
+    Identité d'un fichier : périphérique, inode, taille et date de modification (ns). Elle
+    change à chaque réécriture par `save_graph`, qui remplace le fichier par un nouveau.
+    """
+    st = os.stat(path)
+    return st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def map_csr(path: str, identity: tuple = None):
+    """
+    Projette en lecture seule les tableaux `offsets` et `neighbors` d'un fichier. Si
+    `identity` est fourni (voir `file_identity`), lève une ValueError lorsque le fichier
+    n'est plus celui qui avait été ouvert.
+    """
+    if identity is not None and file_identity(path) != tuple(identity):
+        raise ValueError(f"{path} a été remplacé ou modifié depuis son ouverture")
+    return _sections(path, read_header(path), "r")[:2]
+
+
+def _sections(path: str, header: dict, mode: str):
+    """
+    Tableaux du fichier : `offsets` et `neighbors` projetés en mémoire, étiquettes et
+    journal (None s'ils sont absents).
+    """
+    index_dtype = np.dtype(np.int32 if header["itemsize"] == 4 else np.int64).newbyteorder("<")
+    layout = ((np.dtype("<i8"), header["n"] + 1), (index_dtype, header["nnz"]),
+              (np.dtype("<i8"), header["labels"]), (np.dtype("<i8"), header["trail"]))
+    arrays, position = [], HEADER_SIZE
+    for dtype, size in layout:
+        arrays.append(np.memmap(path, dtype=dtype, mode=mode, offset=position, shape=(size,))
+                      if size else None)
+        position += size * dtype.itemsize + (-size * dtype.itemsize % 8)
+    offsets, neighbors, labels, trail = arrays
+    if neighbors is None:
+        neighbors = np.empty(0, dtype=index_dtype)
+    return offsets, neighbors, labels, trail
+
+
+def _encode_trail(trail: list):
+    """
+    Journal de réduction sous forme d'entiers : [0, u] pour ("cover", u), et
+    [1, v, len(inside), *inside, len(outside), *outside] pour ("fold", v, inside, outside).
+    """
+    words = []
+    for entry in trail or ():
+        if entry[0] == "cover":
+            words += (_COVER, entry[1])
+        else:
+            _, v, inside, outside = entry
+            words += (_FOLD, v, len(inside), *inside, len(outside), *outside)
+    return np.asarray(words, dtype=np.int64).reshape(-1)
+
+
+def _relabel_trail(trail: list, labels) -> list:
+    """Journal de réduction dont les sommets (indices) sont remplacés par leurs étiquettes."""
+    relabeled = []
+    for entry in trail or ():
+        if entry[0] == "cover":
+            relabeled.append(("cover", labels[entry[1]]))
+        else:
+            _, v, inside, outside = entry
+            relabeled.append(("fold", labels[v], tuple(labels[u] for u in inside),
+                              tuple(labels[u] for u in outside)))
+    return relabeled
+
+
+def _decode_trail(words) -> list:
+    """Inverse de `_encode_trail`."""
+    trail = []
+    if words is None:
+        return trail
+    words = words.tolist()
+    i = 0
+    while i < len(words):
+        if words[i] == _COVER:
+            trail.append(("cover", words[i + 1]))
+            i += 2
+            continue
+        v, size = words[i + 1], words[i + 2]
+        inside = tuple(words[i + 3:i + 3 + size])
+        i += 3 + size
+        outside = tuple(words[i + 1:i + 1 + words[i]])
+        i += 1 + words[i]
+        trail.append(("fold", v, inside, outside))
+    return trail
@@ -0,0 +1,83 @@
+"""
+Table de transposition pour le branchement : mémorise les réponses des sous-problèmes déjà
+résolus, car des ordres de branchement différents atteignent souvent le même ensemble de
+sommets restants (prendre u puis v, ou v puis u).
+
+Un sous-problème est identifié par l'empreinte de Zobrist du graphe courant (voir
+`CompactGraph.enable_fingerprint`) : pendant la recherche, le graphe ne subit que des
+suppressions de sommets, donc l'ensemble des sommets présents détermine le sous-graphe.
+Pour chaque empreinte, la table conserve deux budgets :
+- `fail` : le plus grand budget pour lequel la recherche a échoué (échec pour tout k ≤ fail) ;
+- `success` : le plus petit budget pour lequel une couverture a été trouvée (succès pour
+  tout k ≥ success).
+"""
+from collections import OrderedDict
+
+
+# Nombre d'entrées par défaut (environ 200 octets par entrée)
+TABLE_SIZE = 1 << 16
+
+
+class TranspositionTable:
+    """
+    Table de taille bornée, avec éviction de l'entrée la moins récemment utilisée (LRU).
+
+    Paramètres
+    ----------
+    capacity : int
+        Nombre maximal d'entrées.
+
+    Attributs
+    ---------
+    hits, misses, evictions : int
+        Consultations ayant donné une réponse, consultations sans réponse, entrées évincées.
+    """
+
+    def __init__(self, capacity: int = TABLE_SIZE):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # empreinte -> [fail, success]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: int, k: int):
+        """
+        Réponse connue pour le sous-problème `key` avec le budget k : True, False, ou None
+        si les budgets mémorisés ne permettent pas de conclure.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            if k <= entry[0]:
+                self.hits += 1
+                return False
+            if entry[1] is not None and k >= entry[1]:
+                self.hits += 1
+                return True
+        self.misses += 1
+        return None
+
+    def store(self, key: int, k: int, found: bool):
+        """Enregistre la réponse `found` obtenue pour le sous-problème `key` avec le budget k."""
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = [-1, None]
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self.entries.move_to_end(key)
+        if found:
+            entry[1] = k if entry[1] is None else min(entry[1], k)
+        else:
+            entry[0] = max(entry[0], k)
+
+    def report(self, stats: dict):
+        """Ajoute les compteurs de la table à `stats["table"]`."""
+        table = stats.setdefault("table", {})
+        for name, value in (("hits", self.hits), ("misses", self.misses), ("evictions", self.evictions)):
+            table[name] = table.get(name, 0) + value
+        table["entries"] = len(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
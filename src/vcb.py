@@ -1,46 +1,470 @@
 import networkx as nx
 
+from .bitset_solver import bitset_vertex_cover, vcb_bitset
+from .budget import BudgetExceeded, Unknown, unknown
+from .bounds import matching_bound, prune_by_bounds, resolve_bounds
+from .compact_graph import CompactGraph, as_compact_graph
+from .crown_decomp import crown_decomposition
+from .graph_utils import remove_isolated_vertices
+from .instrumentation import phase, record_max
+from .reduction_rules import degree_one_rule
+from .transposition import TranspositionTable
 
-def vcb_recursive(G: nx.Graph, k: int) -> bool:
+
+def vcb_recursive(G: nx.Graph, k: int, stats: dict = None, bounds=(), interleave: bool = False,
+                  crown_every: int = 0, split_components: bool = False, table_size: int = 0, budget=None):
     """
     Algorithme récursif de branchement pour le problème du Vertex Cover.
     Détermine si le graphe G possède une couverture de sommets de taille ≤ k.
 
+    Le graphe est converti une seule fois en `CompactGraph` ; la recherche supprime ensuite
+    les sommets en place et les restaure au retour arrière grâce au journal d'annulation
+    du graphe compact, sans aucune copie par nœud de l'arbre de recherche.
+
     Paramètres
     ----------
-    G : nx.Graph
-        Le graphe d'entrée.
+    G : nx.Graph ou CompactGraph
+        Le graphe d'entrée (non modifié).
     k : int
         Taille maximale autorisée du vertex cover.
+    stats : dict, optionnel
+        Si fourni, `stats["nodes"]` est incrémenté à chaque nœud de l'arbre de recherche,
+        `stats["max_depth"]` reçoit la profondeur maximale atteinte et `stats["time"]["search"]`
+        la durée de la recherche ; les statistiques de chaque borne y sont accumulées (voir
+        `prune_by_bounds`).
+    bounds : iterable, optionnel
+        Bornes inférieures évaluées à chaque nœud (noms de `bounds.LOWER_BOUNDS` ou
+        fonctions G -> int) ; le sous-arbre est coupé dès qu'une borne dépasse k.
+    interleave : bool, optionnel
+        Si True, les réductions peu coûteuses (sommets isolés, haut degré, degré 1) sont
+        réappliquées à chaque nœud ; `stats["reductions"]` compte les sommets supprimés par règle.
+    crown_every : int, optionnel
+        Avec `interleave`, applique aussi la décomposition en couronne tous les
+        `crown_every` niveaux (0 : jamais).
+    split_components : bool, optionnel
+        Si True, dès que le graphe courant (à la racine ou après des suppressions) n'est pas
+        connexe, chaque composante est résolue séparément pour sa couverture minimale et
+        les budgets sont additionnés : l'arbre de recherche devient une somme et non plus
+        un produit d'arbres. `stats["components"]` compte ces décompositions.
+    table_size : int, optionnel
+        Si non nul, les sous-problèmes résolus sont mémorisés dans une table de
+        transposition d'au plus `table_size` entrées (voir `transposition.py`) ;
+        `stats["table"]` reçoit les succès, échecs et évictions de la table.
+    budget : Budget, optionnel
+        Limites de temps et de nœuds (voir `budget.py`), débitées à chaque nœud.
 
     Retourne
     --------
-    bool
-        True si un vertex cover de taille ≤ k existe, False sinon.
+    bool ou Unknown
+        True si un vertex cover de taille ≤ k existe, False sinon ; `Unknown` si le budget
+        est épuisé avant la fin (`stats["status"]` en donne la cause).
     """
-    # Si k devient négatif, il est impossible d'avoir une couverture valide
-    if k < 0:
-        return False
+    search = _Search("edge", stats, bounds, interleave, crown_every, split_components, table_size, budget)
+    return search.run(as_compact_graph(G).copy(), k)
 
-    # Si le graphe n'a plus d'arêtes, alors tout ensemble de sommets est un vertex cover
-    if G.number_of_edges() == 0:
-        return True
 
-    # Si k est nul mais qu'il reste des arêtes, alors aucun vertex cover valide n'existe
-    if k == 0:
-        return G.number_of_edges() == 0
+def vcb_degree(G: nx.Graph, k: int, stats: dict = None, bounds=(), interleave: bool = False,
+               crown_every: int = 0, split_components: bool = False, table_size: int = 0, budget=None):
+    """
+    Branchement amélioré sur un sommet de degré maximum (Cygan et al. p. 53).
+
+    - Si le degré maximum est ≤ 2, le graphe est une union de chemins et de cycles :
+      la taille d'une couverture minimale se calcule en temps polynomial.
+    - Sinon, on branche sur un sommet v de degré ≥ 3 : soit v est dans la couverture
+      (k - 1), soit tous ses voisins le sont (k - |N(v)|). La seconde branche est
+      abandonnée lorsque |N(v)| > k.
+
+    La récurrence T(k) = T(k - 1) + T(k - 3) donne un arbre de taille O(1.4656^k).
+    Même interface que `vcb_recursive` (statistiques, bornes, réductions et composantes comprises).
+    """
+    search = _Search("degree", stats, bounds, interleave, crown_every, split_components, table_size, budget)
+    return search.run(as_compact_graph(G).copy(), k)
+
+
+def find_vertex_cover(G: nx.Graph, k: int, algo: str = "degree", stats: dict = None, **options):
+    """
+    Recherche une couverture de sommets de taille ≤ k et renvoie le témoin.
+
+    Même recherche que `vcb_recursive` / `vcb_degree` : les sommets pris à chaque nœud
+    (branches, réductions entrelacées, feuilles de degré ≤ 2, composantes) sont empilés
+    dans une pile tronquée au retour arrière ; à la première feuille OUI, la pile contient
+    exactement la couverture.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Le graphe d'entrée (non modifié).
+    k : int
+        Taille maximale autorisée du vertex cover.
+    algo : str
+        Moteur : "edge", "degree" ou "bitset" (voir `ALGORITHMS`).
+    stats : dict, optionnel
+        Statistiques de recherche (voir `vcb_recursive`).
+    **options
+        Options du moteur (bounds, interleave, crown_every, split_components, table_size, budget),
+        et `table` : une `TranspositionTable` conservée d'un appel à l'autre sur le même graphe
+        (les échecs mémorisés pour un k restent valables pour tout k plus petit).
+
+    Retourne
+    --------
+    set, None ou Unknown
+        Une couverture de taille ≤ k (sommets de G), None s'il n'en existe pas, ou `Unknown`
+        si le budget est épuisé.
+    """
+    if algo == "bitset":
+        return bitset_vertex_cover(G, k, stats, options.get("budget"))
+    search = _Search(algo, stats, witness=True, **options)
+    g = as_compact_graph(G).copy()
+    # Le témoin est construit en indices du graphe compact : les étiquettes des composantes
+    # renvoient alors directement à ces indices
+    labels, g.labels = g.labels, None
+    found = search.run(g, k)
+    if isinstance(found, Unknown):
+        return found
+    if not found:
+        return None
+    if isinstance(G, CompactGraph) or labels is None:
+        return set(search.cover)
+    return {labels[v] for v in search.cover}
+
+
+class _Search:
+    """
+    Paramètres et statistiques partagés par tous les nœuds d'une recherche.
+    Le graphe g est modifié en place par les branches puis restauré dans son état initial.
+    Avec `witness`, les sommets pris dans la couverture sont empilés dans `cover`
+    (étiquettes des composantes, c'est-à-dire sommets du graphe de départ).
+    Avec `table_size`, chaque nœud passe d'abord par la table de transposition (ou par
+    `table`, table partagée entre plusieurs recherches sur le même graphe) ; avec `budget`,
+    chaque nœud est débité et la recherche s'interrompt quand il est épuisé.
+    """
+
+    def __init__(self, engine, stats=None, bounds=(), interleave=False, crown_every=0, split_components=False,
+                 table_size=0, budget=None, witness=False, table=None):
+        self.engine = self.branch_on_edge if engine == "edge" else self.branch_on_degree
+        if table is None and table_size:
+            table = TranspositionTable(table_size)
+        self.table = table
+        self.branch = self.memoized if self.table is not None else self.engine
+        self.budget = budget
+        self.stats = stats
+        self.bounds = resolve_bounds(bounds)
+        self.interleave = interleave
+        self.crown_every = crown_every
+        self.split_components = split_components
+        self.cover = [] if witness else None
+
+    def run(self, g, k: int):
+        """
+        Lance la recherche depuis la racine g (empreinte activée si la table est utilisée).
+        Renvoie `Unknown` si le budget est épuisé ; g reste alors dans un état quelconque.
+        """
+        if self.table is not None:
+            g.enable_fingerprint()
+        try:
+            with phase(self.stats, "search"):
+                found = self.branch(g, k)
+        except BudgetExceeded as exc:
+            found = unknown(exc.reason, self.stats)
+        if self.table is not None and self.stats is not None:
+            self.table.report(self.stats)
+        return found
+
+    def memoized(self, g, k: int, touched=None, depth: int = 0) -> bool:
+        """
+        Consulte la table de transposition avant d'explorer le nœud, puis y enregistre la
+        réponse. Avec `witness`, seuls les échecs mémorisés sont réutilisables (un succès
+        mémorisé ne fournit pas la couverture).
+        """
+        key = g.fingerprint
+        found = self.table.lookup(key, k)
+        if found is False or (found and self.cover is None):
+            return found
+        found = self.engine(g, k, touched, depth)
+        self.table.store(key, k, found)
+        return found
+
+    def take(self, g, vertices):
+        """Supprime des sommets pris dans la couverture (et les empile avec `witness`)."""
+        for v in vertices:
+            g.remove_node(v)
+        if self.cover is not None:
+            self.cover.extend(g.to_labels(vertices))
+
+    def record(self, g, vertices):
+        """Empile dans le témoin des sommets de g pris dans la couverture."""
+        if self.cover is not None:
+            self.cover.extend(g.to_labels(vertices))
+
+    def mark(self, g):
+        """Point de retour : positions dans le journal du graphe et dans le témoin."""
+        return g.mark(), len(self.cover) if self.cover is not None else 0
+
+    def undo(self, g, mark):
+        """Revient au point `mark` : restaure le graphe et tronque le témoin."""
+        g.undo(mark[0])
+        if self.cover is not None:
+            del self.cover[mark[1]:]
+
+    def enter(self, g, k: int, touched, depth: int):
+        """
+        Traitement commun à l'entrée d'un nœud : comptage, réductions entrelacées.
+        Renvoie le budget restant (négatif si le nœud est un échec).
+        """
+        if self.stats is not None:
+            self.stats["nodes"] = self.stats.get("nodes", 0) + 1
+            record_max(self.stats, "max_depth", depth)
+        if self.budget is not None:
+            self.budget.charge()
+        if self.interleave and k >= 0:
+            k = self.reduce(g, k, touched, depth)
+        return k
+
+    def reduce(self, g, k: int, touched, depth: int) -> int:
+        """
+        Réapplique les réductions sur le graphe courant. Seuls les sommets voisins des
+        suppressions (`touched`, ou tous les sommets si None) sont réexaminés pour la règle
+        de degré 1 ; la règle de haut
+        degré s'appuie sur le degré maximum, calculé de façon vectorisée. Les suppressions
+        passent par le journal du graphe et sont donc annulées au retour arrière.
+        """
+        before = g.number_of_nodes()
+        candidates = [v for v, d in g.degree() if d == 1] if touched is None else list(touched)
+        high = 0
+        while k >= 0:
+            best = g.max_degree_vertex()
+            if best is None:
+                break
+            v, d = best
+            if d > k:  # Règle de haut degré
+                candidates.extend(g.neighbors(v))
+                self.take(g, (v,))
+                k -= 1
+                high += 1
+                continue
+            taken = [] if self.cover is not None else None
+            new_k = degree_one_rule(g, k, candidates, taken)
+            if taken:
+                self.record(g, [u for _, u in taken])
+            if new_k == k:
+                break
+            k = new_k
+        removed = before - g.number_of_nodes()
+
+        n = g.number_of_nodes()
+        remove_isolated_vertices(g)
+        isolated = n - g.number_of_nodes()
+
+        crown = 0
+        if self.crown_every and k >= 0 and depth % self.crown_every == 0 and g.number_of_edges():
+            c, h, no_inst = crown_decomposition(g, k, self.stats)
+            if no_inst:
+                k = -1
+            elif c:
+                g.remove_nodes_from(c)
+                self.take(g, h)
+                k -= len(h)
+                crown = len(c) + len(h)
+
+        if self.stats is not None:
+            reductions = self.stats.setdefault("reductions", {})
+            for rule, count in (("high_degree", high), ("degree_one", removed - high),
+                                ("isolated", isolated), ("crown", crown)):
+                reductions[rule] = reductions.get(rule, 0) + count
+        return k
+
+    def pruned(self, g, k: int) -> bool:
+        """Élagage : une borne inférieure dépasse le budget restant."""
+        return bool(self.bounds) and prune_by_bounds(g, k, self.bounds, self.stats)
 
-    # Sélection d'une arête (u, v) arbitraire
-    u, v = next(iter(G.edges()))
+    def split(self, g, k: int, depth: int):
+        """
+        Si le graphe courant n'est pas connexe, résout ses composantes indépendamment et
+        renvoie la réponse ; renvoie None si le graphe est connexe.
+        """
+        parts = g.component_subgraphs()
+        if len(parts) <= 1:
+            return None
+        if self.stats is not None:
+            self.stats["components"] = self.stats.get("components", 0) + 1
 
-    # Première branche : Suppression du sommet u et exploration avec k-1
-    g1 = G.copy()
-    g1.remove_node(u)
-    if vcb_recursive(g1, k - 1):
+        # Plus petites composantes d'abord ; chaque composante réserve sa borne inférieure,
+        # la marge restante est partagée, ce qui permet un échec rapide.
+        parts.sort(key=lambda p: p.number_of_nodes())
+        lower = [matching_bound(p) for p in parts]
+        slack = k - sum(lower)
+        if slack < 0:
+            return False
+        for part, low in zip(parts, lower):
+            size = self.min_cover_size(part, low, low + slack, depth)
+            if size is None:
+                return False
+            slack -= size - low
         return True
 
-    # Deuxième branche : Suppression du sommet v et exploration avec k-1
-    g2 = G.copy()
-    g2.remove_node(v)
+    def min_cover_size(self, g, low: int, high: int, depth: int):
+        """
+        Plus petit budget j ∈ [low, high] pour lequel g admet une couverture, sinon None.
+        Avec `witness`, la couverture trouvée reste dans le témoin.
+        """
+        mark = self.mark(g)
+        for j in range(low, high + 1):
+            found = self.branch(g, j, None, depth)
+            if found:
+                g.undo(mark[0])  # Annule les réductions appliquées à la racine de la composante
+                return j
+            self.undo(g, mark)
+        return None
+
+    def branch_on_edge(self, g, k: int, touched=None, depth: int = 0) -> bool:
+        """
+        Branchement sur une arête (u, v) : u ou v appartient à la couverture.
+        """
+        k = self.enter(g, k, touched, depth)
+
+        # Si k devient négatif, il est impossible d'avoir une couverture valide
+        if k < 0:
+            return False
+
+        # Si le graphe n'a plus d'arêtes, alors tout ensemble de sommets est un vertex cover
+        edge = g.any_edge()
+        if edge is None:
+            return True
+
+        # Si k est nul mais qu'il reste des arêtes, alors aucun vertex cover valide n'existe
+        if k == 0 or self.pruned(g, k):
+            return False
+
+        if self.split_components:
+            found = self.split(g, k, depth)
+            if found is not None:
+                return found
+
+        mark = self.mark(g)
+        for x in edge:
+            # Branche : suppression du sommet x, exploration avec k-1, puis restauration
+            touched = g[x] if self.interleave else ()
+            self.take(g, (x,))
+            found = self.branch(g, k - 1, touched, depth + 1)
+            if found:
+                g.undo(mark[0])  # Le témoin est conservé
+                return True
+            self.undo(g, mark)
+
+        return False
+
+    def branch_on_degree(self, g, k: int, touched=None, depth: int = 0) -> bool:
+        """
+        Branchement sur un sommet de degré maximum ≥ 3 (v ou N(v) dans la couverture).
+        """
+        k = self.enter(g, k, touched, depth)
+        if k < 0:
+            return False
+
+        best = g.max_degree_vertex()
+        if best is None:
+            return True
+
+        v, d = best
+        if d <= 2:
+            # Chemins et cycles : résolution exacte en temps linéaire
+            if self.cover is None:
+                return min_cover_size_max_degree_two(g) <= k
+            cover = min_cover_max_degree_two(g)
+            if len(cover) > k:
+                return False
+            self.record(g, cover)
+            return True
+
+        if self.pruned(g, k):
+            return False
+
+        if self.split_components:
+            found = self.split(g, k, depth)
+            if found is not None:
+                return found
+
+        mark = self.mark(g)
+
+        # Première branche : v dans la couverture
+        touched = g[v] if self.interleave else ()
+        self.take(g, (v,))
+        found = self.branch(g, k - 1, touched, depth + 1)
+        if found:
+            g.undo(mark[0])  # Le témoin est conservé
+            return True
+        self.undo(g, mark)
+
+        # Seconde branche : N(v) dans la couverture, impossible si |N(v)| > k
+        neighbors = g[v]
+        if len(neighbors) > k:
+            return False
+        touched = [w for u in neighbors for w in g.neighbors(u)] if self.interleave else ()
+        self.take(g, neighbors)
+        found = self.branch(g, k - len(neighbors), touched, depth + 1)
+        if found:
+            g.undo(mark[0])  # Le témoin est conservé
+        else:
+            self.undo(g, mark)
+
+        return found
+
+
+def min_cover_size_max_degree_two(G) -> int:
+    """
+    Taille d'une couverture minimale d'un graphe de degré maximum ≤ 2.
+
+    Chaque composante est un chemin ou un cycle :
+    - un chemin à p sommets demande ⌊p/2⌋ sommets ;
+    - un cycle à c sommets demande ⌈c/2⌉ sommets.
+
+    Paramètres
+    ----------
+    G : nx.Graph ou CompactGraph
+        Graphe dont tous les sommets sont de degré ≤ 2.
+
+    Retourne
+    --------
+    int
+        Taille d'une couverture de sommets minimale.
+    """
+    return len(min_cover_max_degree_two(G))
+
+
+def min_cover_max_degree_two(G) -> list:
+    """
+    Couverture minimale d'un graphe de degré maximum ≤ 2 : un sommet sur deux le long de
+    chaque chemin (en partant du deuxième) ou de chaque cycle (en partant du premier).
+    """
+    cover = []
+    visited = set()
+
+    # Les chemins sont parcourus depuis l'une de leurs extrémités (degré 1)
+    for v, d in G.degree():
+        if d == 1 and v not in visited:
+            cover.extend(_walk(G, v, visited)[1::2])
+
+    # Les sommets de degré 2 restants appartiennent à des cycles
+    for v, d in G.degree():
+        if d == 2 and v not in visited:
+            cover.extend(_walk(G, v, visited)[0::2])
+
+    return cover
+
+
+def _walk(G, start, visited: set) -> list:
+    """Parcourt la composante (chemin ou cycle) de start et renvoie ses sommets dans l'ordre."""
+    order = []
+    v = start
+    while v is not None:
+        visited.add(v)
+        order.append(v)
+        v = next((u for u in G.neighbors(v) if u not in visited), None)
+    return order
+
 
-    return vcb_recursive(g2, k - 1)
+ALGORITHMS = {
+    "edge": vcb_recursive,
+    "degree": vcb_degree,
+    "bitset": vcb_bitset,
+}
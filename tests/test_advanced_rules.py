@@ -0,0 +1,130 @@
+import unittest
+from itertools import combinations
+import networkx as nx
+from src.advanced_rules import (_dominated_neighbor, dominance_rule, is_unconfined, strong_reductions, touched_since,
+                                twin_rule, unconfined_rule)
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.kernel import kernel_vertex_cover_crown
+from src.reduction_rules import lift_cover
+from src.vcb import vcb_degree
+
+
+class TestAdvancedRules(unittest.TestCase):
+    """
+    Suite de tests unitaires pour les règles de domination, de jumeaux et de sommets non confinés.
+    """
+
+    def test_dominance_clique(self):
+        """
+        Vérifie la règle de domination sur une clique K4 : tout sommet domine ses voisins,
+        trois sommets sont pris et k diminue de 3 ; puis que le voisin dominé trouvé sur des
+        graphes aléatoires est conforme à la définition.
+        """
+        g = nx.complete_graph(4)
+        k = dominance_rule(g, 5)
+        self.assertEqual(k, 2)
+        self.assertEqual(g.number_of_edges(), 0)
+
+        # Recherche du voisin dominé conforme à la définition N[u] ⊆ N[v]
+        for seed in range(5):
+            g = nx.gnm_random_graph(40, 150, seed=seed)
+            g.add_edges_from((0, u) for u in range(40, 45))  # Feuilles dominées par 0
+            for graph in (g, CompactGraph.from_networkx(g)):
+                for v in graph.nodes():
+                    closed = set(graph.neighbors(v)) | {v}
+                    expected = {u for u in graph.neighbors(v) if set(graph.neighbors(u)) | {u} <= closed}
+                    u = _dominated_neighbor(graph, v)
+                    self.assertEqual(u is None, not expected)
+                    self.assertTrue(u is None or u in expected)
+
+    def test_twin_fold_and_lift(self):
+        """
+        Vérifie le repliement de deux jumeaux de degré 3 dont le voisinage est indépendant.
+        - k diminue de 2 et la couverture reconstruite est valide et minimale.
+        """
+        original = nx.Graph([(u, x) for u in ("u", "v") for x in "abc"])
+        original.add_edges_from([("a", "x"), ("b", "y"), ("c", "z"), ("x", "y"), ("y", "z")])
+        for g in (original.copy(), CompactGraph.from_networkx(original)):
+            trail = []
+            k = twin_rule(g, 10, trail=trail)
+            self.assertEqual(k, 8)
+            self.assertEqual(g.number_of_nodes(), original.number_of_nodes() - 4)
+
+            reduced = g if isinstance(g, nx.Graph) else g.to_networkx()
+            size = next(j for j in range(10) if vcb_degree(reduced, j))
+            cover = next(c for c in _covers(reduced, size))
+            if not isinstance(g, nx.Graph):  # Retour aux indices du graphe compact
+                cover = [g.labels.index(x) for x in cover]
+            lifted = lift_cover(trail, cover)
+            if not isinstance(g, nx.Graph):
+                lifted = g.to_labels(lifted)
+            self.assertTrue(is_vertex_cover(original, lifted))
+            self.assertEqual(len(lifted), size + 2)
+
+    def test_unconfined(self):
+        """
+        Vérifie la détection des sommets non confinés.
+        - Le centre d'une étoile est non confiné, ses feuilles sont confinées.
+        - Sur un cycle de longueur 4, aucun sommet n'est non confiné.
+        """
+        star = nx.star_graph(4)
+        self.assertTrue(is_unconfined(star, 0))
+        self.assertFalse(is_unconfined(star, 1))
+        self.assertFalse(any(is_unconfined(nx.cycle_graph(4), v) for v in range(4)))
+
+        g = nx.star_graph(4)
+        self.assertEqual(unconfined_rule(g, 3), 2)
+        self.assertEqual(g.number_of_edges(), 0)
+
+    def test_strong_reductions_preserve_answer(self):
+        """
+        Vérifie sur des graphes aléatoires que les règles fortes, seules puis dans la
+        kernelization, préservent la réponse et que les compteurs par règle sont renseignés.
+        """
+        for seed in range(15):
+            g = nx.gnm_random_graph(14, 24, seed=seed)
+            size = next(j for j in range(15) if vcb_degree(g, j))
+            stats = {}
+            h = g.copy()
+            k = strong_reductions(h, size, stats=stats)
+            self.assertTrue(vcb_degree(h, k))
+            self.assertFalse(vcb_degree(h, k - 1))
+            self.assertEqual(set(stats["reductions"]), {"dominance", "unconfined", "twin"})
+            self.assertEqual(sum(stats["edges_removed"].values()), g.number_of_edges() - h.number_of_edges())
+
+            ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, size - 1)
+            self.assertTrue(no_inst or not vcb_degree(ker_g, ker_k))
+
+        stats = {}
+        ker_g, ker_k, no_inst = kernel_vertex_cover_crown(nx.complete_graph(6), 5, stats)
+        self.assertFalse(no_inst)
+        self.assertEqual(ker_g.number_of_nodes(), 0)
+        self.assertEqual(stats["reductions"]["dominance"], 5)
+
+    def test_strong_reductions_from_touched_vertices(self):
+        """
+        Après une suppression, la reprise depuis les seuls sommets touchés (`touched_since`)
+        laisse un graphe où un nouvel examen de tous les sommets ne réduit plus rien.
+        """
+        for seed in range(10):
+            g = nx.gnm_random_graph(30, 50, seed=seed)
+            strong_reductions(g, 30)
+            degrees = dict(g.degree())
+            g.remove_node(max(g.nodes(), key=g.degree))
+            candidates = touched_since(g, degrees)
+            self.assertLessEqual(len(candidates), g.number_of_nodes())
+
+            strong_reductions(g, 30, candidates=candidates)
+            self.assertEqual(strong_reductions(g, 30), 30)  # Plus rien à réduire
+
+
+def _covers(g, size):
+    """Couvertures de taille `size` de g (énumération exhaustive)."""
+    for c in combinations(list(g.nodes()), size):
+        if is_vertex_cover(g, c):
+            yield c
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+import networkx as nx
+from src import batch
+from src.batch import completed_jobs, find_jobs, run_batch
+
+
+def _sleeping_solver(settings, job):
+    """Résolution qui ne rend jamais la main (pour tester l'arrêt forcé)."""
+    time.sleep(60)
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Suite de tests unitaires pour la résolution par lots d'instances.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.dir.name, "results.jsonl")
+        for i, n in enumerate((10, 30, 20)):
+            g = nx.cycle_graph(n)
+            with open(os.path.join(self.dir.name, f"c{i}.gr"), "w") as f:
+                f.write(f"p td {n} {n}\n" + "".join(f"{u + 1} {v + 1}\n" for u, v in g.edges()))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_find_jobs(self):
+        """
+        Vérifie la liste des instances d'un répertoire (fichiers de graphe seulement) et
+        d'un manifeste (chemins relatifs, commentaires).
+        """
+        with open(os.path.join(self.dir.name, "notes.md"), "w") as f:
+            f.write("pas un graphe\n")
+        jobs = find_jobs(self.dir.name, 12)
+        self.assertEqual([os.path.basename(path) for path, _ in jobs], ["c0.gr", "c1.gr", "c2.gr"])
+        self.assertEqual({k for _, k in jobs}, {12})
+
+        manifest = os.path.join(self.dir.name, "manifest.txt")
+        with open(manifest, "w") as f:
+            f.write("# instances\nc1.gr 15\n\nc0.gr 5  # petit cycle\n")
+        self.assertEqual(find_jobs(manifest), [(os.path.realpath(os.path.join(self.dir.name, "c1.gr")), 15),
+                                               (os.path.realpath(os.path.join(self.dir.name, "c0.gr")), 5)])
+        with self.assertRaises(ValueError):
+            find_jobs(self.dir.name)
+
+    def test_run_and_resume(self):
+        """
+        Vérifie les réponses, l'ordre de lancement (plus gros fichier d'abord) et la reprise :
+        seules les instances sans résultat (ou dont la ligne est tronquée) sont relancées.
+        """
+        jobs = find_jobs(self.dir.name, 10)
+        results = run_batch(jobs, self.output, workers=1)
+        self.assertEqual([os.path.basename(r["file"]) for r in results], ["c1.gr", "c2.gr", "c0.gr"])
+        self.assertEqual([r["status"] for r in results], ["no", "yes", "yes"])
+        self.assertTrue(all(r["valid"] for r in results if r["status"] == "yes"))
+
+        with open(self.output) as f:
+            lines = f.readlines()
+        with open(self.output, "w") as f:
+            f.writelines(lines[:1] + [lines[1][:20]])  # Arrêt brutal pendant la deuxième ligne
+        self.assertEqual(completed_jobs(self.output), {(results[0]["file"], 10)})
+        resumed = run_batch(jobs, self.output, workers=2)
+        self.assertEqual(sorted(os.path.basename(r["file"]) for r in resumed), ["c0.gr", "c2.gr"])
+        self.assertEqual(run_batch(jobs, self.output, workers=2), [])
+
+        # Même lot désigné autrement, depuis un autre répertoire courant
+        cwd = os.getcwd()
+        os.chdir(self.dir.name)
+        try:
+            self.assertEqual(run_batch(find_jobs("./", 10), "results.jsonl", workers=2), [])
+            self.assertEqual(run_batch([("./c0.gr", 10)], "results.jsonl", workers=2), [])
+        finally:
+            os.chdir(cwd)
+
+    def test_timeouts(self):
+        """
+        Vérifie qu'une instance trop longue rend une réponse inconnue, et qu'un processus qui
+        ne s'arrête pas de lui-même est tué après le délai de grâce.
+        """
+        g = nx.random_regular_graph(5, 300, seed=1)
+        path = os.path.join(self.dir.name, "hard.txt")
+        with open(path, "w") as f:
+            f.write("".join(f"{u} {v}\n" for u, v in g.edges()))
+        record, = run_batch([(path, 165)], self.output, time_limit=0.3)
+        self.assertEqual(record["status"], "timeout")
+
+        with mock.patch.object(batch, "_solve_job", _sleeping_solver), mock.patch.object(batch, "KILL_GRACE", 0.2):
+            start = time.perf_counter()
+            record, = run_batch([(path, 10)], self.output, time_limit=0.1)
+        self.assertEqual(record["status"], "killed")
+        self.assertLess(time.perf_counter() - start, 10)
+        self.assertEqual(len(completed_jobs(self.output)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import csv
+import os
+import tempfile
+import unittest
+from benchmark.benchmark import _append_row, replay_benchmark_row, run_comprehensive_benchmarks
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Suite de tests unitaires pour le banc d'essai parallèle et reprenable.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.dir.name, "results.csv")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_append_row_widens_header(self):
+        """
+        Vérifie qu'une ligne apportant une nouvelle colonne réécrit le fichier avec l'en-tête
+        élargi, sans perdre les lignes précédentes.
+        """
+        _append_row(self.output, {"n": 10, "time": 0.5})
+        _append_row(self.output, {"n": 20, "time": 0.7})
+        _append_row(self.output, {"n": 30, "error": "killed"})
+        with open(self.output, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual([row["n"] for row in rows], ["10", "20", "30"])
+        self.assertEqual((rows[0]["error"], rows[2]["time"], rows[2]["error"]), ("", "", "killed"))
+
+    def test_resume_and_replay(self):
+        """
+        Vérifie que la série reprend après un arrêt brutal (lignes manquantes et dernière
+        ligne tronquée) sans relancer les exécutions déjà écrites, et qu'une ligne se rejoue
+        à l'identique à partir de sa graine.
+        """
+        configs = [{"n": 20, "k": 6}]
+        options = {"edge_probs": [0.3], "samples": 2, "algo": "degree", "seed": 5, "output": self.output}
+        first = run_comprehensive_benchmarks(configs, workers=2, **options)
+        self.assertEqual(len(first), 4)
+        self.assertEqual(first["seed"].nunique(), 4)
+
+        with open(self.output) as f:
+            lines = f.readlines()
+        with open(self.output, "w") as f:
+            f.writelines(lines[:3] + [lines[3][:15]])
+        resumed = run_comprehensive_benchmarks(configs, workers=2, **options)
+        self.assertEqual(len(resumed), 4)
+        self.assertEqual(sorted(resumed["seed"]), sorted(first["seed"]))
+
+        row = first.iloc[1]
+        replayed = replay_benchmark_row(row)
+        for column in ("m", "kernel_size", "kernel_success", "vcb_success", "search_nodes"):
+            self.assertEqual(replayed[column], row[column], column)
+
+
+if __name__ == '__main__':
+    unittest.main()
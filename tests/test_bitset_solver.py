@@ -0,0 +1,71 @@
+import unittest
+import networkx as nx
+from src.bitset_solver import bitset_vertex_cover, vcb_bitset
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.kernel import kernel_vertex_cover, select_solver
+from src.vcb import vcb_degree, vcb_recursive
+
+
+class TestBitsetSolver(unittest.TestCase):
+    """
+    Suite de tests unitaires pour le solveur par ensembles de bits.
+    """
+
+    def test_bitset_small_graphs(self):
+        """
+        Vérifie le solveur sur des graphes classiques : graphe vide (avec k = 0 et k = -1),
+        chemin, cycle impair, graphe de Petersen (couverture minimale de taille 6).
+        """
+        self.assertTrue(vcb_bitset(nx.Graph(), 0))
+        self.assertTrue(vcb_bitset(nx.path_graph(5), 2))
+        self.assertFalse(vcb_bitset(nx.cycle_graph(7), 3))
+        self.assertTrue(vcb_bitset(nx.cycle_graph(7), 4))
+        self.assertFalse(vcb_bitset(nx.petersen_graph(), 5))
+        self.assertTrue(vcb_bitset(nx.petersen_graph(), 6))
+        self.assertFalse(vcb_bitset(nx.Graph(), -1))
+        self.assertIsNone(bitset_vertex_cover(nx.empty_graph(3), -1))
+
+    def test_bitset_matches_branching(self):
+        """
+        Vérifie sur des graphes aléatoires que le solveur donne la même réponse que le
+        branchement générique et que le témoin est une couverture valide.
+        """
+        for seed in range(10):
+            g = nx.gnm_random_graph(20, 35, seed=seed)
+            for k in range(6, 14):
+                for graph in (g, CompactGraph.from_networkx(g)):
+                    cover = bitset_vertex_cover(graph, k)
+                    self.assertEqual(cover is not None, vcb_degree(g, k))
+                    if cover is not None:
+                        self.assertLessEqual(len(cover), k)
+                        self.assertTrue(is_vertex_cover(graph, cover))
+
+    def test_kernel_switches_to_bitset(self):
+        """
+        Vérifie que la chaîne kernel + VCB passe au solveur par bits sous le seuil, et
+        qu'elle donne la même couverture minimale avec le seuil désactivé.
+        """
+        g = nx.gnm_random_graph(60, 150, seed=3)
+        size = next(k for k in range(61) if vcb_bitset(g, k))
+        for threshold in (0, 512):
+            self.assertIsNone(kernel_vertex_cover(g, size - 1, bitset_threshold=threshold))
+            cover = kernel_vertex_cover(g, size, bitset_threshold=threshold)
+            self.assertEqual(len(cover), size)
+            self.assertTrue(is_vertex_cover(g, cover))
+
+    def test_explicit_algo_is_respected(self):
+        """
+        Vérifie que le passage automatique au solveur par bits ne s'applique que si aucun
+        moteur n'est imposé : --algo edge reste le branchement sur une arête sur un petit noyau.
+        """
+        self.assertIs(select_solver(None, size=10), vcb_bitset)
+        self.assertIs(select_solver(None, size=10 ** 6), vcb_recursive)
+        self.assertIs(select_solver("edge", size=10), vcb_recursive)
+        self.assertIs(select_solver("degree", size=10), vcb_degree)
+        self.assertEqual(select_solver("degree", workers=2, size=10).keywords["algo"], "degree")
+        self.assertIs(select_solver("bitset", size=10 ** 6), vcb_bitset)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import random
+import unittest
+import networkx as nx
+from src.bounds import (
+    matching_bound, maximum_matching_bound, clique_cover_bound, prune_by_bounds, resolve_bounds
+)
+from src.compact_graph import CompactGraph
+from src.vcb import vcb_recursive, vcb_degree
+
+
+class TestBounds(unittest.TestCase):
+    """
+    Suite de tests unitaires pour les bornes inférieures du branch-and-bound.
+    """
+
+    def test_bounds_on_clique(self):
+        """
+        Vérifie les bornes sur une clique K5 (couverture minimale de taille 4) :
+        les couplages donnent 2, la couverture en cliques est exacte.
+        """
+        g = nx.complete_graph(5)
+        self.assertEqual(matching_bound(g), 2)
+        self.assertEqual(maximum_matching_bound(g), 2)
+        self.assertEqual(clique_cover_bound(g), 4)
+
+    def test_bounds_are_lower_bounds(self):
+        """
+        Vérifie sur des graphes aléatoires (nx et compacts) que chaque borne est
+        inférieure ou égale à la taille d'une couverture minimale.
+        """
+        for seed in range(10):
+            g = nx.gnm_random_graph(11, 20, seed=seed)
+            opt = next(k for k in range(12) if vcb_recursive(g, k))
+            for h in (g, CompactGraph.from_networkx(g)):
+                self.assertLessEqual(matching_bound(h), opt)
+                self.assertLessEqual(maximum_matching_bound(h), opt)
+                self.assertLessEqual(clique_cover_bound(h), opt)
+
+    def test_maximum_matching_follows_search(self):
+        """
+        Vérifie que le couplage conservé d'un appel à l'autre reste maximum lorsque le
+        graphe perd des sommets puis les retrouve (retour arrière), comme dans la recherche.
+        """
+        for seed in range(20):
+            h = CompactGraph.from_networkx(nx.gnm_random_graph(25, 30 + 3 * seed, seed=seed))
+            order = list(h.nodes())
+            random.Random(seed).shuffle(order)
+            for step, v in enumerate(order[:15]):
+                expected = len(nx.max_weight_matching(h.to_networkx(), maxcardinality=True))
+                self.assertEqual(maximum_matching_bound(h), expected)
+                if step % 5 == 4:
+                    h.undo(0)
+                h.remove_node(v)
+
+    def test_prune_statistics(self):
+        """
+        Vérifie que l'élagage est comptabilisé pour la borne qui a coupé le nœud.
+        """
+        stats = {}
+        bounds = resolve_bounds(["matching", "clique_cover"])
+        self.assertTrue(prune_by_bounds(nx.complete_graph(5), 3, bounds, stats))
+        self.assertEqual(stats["pruned"], {"clique_cover": 1})
+        self.assertEqual(stats["bound_calls"], {"matching": 1, "clique_cover": 1})
+
+    def test_branching_with_bounds(self):
+        """
+        Vérifie que les bornes ne changent pas les réponses et réduisent l'arbre de recherche.
+        """
+        g = nx.petersen_graph()
+        plain, bounded = {}, {}
+        self.assertFalse(vcb_recursive(g, 5, plain))
+        self.assertFalse(vcb_recursive(g, 5, bounded, bounds=["max_matching"]))
+        self.assertLess(bounded["nodes"], plain["nodes"])
+        self.assertTrue(vcb_degree(g, 6, bounds=["matching", "clique_cover", lambda h: 0]))
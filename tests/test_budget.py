@@ -0,0 +1,73 @@
+import time
+import unittest
+import networkx as nx
+from src.bitset_solver import vcb_bitset
+from src.budget import Budget, Unknown
+from src.graph_utils import is_vertex_cover
+from src.iterative import IterativeSearch
+from src.kernel import kernel_vertex_cover
+from src.optimize import minimum_vertex_cover
+from src.vcb import find_vertex_cover, vcb_degree, vcb_recursive
+
+
+class TestBudget(unittest.TestCase):
+    """
+    Suite de tests unitaires pour les budgets de temps et de nœuds.
+    """
+
+    def test_node_limit(self):
+        """
+        Vérifie que chaque moteur renvoie `Unknown` quand la limite de nœuds est atteinte,
+        avec les statistiques partielles, et la réponse exacte quand elle suffit.
+        """
+        g = nx.gnm_random_graph(40, 120, seed=1)
+        for solver in (vcb_recursive, vcb_degree, vcb_bitset):
+            stats = {}
+            result = solver(g, 20, stats, budget=Budget(node_limit=5))
+            self.assertEqual(result, Unknown("node_limit"))
+            self.assertEqual(stats["status"], "node_limit")
+            self.assertGreater(stats["nodes"], 0)
+        self.assertIsInstance(find_vertex_cover(g, 20, "edge", budget=Budget(node_limit=5)), Unknown)
+        self.assertEqual(vcb_degree(g, 20, budget=Budget(node_limit=10 ** 6)), vcb_degree(g, 20))
+        with self.assertRaises(TypeError):
+            bool(Unknown("timeout"))
+
+    def test_time_limit(self):
+        """
+        Vérifie qu'une recherche exponentielle est interrompue peu après l'échéance, pour le
+        branchement seul et pour la chaîne kernel + VCB.
+        """
+        g = nx.gnm_random_graph(60, 200, seed=1)
+        start = time.perf_counter()
+        self.assertEqual(vcb_recursive(g, 30, budget=Budget(time_limit=0.1)), Unknown("timeout"))
+        self.assertLess(time.perf_counter() - start, 2)
+
+        stats = {}
+        result = kernel_vertex_cover(g, 30, "crown", "edge", stats, bitset_threshold=0, budget=Budget(time_limit=0.1))
+        self.assertIsInstance(result, Unknown)
+        self.assertEqual(stats["status"], "timeout")
+        self.assertIn("reductions", stats)
+
+    def test_budget_resume_and_optimize(self):
+        """
+        Vérifie qu'une recherche itérative arrêtée par le budget peut être reprise, et que
+        la couverture minimale renvoie une couverture valide avec l'encadrement atteint.
+        """
+        g = nx.gnm_random_graph(30, 80, seed=2)
+        search = IterativeSearch(g, 15, budget=Budget(node_limit=20))
+        self.assertIsInstance(search.run(), Unknown)
+        search.budget = None
+        self.assertEqual(search.run(), vcb_degree(g, 15))
+
+        g = nx.gnm_random_graph(150, 400, seed=1)
+        stats = {}
+        cover = minimum_vertex_cover(g, "edge", stats=stats, budget=Budget(node_limit=50), bitset_threshold=0)
+        self.assertTrue(is_vertex_cover(g, cover))
+        self.assertEqual(stats["status"], "node_limit")
+        low, high = stats["gap"]
+        self.assertLessEqual(low, high)
+        self.assertEqual(len(cover), high)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import networkx as nx
+import numpy as np
+from src.compact_graph import CompactGraph, as_compact_graph
+from src.graph_utils import remove_isolated_vertices, is_vertex_cover
+from src.kernel import kernel_vertex_cover_crown
+from src.reduction_rules import high_degree_rule
+from src.vcb import vcb_recursive
+
+
+class TestCompactGraph(unittest.TestCase):
+    """
+    Suite de tests unitaires pour le graphe compact au format CSR.
+    """
+
+    def test_from_edges_dedup(self):
+        """
+        Vérifie que les boucles et les arêtes multiples sont ignorées à la construction.
+        """
+        g = CompactGraph.from_edges(4, [(0, 1), (1, 0), (1, 1), (2, 3), (3, 2)])
+        self.assertEqual(g.number_of_nodes(), 4)
+        self.assertEqual(g.number_of_edges(), 2)
+        self.assertEqual(sorted(g.edges()), [(0, 1), (2, 3)])
+        self.assertEqual(dict(g.degree()), {0: 1, 1: 1, 2: 1, 3: 1})
+
+    def test_networkx_round_trip(self):
+        """
+        Vérifie que la conversion aller-retour conserve sommets, arêtes et étiquettes.
+        """
+        g = nx.Graph([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d")])
+        g.add_node("e")
+        cg = CompactGraph.from_networkx(g)
+        self.assertEqual(cg.labels, ["a", "b", "c", "d", "e"])
+        back = cg.to_networkx()
+        self.assertEqual(set(back.nodes()), set(g.nodes()))
+        self.assertEqual(set(map(frozenset, back.edges())), set(map(frozenset, g.edges())))
+
+    def test_remove_and_undo(self):
+        """
+        Vérifie que la suppression met à jour degrés et arêtes, et que `undo` restaure l'état initial.
+        """
+        g = CompactGraph.from_networkx(nx.complete_graph(4))
+        mark = g.mark()
+        g.remove_node(0)
+        g.remove_nodes_from([1, 7])
+        self.assertEqual(g.number_of_nodes(), 2)
+        self.assertEqual(g.number_of_edges(), 1)
+        self.assertEqual(g[2], [3])
+        self.assertNotIn(0, g)
+        for v in (1.5, "a", None, -1, 4):
+            self.assertNotIn(v, g)
+        self.assertIn(np.int64(2), g)
+        g.undo(mark)
+        self.assertEqual(g.number_of_edges(), 6)
+        self.assertEqual(dict(g.degree()), {0: 3, 1: 3, 2: 3, 3: 3})
+        self.assertTrue(g.has_edge(0, 1))
+
+    def test_copy_is_independent(self):
+        """
+        Vérifie qu'une copie partage le CSR mais pas l'état des suppressions.
+        """
+        g = CompactGraph.from_networkx(nx.path_graph(4))
+        h = g.copy()
+        h.remove_node(1)
+        self.assertEqual(g.number_of_edges(), 3)
+        self.assertEqual(h.number_of_edges(), 1)
+        self.assertTrue(np.shares_memory(g._neighbors, h._neighbors))
+
+    def test_pipeline_accepts_compact_graph(self):
+        """
+        Vérifie que les modules de `src/` acceptent directement un graphe compact
+        et donnent les mêmes résultats qu'avec un `nx.Graph`.
+        """
+        g = nx.Graph()
+        g.add_edges_from([(1, 2), (2, 3), (1, 3), (4, 5)])
+        g.add_nodes_from([6, 7])
+        cg = as_compact_graph(g)
+
+        remove_isolated_vertices(cg)
+        self.assertEqual(cg.number_of_nodes(), 5)
+        self.assertEqual(high_degree_rule(cg.copy(), 2), 2)
+        self.assertTrue(is_vertex_cover(cg, [0, 1, 3]))
+
+        ker_g, ker_k, no_inst = kernel_vertex_cover_crown(cg, 3)
+        self.assertFalse(no_inst)
+        self.assertIsInstance(ker_g, CompactGraph)
+        self.assertLessEqual(ker_g.number_of_nodes(), 3 * ker_k)
+        self.assertEqual(vcb_recursive(cg, 3), vcb_recursive(g, 3))
+        self.assertEqual(vcb_recursive(cg, 2), vcb_recursive(g, 2))
+
+    def test_component_subgraphs(self):
+        """
+        Vérifie la décomposition en composantes connexes, y compris celles qui
+        apparaissent après une suppression, avec étiquettes renvoyant au graphe parent.
+        """
+        g = CompactGraph.from_networkx(nx.path_graph(7))
+        self.assertEqual(len(g.component_subgraphs()), 1)
+        g.remove_node(3)
+        parts = sorted(g.component_subgraphs(), key=lambda p: p.labels)
+        self.assertEqual([p.labels for p in parts], [[0, 1, 2], [4, 5, 6]])
+        self.assertEqual([p.number_of_edges() for p in parts], [2, 2])
+
+    def test_add_edge_and_undo(self):
+        """
+        Vérifie l'ajout d'arêtes (utilisé par le repliement) et son annulation par `undo`.
+        """
+        g = CompactGraph.from_networkx(nx.path_graph(4))
+        mark = g.mark()
+        g.remove_node(1)
+        g.add_edge(0, 3)
+        g.add_edge(3, 0)  # Arête déjà présente : sans effet
+        self.assertTrue(g.has_edge(3, 0))
+        self.assertEqual(sorted(g[3]), [0, 2])
+        self.assertEqual(sorted(g.edges()), [(0, 3), (2, 3)])
+        g.undo(mark)
+        self.assertFalse(g.has_edge(0, 3))
+        self.assertEqual(g.number_of_edges(), 3)
+        self.assertEqual(dict(g.degree()), {0: 1, 1: 2, 2: 2, 3: 1})
@@ -103,3 +103,42 @@ class TestCrownDecomp(unittest.TestCase):
         c, h, no_inst = crown_decomposition(g, 1)
         self.assertEqual(c, {3})
         self.assertEqual(h, set())
+
+    def test_crown_decomposition_star_head(self):
+        """
+        Vérifie qu'une vraie couronne avec une tête non vide est extraite d'une étoile.
+        Le centre forme la tête H et les feuilles non couplées forment la couronne C.
+        """
+        g = nx.star_graph(5)
+        c, h, no_inst = crown_decomposition(g, 2)
+        self.assertFalse(no_inst)
+        self.assertEqual(h, {0})
+        self.assertEqual(c, {2, 3, 4, 5})
+
+    def test_crown_decomposition_is_valid_crown(self):
+        """
+        Vérifie les propriétés du lemme de la couronne sur un graphe aléatoire :
+        C indépendant, N(C) ⊆ H, |H| ≤ k et H couplé dans C.
+        """
+        g = nx.gnm_random_graph(40, 30, seed=6)
+        g.remove_nodes_from(list(nx.isolates(g)))
+        c, h, no_inst = crown_decomposition(g, 12)
+        self.assertFalse(no_inst)
+        self.assertTrue(c)
+        self.assertEqual(g.subgraph(c).number_of_edges(), 0)
+        self.assertTrue(set().union(*(g[x] for x in c)) <= h)
+        self.assertLessEqual(len(h), 12)
+        b = nx.Graph((x, y) for x in c for y in g[x])
+        matching = nx.bipartite.maximum_matching(b, top_nodes=h)
+        self.assertTrue(all(x in matching for x in h))
+
+    def test_crown_decomposition_bipartite_matching_rejects(self):
+        """
+        Vérifie la réponse négative lorsque le couplage maximum du graphe biparti dépasse k
+        alors que le couplage glouton ne dépasse pas k (chemin x-u-v-y avec k = 1).
+        """
+        g = nx.Graph()
+        g.add_edges_from([("u", "v"), ("u", "x"), ("v", "y")])
+        self.assertEqual(len(maximal_matching(g)), 1)
+        c, h, no_inst = crown_decomposition(g, 1)
+        self.assertTrue(no_inst)
@@ -1,6 +1,8 @@
 import unittest
+import networkx as nx
+import numpy as np
 
-from src.generators import generate_vertex_cover_graph
+from src.generators import generate_random_graph, generate_vertex_cover_graph
 from src.kernel import kernel_vertex_cover_crown
 from src.vcb import vcb_recursive
 
@@ -63,3 +65,36 @@ class TestGraphGeneration(unittest.TestCase):
 
         g = generate_vertex_cover_graph(10, 3, edge_prob=0.01)
         self.assertLess(g.number_of_edges(), 10)
+
+    def test_generator_seed_and_outputs(self):
+        """
+        Vérifie qu'une même graine redonne le même graphe, et que les trois formats de
+        sortie (nx.Graph, tableau d'arêtes, CSR) décrivent le même graphe.
+        """
+        for guaranteed in (False, True):
+            g = generate_vertex_cover_graph(40, 8, 0.3, guaranteed, seed=5)
+            self.assertTrue(nx.utils.graphs_equal(g, generate_vertex_cover_graph(40, 8, 0.3, guaranteed, seed=5)))
+            edges = generate_vertex_cover_graph(40, 8, 0.3, guaranteed, seed=5, output="edges")
+            csr = generate_vertex_cover_graph(40, 8, 0.3, guaranteed, seed=5, output="csr")
+            self.assertEqual({tuple(e) for e in edges.tolist()}, {tuple(sorted(e)) for e in g.edges()})
+            self.assertTrue(nx.utils.graphs_equal(csr.to_networkx(), g))
+
+    def test_random_graph_edge_count(self):
+        """
+        Vérifie que G(n, m) contient exactement m arêtes distinctes, sans boucle, et que m
+        est ramené au nombre de paires possibles.
+        """
+        edges = generate_random_graph(500, 3000, seed=1, output="edges")
+        self.assertEqual(len(edges), 3000)
+        self.assertTrue(np.all(edges[:, 0] < edges[:, 1]))
+        self.assertEqual(generate_random_graph(10, 100, seed=1).number_of_edges(), 45)
+
+    def test_large_planted_graph(self):
+        """
+        Vérifie la génération directe au format CSR d'un grand graphe à couverture garantie :
+        chaque sommet hors du cover a au moins un voisin.
+        """
+        n, k = 200000, 20000
+        g = generate_vertex_cover_graph(n, k, 1e-4, guaranteed_vc=True, seed=2, output="csr")
+        self.assertEqual(g.number_of_nodes(), n)
+        self.assertGreaterEqual(int(np.count_nonzero(g.degree_array() > 0)), n - k)
@@ -1,6 +1,10 @@
 import unittest
 import networkx as nx
-from src.graph_utils import remove_isolated_vertices, is_vertex_cover
+import numpy as np
+from src.compact_graph import CompactGraph
+from src.graph_utils import (CHUNK_SIZE, cover_mask, covers_edges, covers_edges_batch, edge_array,
+                             is_vertex_cover, is_vertex_cover_batch, remove_isolated_vertices,
+                             uncovered_edges)
 
 
 class TestGraphUtils(unittest.TestCase):
@@ -42,3 +46,36 @@ class TestGraphUtils(unittest.TestCase):
 
         # {0} seul ne couvre pas toutes les arêtes du graphe complet
         self.assertFalse(is_vertex_cover(g, {0}))
+
+    def test_uncovered_edges_and_chunks(self):
+        """
+        Vérifie la vérification vectorisée sur un `CompactGraph` et sur un graphe à
+        étiquettes quelconques, l'arrêt par blocs et l'extraction des arêtes non couvertes.
+        """
+        g = nx.relabel_nodes(nx.path_graph(5), {i: f"v{i}" for i in range(5)})
+        self.assertTrue(is_vertex_cover(g, {"v1", "v3", "absent"}))
+        self.assertFalse(is_vertex_cover(CompactGraph.from_networkx(nx.path_graph(5)), {1}))
+
+        edges, n, index = edge_array(g)
+        mask = cover_mask(n, {"v1"}, index)
+        self.assertFalse(covers_edges(edges, mask, chunk=1))
+        missing = {tuple(sorted((u, v))) for u, v in uncovered_edges(edges, mask).tolist()}
+        self.assertEqual(missing, {tuple(sorted((index["v2"], index["v3"]))),
+                                   tuple(sorted((index["v3"], index["v4"])))})
+
+    def test_is_vertex_cover_batch(self):
+        """
+        Vérifie que la vérification groupée (plus de 8 candidats, donc sur plusieurs octets)
+        donne les mêmes réponses que la vérification candidat par candidat.
+        """
+        g = nx.gnm_random_graph(12, 20, seed=3)
+        rng = np.random.default_rng(0)
+        covers = [set(np.flatnonzero(rng.random(12) < 0.7).tolist()) for _ in range(21)]
+        covers.append(set(range(12)))
+        expected = [is_vertex_cover(g, cover) for cover in covers]
+        for chunk in (1, 7, CHUNK_SIZE):
+            edges, n, index = edge_array(g)
+            masks = np.stack([cover_mask(n, cover, index) for cover in covers])
+            self.assertEqual(covers_edges_batch(edges, masks, chunk=chunk).tolist(), expected)
+        self.assertEqual(is_vertex_cover_batch(g, covers).tolist(), expected)
+        self.assertEqual(is_vertex_cover_batch(g, []).tolist(), [])
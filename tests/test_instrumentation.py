@@ -0,0 +1,75 @@
+import json
+import unittest
+import networkx as nx
+from src.instrumentation import SolverStats, flatten_stats, phase
+from src.kernel import crown_reduction, kernel_vertex_cover
+from src.vcb import vcb_degree
+
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    Suite de tests unitaires pour l'instrumentation des réductions et de la recherche.
+    """
+
+    def test_flatten_and_export(self):
+        """
+        Vérifie l'aplatissement des statistiques imbriquées, l'export JSON et la mesure
+        d'une phase (aucune mesure sans dictionnaire).
+        """
+        stats = SolverStats(nodes=3, reductions={"crown": 4}, gap=(1, 2), status="timeout")
+        self.assertEqual(flatten_stats(stats), {"nodes": 3, "reductions.crown": 4, "gap.0": 1, "gap.1": 2,
+                                                "status": "timeout"})
+        self.assertEqual(json.loads(stats.to_json())["reductions.crown"], 4)
+
+        with phase(stats, "setup"):
+            pass
+        self.assertGreaterEqual(stats["time"]["setup"], 0)
+        with phase(None, "setup"):
+            pass
+
+    def test_kernel_statistics(self):
+        """
+        Vérifie les compteurs de la kernelization sur des copies de K_{3,10} : une
+        décomposition en couronne, tailles des couplages, sommets et arêtes supprimés ; puis
+        que les sommets isolés par la règle de haut degré ont leur propre compteur.
+        """
+        g = nx.disjoint_union_all([nx.complete_bipartite_graph(3, 10) for _ in range(4)])
+        stats = SolverStats()
+        ker_g, _, no_inst = crown_reduction(g, 12, stats, strong=False)
+        self.assertFalse(no_inst)
+        self.assertEqual(ker_g.number_of_nodes(), 0)
+        self.assertEqual(stats["crown_iterations"], 1)
+        self.assertEqual(stats["matching"], {"maximal": 12, "maximum": 12})
+        self.assertEqual(stats["reductions"]["crown"] + stats["reductions"]["isolated"], 52)
+        self.assertEqual(stats["edges_removed"]["crown"], 120)
+        self.assertEqual(stats["applications"]["crown"], 1)
+        self.assertIn("crown", stats["time"])
+
+        # Feuilles isolées par la règle de haut degré : comptées comme sommets isolés
+        stats = SolverStats()
+        ker_g, _, no_inst = crown_reduction(nx.disjoint_union(nx.star_graph(5), nx.star_graph(5)), 2, stats)
+        self.assertEqual((ker_g.number_of_nodes(), no_inst), (0, False))
+        self.assertEqual(stats["reductions"]["high_degree"], 2)
+        self.assertEqual(stats["reductions"]["isolated"], 10)
+        self.assertEqual(stats["reductions"].get("degree_two", 0), 0)
+
+    def test_search_statistics(self):
+        """
+        Vérifie le nombre de nœuds, la profondeur maximale et les durées des phases de la
+        chaîne kernel + VCB, et que la recherche sans statistiques donne la même réponse.
+        """
+        g = nx.gnm_random_graph(40, 100, seed=4)
+        stats = SolverStats()
+        self.assertEqual(vcb_degree(g, 18, stats), vcb_degree(g, 18))
+        self.assertGreater(stats["nodes"], 1)
+        self.assertGreater(stats["max_depth"], 0)
+        self.assertLess(stats["max_depth"], stats["nodes"])
+        self.assertIn("search", stats["time"])
+
+        stats = SolverStats()
+        kernel_vertex_cover(g, 25, stats=stats, bitset_threshold=0)
+        self.assertTrue({"kernel", "search", "lift"} <= set(stats["time"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
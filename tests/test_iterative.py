@@ -0,0 +1,62 @@
+import pickle
+import unittest
+import networkx as nx
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.iterative import IterativeSearch, vcb_iterative
+from src.vcb import vcb_degree
+
+
+class TestIterative(unittest.TestCase):
+    """
+    Suite de tests unitaires pour le moteur de branchement itératif.
+    """
+
+    def test_iterative_matches_recursive(self):
+        """
+        Vérifie sur des graphes aléatoires que les deux règles de branchement et les deux
+        ordres d'exploration donnent la réponse du moteur récursif, avec un témoin valide.
+        """
+        for seed in range(8):
+            g = nx.gnm_random_graph(16, 30, seed=seed)
+            for k in range(5, 12):
+                expected = vcb_degree(g, k)
+                for algo in ("edge", "degree"):
+                    for order in ("dfs", "best"):
+                        for graph in (g, CompactGraph.from_networkx(g)):
+                            search = IterativeSearch(graph, k, algo, order, bounds=["matching"])
+                            self.assertEqual(search.run(), expected)
+                            if expected:
+                                self.assertLessEqual(len(search.cover), k)
+                                self.assertTrue(is_vertex_cover(graph, search.cover))
+
+    def test_iterative_large_k(self):
+        """
+        Vérifie qu'un k supérieur à la limite de récursion de Python est traité : couplage
+        parfait de 3000 arêtes, branchement sur les arêtes.
+        """
+        g = nx.Graph([(2 * i, 2 * i + 1) for i in range(3000)])
+        self.assertTrue(vcb_iterative(g, 3000, algo="edge"))
+        self.assertFalse(vcb_iterative(g, 2999, algo="edge", bounds=["matching"]))
+
+    def test_iterative_pause_resume(self):
+        """
+        Vérifie qu'une recherche interrompue puis reprise (y compris après sérialisation
+        par pickle) explore les mêmes nœuds qu'une recherche d'une traite.
+        """
+        g = nx.gnm_random_graph(30, 80, seed=1)
+        for order in ("dfs", "best"):
+            stats = {}
+            expected = vcb_iterative(g, 17, stats, order=order)
+
+            search = IterativeSearch(g, 17, order=order, stats={})
+            self.assertIsNone(search.run(max_nodes=10))
+            self.assertGreater(search.pending, 0)
+            while search.run(max_nodes=10) is None:
+                search = pickle.loads(pickle.dumps(search))
+            self.assertEqual(search.result, expected)
+            self.assertEqual(search.stats["nodes"], stats["nodes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
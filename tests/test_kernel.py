@@ -1,6 +1,10 @@
 import unittest
 import networkx as nx
-from src.kernel import crown_reduction, kernel_vertex_cover_crown
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.kernel import (crown_reduction, kernel_vertex_cover, kernel_vertex_cover_crown, kernel_vertex_cover_lp,
+                        lp_half_integral_solution)
+from src.vcb import vcb_degree
 
 
 class TestKernel(unittest.TestCase):
@@ -47,18 +51,22 @@ class TestKernel(unittest.TestCase):
         """
         Vérifie la kernelization du Vertex Cover en appliquant la réduction en couronne.
         - Test sur un graphe mixte contenant un triangle, une arête isolée et des sommets isolés.
-        - L'instance ne doit pas être déclarée invalide.
+        - L'instance ne doit pas être déclarée invalide pour k = 3.
         - Le graphe réduit doit respecter la borne 3k.
+        - Pour k = 2, le triangle et l'arête demandent 3 sommets : l'instance est invalide.
         """
         g = nx.Graph()
         g.add_edges_from([(1, 2), (2, 3), (1, 3)])  # Triangle
         g.add_edge(4, 5)  # Arête isolée
         g.add_nodes_from([6, 7])  # Sommets isolés
 
-        ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, 2)
+        ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, 3)
         self.assertFalse(no_inst)
         self.assertTrue(ker_g.number_of_nodes() <= 3 * ker_k)
 
+        ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, 2)
+        self.assertTrue(no_inst)
+
     def test_crown_reduction_star(self):
         """
         Vérifie la réduction en couronne sur un graphe en étoile.
@@ -80,3 +88,68 @@ class TestKernel(unittest.TestCase):
         ker_g, ker_k, no_inst = kernel_vertex_cover_crown(g, 3)
         self.assertFalse(no_inst)
         self.assertLessEqual(ker_g.number_of_nodes(), 9)
+
+    def test_kernel_lp_bound(self):
+        """
+        Vérifie le noyau de Nemhauser-Trotter sur des graphes aléatoires.
+        - Le noyau contient au plus 2k sommets.
+        - La réponse est la même qu'avec le branchement sur le graphe d'origine.
+        """
+        for seed in range(10):
+            g = nx.gnm_random_graph(25, 40, seed=seed)
+            for k in (8, 10, 12):
+                ker_g, ker_k, no_inst = kernel_vertex_cover_lp(g, k)
+                expected = vcb_degree(g, k)
+                if no_inst:
+                    self.assertFalse(expected)
+                    continue
+                self.assertLessEqual(ker_g.number_of_nodes(), 2 * ker_k)
+                self.assertEqual(vcb_degree(ker_g, ker_k), expected)
+
+    def test_kernel_lp_rejects(self):
+        """
+        Vérifie que l'instance est rejetée quand la relaxation linéaire dépasse k :
+        la relaxation de K5 vaut 5/2 > 2.
+        """
+        ker_g, ker_k, no_inst = kernel_vertex_cover_lp(nx.complete_graph(5), 2)
+        self.assertTrue(no_inst)
+
+    def test_lp_half_integral_solution(self):
+        """
+        Vérifie la solution demi-entière sur des graphes aléatoires (sommets étiquetés, ou
+        graphe compact dont un sommet a été supprimé) : elle est réalisable, sa valeur est
+        la moitié du couplage maximum du double biparti, et seuls les sommets présents sont
+        fixés à 0 ou à 1.
+        """
+        for seed in range(10):
+            g = nx.relabel_nodes(nx.gnm_random_graph(30, 40 + 4 * seed, seed=seed), lambda v: f"v{v}")
+            g.add_node("isolé")
+            compact = CompactGraph.from_edges(30, nx.gnm_random_graph(30, 40 + 4 * seed, seed=seed).edges())
+            compact.remove_node(0)
+            for graph in (g, compact):
+                ones, zeros, value = lp_half_integral_solution(graph)
+                x = {v: 1 if v in ones else 0 if v in zeros else 0.5 for v in graph.nodes()}
+                self.assertEqual(len(x), graph.number_of_nodes())
+                self.assertTrue(all(x[u] + x[v] >= 1 for u, v in graph.edges()))
+                self.assertEqual(sum(x.values()), value)
+
+                double = nx.Graph([((u, 0), (v, 1)) for u, v in graph.edges()] +
+                                  [((v, 0), (u, 1)) for u, v in graph.edges()])
+                top = [v for v in double if v[1] == 0]
+                self.assertEqual(len(nx.bipartite.maximum_matching(double, top)) / 2, 2 * value)
+            self.assertIn("isolé", lp_half_integral_solution(g)[1])
+
+    def test_kernel_vertex_cover_lifting(self):
+        """
+        Vérifie que la couverture du noyau, relevée par le journal de réduction, est une
+        couverture minimale du graphe d'origine, pour les deux kernelizations et les deux
+        représentations de graphe.
+        """
+        g = nx.gnm_random_graph(40, 60, seed=5)
+        size = next(j for j in range(41) if vcb_degree(g, j))
+        for kernel in ("crown", "lp"):
+            for graph in (g, CompactGraph.from_networkx(g)):
+                self.assertIsNone(kernel_vertex_cover(graph, size - 1, kernel))
+                cover = kernel_vertex_cover(graph, size, kernel)
+                self.assertEqual(len(cover), size)
+                self.assertTrue(is_vertex_cover(g, cover))
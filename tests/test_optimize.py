@@ -0,0 +1,73 @@
+import unittest
+import networkx as nx
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.optimize import greedy_vertex_cover, minimum_vertex_cover
+from src.vcb import vcb_degree
+
+
+class TestOptimize(unittest.TestCase):
+    """
+    Suite de tests unitaires pour la recherche d'une couverture minimale.
+    """
+
+    def test_greedy_vertex_cover(self):
+        """
+        Vérifie que la couverture gloutonne est valide et prend le centre d'une étoile.
+        """
+        g = nx.gnm_random_graph(30, 60, seed=1)
+        self.assertTrue(is_vertex_cover(g, greedy_vertex_cover(g)))
+        self.assertEqual(greedy_vertex_cover(nx.star_graph(6)), {0})
+
+    def test_minimum_vertex_cover(self):
+        """
+        Vérifie sur des graphes aléatoires que les deux parcours renvoient une couverture
+        valide de taille optimale, encadrée par les bornes initiales.
+        """
+        for seed in range(8):
+            g = nx.gnm_random_graph(30, 55, seed=seed)
+            optimum = next(k for k in range(31) if vcb_degree(g, k))
+            for graph in (g, CompactGraph.from_networkx(g)):
+                for search in ("incremental", "binary"):
+                    stats = {}
+                    cover = minimum_vertex_cover(graph, search=search, stats=stats)
+                    self.assertEqual(len(cover), optimum)
+                    self.assertTrue(is_vertex_cover(g, cover))
+                    self.assertEqual(stats["optimum"], optimum)
+                    self.assertLessEqual(stats["lower"], optimum)
+                    self.assertGreaterEqual(stats["upper"], optimum)
+                    self.assertEqual(stats["calls"], len(stats["time_per_k"]))
+
+    def test_minimum_vertex_cover_trivial(self):
+        """
+        Vérifie les cas sans arêtes et ceux entièrement résolus par les réductions
+        (aucun appel au solveur).
+        """
+        self.assertEqual(minimum_vertex_cover(nx.empty_graph(4)), set())
+        stats = {}
+        cover = minimum_vertex_cover(nx.cycle_graph(7), stats=stats)
+        self.assertEqual(len(cover), 4)
+        self.assertEqual(stats["calls"], 0)
+
+    def test_shared_table_across_probes(self):
+        """
+        Vérifie que la dichotomie réutilise la table de transposition d'un appel à l'autre :
+        les échecs mémorisés pendant un appel OUI élaguent les appels suivants (k plus
+        petits), qui explorent moins de nœuds qu'avec une table vide.
+        """
+        g = nx.gnm_random_graph(60, 180, seed=5)
+        runs = []
+        for table_size in (0, 1 << 16):
+            stats = {}
+            cover = minimum_vertex_cover(g, search="binary", stats=stats, bitset_threshold=0, table_size=table_size)
+            self.assertTrue(is_vertex_cover(g, cover))
+            runs.append((len(cover), stats["nodes_per_k"]))
+        (size, plain), (shared_size, shared) = runs
+        self.assertEqual(size, shared_size)
+        self.assertEqual(plain.keys(), shared.keys())
+        self.assertTrue(all(shared[k] <= plain[k] for k in plain))
+        self.assertLess(sum(shared.values()), sum(plain.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
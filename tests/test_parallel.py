@@ -0,0 +1,44 @@
+import unittest
+import networkx as nx
+from src.compact_graph import CompactGraph
+from src.parallel import vcb_parallel, split_search_tree
+from src.vcb import vcb_degree
+
+
+class TestParallel(unittest.TestCase):
+    """
+    Suite de tests unitaires pour l'exploration parallèle de l'arbre de recherche.
+    """
+
+    def test_split_search_tree(self):
+        """
+        Vérifie le découpage du haut de l'arbre en sous-problèmes indépendants :
+        chaque sous-problème a un budget réduit d'autant de sommets supprimés.
+        """
+        g = CompactGraph.from_networkx(nx.petersen_graph())
+        frontier = split_search_tree(g, 6, "edge", 8)
+        self.assertGreaterEqual(len(frontier), 8)
+        for deleted, budget in frontier:
+            self.assertEqual(budget, 6 - len(deleted))
+        self.assertEqual(g.number_of_edges(), 15)  # Le graphe est restauré
+
+    def test_split_search_tree_immediate_answer(self):
+        """
+        Vérifie qu'une réponse trouvée pendant le découpage est renvoyée directement.
+        """
+        g = CompactGraph.from_networkx(nx.path_graph(3))
+        self.assertIs(split_search_tree(g, 1, "edge", 64), True)
+        self.assertIs(split_search_tree(g, 0, "degree", 64), False)
+
+    def test_parallel_matches_sequential(self):
+        """
+        Vérifie que l'exploration parallèle donne les mêmes réponses que la recherche
+        séquentielle, avec les deux règles de branchement.
+        """
+        g = nx.gnm_random_graph(20, 35, seed=4)
+        for k in range(8, 12):
+            expected = vcb_degree(g, k)
+            for algo in ("edge", "degree"):
+                stats = {}
+                self.assertEqual(vcb_parallel(g, k, stats, workers=2, algo=algo), expected)
+                self.assertGreater(stats["nodes"], 0)
@@ -0,0 +1,80 @@
+import gzip
+import os
+import tempfile
+import unittest
+import networkx as nx
+import numpy as np
+from src.readers import detect_format, read_edges, read_graph
+
+
+class TestReaders(unittest.TestCase):
+    """
+    Suite de tests unitaires pour la lecture de graphes depuis des fichiers texte.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.dir.name, name)
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(path, "wt") as f:
+            f.write(text)
+        return path
+
+    def test_formats(self):
+        """
+        Vérifie la lecture du même graphe (chemin 1-2-3-4 et arête 1-3) dans les quatre
+        formats, avec commentaires, poids METIS et compression gzip.
+        """
+        expected = {(0, 1), (1, 2), (2, 3), (0, 2)}
+        files = {
+            "g.gr": "c commentaire\np td 4 4\n1 2\n2 3\nc milieu\n3 4\n1 3\n",
+            "g.col.gz": "c commentaire\np edge 4 4\ne 1 2\ne 2 3\nn 1 5\ne 3 4\ne 1 3",
+            "g.graph": "% commentaire\n4 4 11\n1 2 1 3 1\n2 1 1 3 2\n3 1 3 2 2 4 9\n1 3 9\n",
+            "g.txt": "# commentaire\n0 1 0.5\n1 2 0.5\n2 3 1.5\n0 2 1\n",
+        }
+        for name, text in files.items():
+            path = self.write(name, text)
+            for block_size in (5, 1 << 20):
+                g = read_graph(path, block_size=block_size)
+                self.assertEqual(g.number_of_nodes(), 4, name)
+                self.assertEqual({tuple(sorted(e)) for e in g.edges()}, expected, name)
+        self.assertEqual([detect_format(name) for name in files], ["pace", "dimacs", "metis", "edgelist"])
+
+    def test_metis_isolated_vertices(self):
+        """
+        Vérifie qu'une ligne vide METIS correspond à un sommet isolé, sans décaler la
+        numérotation des sommets suivants, et que les sommets hors de l'intervalle annoncé
+        ou non entiers ("-3", "a7") sont rejetés avec le nom du fichier et la ligne.
+        """
+        path = self.write("g.metis", "5 2\n2\n1\n\n5\n4\n")
+        n, edges = read_edges(path)
+        self.assertEqual(n, 5)
+        self.assertEqual({tuple(sorted(e)) for e in edges.tolist()}, {(0, 1), (3, 4)})
+        with self.assertRaises(ValueError):
+            read_edges(self.write("bad.gr", "p td 2 1\n1 3\n"))
+        for name, text in (("neg.gr", "p td 3 2\n1 2\n-3 1\n"), ("word.txt", "0 1 0.5\na7 2 1\n"),
+                           ("word.graph", "3 2\n2\n1 3\n2 a\n")):
+            path = self.write(name, text)
+            with self.assertRaisesRegex(ValueError, f"{name} .*ligne [23] "):
+                read_edges(path)
+
+    def test_large_random_graph(self):
+        """
+        Vérifie, sur un graphe aléatoire lu par petits blocs, que les arêtes lues sont
+        exactement celles écrites (format PACE, compressé).
+        """
+        g = nx.gnm_random_graph(300, 2000, seed=4)
+        lines = "".join(f"{u + 1} {v + 1}\n" for u, v in g.edges())
+        path = self.write("r.gr.gz", f"p td 300 2000\n{lines}")
+        n, edges = read_edges(path, block_size=997)
+        self.assertEqual(n, 300)
+        self.assertTrue(np.array_equal(edges, np.array(list(g.edges()))))
+
+
+if __name__ == '__main__':
+    unittest.main()
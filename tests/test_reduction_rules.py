@@ -1,6 +1,8 @@
 import unittest
 import networkx as nx
-from src.reduction_rules import high_degree_rule
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.reduction_rules import high_degree_rule, degree_one_rule, degree_two_rule, lift_cover
 
 
 class TestReductionRules(unittest.TestCase):
@@ -53,4 +55,58 @@ class TestReductionRules(unittest.TestCase):
         g = nx.Graph()
         g.add_edges_from([(1, 2), (2, 3), (3, 4), (1, 3), (2, 4), (1, 4)])  # Graphe dense
         k = high_degree_rule(g, 2)
-        self.assertEqual(k, -2)  # Vérification que la suppression a bien été appliquée
\ No newline at end of file
+        self.assertEqual(k, -2)  # Vérification que la suppression a bien été appliquée
+
+    def test_high_degree_star_heavy(self):
+        """
+        Vérifie la règle sur plusieurs étoiles dont les centres forment une clique.
+        - Chaque suppression d'un centre garde les autres centres au-dessus du seuil.
+        - Tous les centres doivent être supprimés, les feuilles conservées.
+        """
+        g = nx.complete_graph(5)
+        for h in range(5):
+            g.add_edges_from((h, (h, i)) for i in range(4))
+        k = high_degree_rule(g, 6)
+        self.assertEqual(k, 1)
+        self.assertEqual(g.number_of_nodes(), 20)
+        self.assertEqual(g.number_of_edges(), 0)
+
+    def test_degree_one_path(self):
+        """
+        Vérifie la règle des sommets pendants sur un chemin de 5 sommets.
+        - Les réductions en chaîne doivent vider le graphe.
+        - Deux sommets sont pris dans la couverture (taille optimale ⌊5/2⌋).
+        """
+        g = nx.path_graph(5)
+        k = degree_one_rule(g, 3)
+        self.assertEqual(k, 1)
+        self.assertEqual(g.number_of_nodes(), 1)
+        self.assertEqual(g.number_of_edges(), 0)
+
+    def test_degree_two_triangle(self):
+        """
+        Vérifie le cas du triangle : les deux voisins du sommet de degré 2 sont pris.
+        - Sur K3 avec une arête pendante, la couverture optimale est de taille 2.
+        """
+        g = nx.Graph([(0, 1), (1, 2), (0, 2), (2, 3)])
+        trail = []
+        k = degree_two_rule(g, 5, trail=trail)
+        self.assertEqual(k, 3)
+        self.assertEqual(g.number_of_edges(), 0)
+        self.assertTrue(is_vertex_cover(nx.Graph([(0, 1), (1, 2), (0, 2), (2, 3)]), lift_cover(trail, [])))
+
+    def test_degree_two_fold_and_lift(self):
+        """
+        Vérifie le repliement sur des cycles, pour les deux représentations de graphe.
+        - Un cycle de longueur c est entièrement réduit et k diminue de ⌈c/2⌉.
+        - La couverture reconstruite par `lift_cover` est valide et de taille ⌈c/2⌉.
+        """
+        for c in (5, 6, 9):
+            for g in (nx.cycle_graph(c), CompactGraph.from_networkx(nx.cycle_graph(c))):
+                trail = []
+                k = degree_two_rule(g, c, trail=trail)
+                self.assertEqual(g.number_of_edges(), 0)
+                self.assertEqual(c - k, (c + 1) // 2)
+                cover = lift_cover(trail, [])
+                self.assertEqual(len(cover), (c + 1) // 2)
+                self.assertTrue(is_vertex_cover(nx.cycle_graph(c), cover))
@@ -0,0 +1,119 @@
+import os
+import pickle
+import tempfile
+import unittest
+import networkx as nx
+import numpy as np
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.kernel import kernel_vertex_cover_crown
+from src.parallel import vcb_parallel
+from src.reduction_rules import lift_cover
+from src.storage import load_graph, load_kernel, read_header, save_graph
+from src.vcb import find_vertex_cover, vcb_degree
+
+
+class TestStorage(unittest.TestCase):
+    """
+    Suite de tests unitaires pour le format binaire des graphes et des noyaux.
+    """
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "g.vcg")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_graph_round_trip(self):
+        """
+        Vérifie qu'un graphe relu est projeté en mémoire sans copie, qu'un graphe dont des
+        sommets ont été supprimés est renuméroté avec ses sommets d'origine pour étiquettes,
+        que les étiquettes propres d'un `CompactGraph` sont conservées (et composées), et
+        qu'un fichier remplacé reste lisible par les graphes qui le projetaient.
+        """
+        g = CompactGraph.from_networkx(nx.petersen_graph())
+        save_graph(self.path, g)
+        h = load_graph(self.path)
+        self.assertIsInstance(h._neighbors.base, np.memmap)
+        self.assertEqual(sorted(h.edges()), sorted(g.edges()))
+        self.assertIsNone(read_header(self.path)["k"])
+
+        edges = sorted(h.edges())
+        g.remove_nodes_from([0, 5])
+        save_graph(self.path, g)
+        self.assertEqual(sorted(h.edges()), edges)
+        h = load_graph(self.path)
+        self.assertEqual(h.number_of_nodes(), 8)
+        self.assertEqual({tuple(sorted(h.to_labels(e))) for e in h.edges()},
+                         {tuple(sorted(e)) for e in g.edges()})
+
+        g = CompactGraph.from_edges(4, [(0, 1), (1, 2), (2, 3)], labels=[10, 20, 30, 40])
+        save_graph(self.path, g)
+        self.assertEqual(load_graph(self.path).labels, [10, 20, 30, 40])
+        g.remove_node(1)
+        save_graph(self.path, g)
+        h = load_graph(self.path)
+        self.assertEqual(h.labels, [10, 30, 40])
+        self.assertEqual([tuple(h.to_labels(e)) for e in h.edges()], [(30, 40)])
+        self.assertEqual([name for name in os.listdir(self.dir.name)], ["g.vcg"])
+
+    def test_kernel_round_trip(self):
+        """
+        Vérifie qu'un noyau relu (paramètre réduit et journal avec repliements) donne, après
+        relèvement, une couverture valide du graphe d'origine, qu'il ait été calculé sur un
+        `nx.Graph` ou sur un `CompactGraph` étiqueté (journal en indices).
+        """
+        g = nx.random_regular_graph(4, 40, seed=1)
+        g.add_edges_from([(100, 101), (101, 102), (102, 0), (103, 1)])
+        for graph in (g, CompactGraph.from_networkx(g)):
+            trail = []
+            ker_g, ker_k, no_inst = kernel_vertex_cover_crown(graph, 26, None, trail)
+            self.assertFalse(no_inst)
+            self.assertIn("fold", [entry[0] for entry in trail])
+            save_graph(self.path, ker_g, ker_k, trail)
+
+            kernel, k, loaded_trail = load_kernel(self.path)
+            self.assertEqual((k, len(loaded_trail)), (ker_k, len(trail)))
+            self.assertEqual(loaded_trail == trail, graph is g)  # Indices traduits en étiquettes
+            cover = find_vertex_cover(kernel, k, "degree")
+            self.assertIsNotNone(cover)
+            cover = lift_cover(loaded_trail, kernel.to_labels(cover))
+            self.assertLessEqual(len(cover), 26)
+            self.assertTrue(is_vertex_cover(g, cover))
+
+    def test_pickle_by_path(self):
+        """
+        Vérifie qu'un graphe projeté se sérialise par le chemin de son fichier (état courant
+        compris) et qu'il peut être confié à des processus de travail.
+        """
+        g = CompactGraph.from_networkx(nx.gnm_random_graph(200, 1500, seed=2))
+        save_graph(self.path, g)
+        h = load_graph(self.path)
+        h.remove_node(3)
+        data = pickle.dumps(h)
+        self.assertLess(len(data), g._neighbors.nbytes)
+        copy = pickle.loads(data)
+        self.assertNotIn(3, copy)
+        self.assertEqual(sorted(copy.edges()), sorted(h.edges()))
+
+        small = nx.gnm_random_graph(16, 34, seed=5)
+        save_graph(self.path, small)
+        for k in (7, 9):
+            self.assertEqual(vcb_parallel(load_graph(self.path), k, workers=2, algo="degree"),
+                             vcb_degree(small, k))
+
+    def test_pickle_rejects_replaced_file(self):
+        """
+        Vérifie qu'un graphe sérialisé ne rouvre pas un fichier réécrit entre-temps.
+        """
+        save_graph(self.path, nx.path_graph(10))
+        h = load_graph(self.path)
+        data = pickle.dumps(h)
+        save_graph(self.path, nx.path_graph(20))
+        with self.assertRaises(ValueError):
+            pickle.loads(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import networkx as nx
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.transposition import TranspositionTable
+from src.vcb import find_vertex_cover, vcb_degree, vcb_recursive
+
+
+class TestTransposition(unittest.TestCase):
+    """
+    Suite de tests unitaires pour la table de transposition et les empreintes de Zobrist.
+    """
+
+    def test_table_budgets_and_eviction(self):
+        """
+        Vérifie qu'un échec vaut pour les budgets inférieurs, un succès pour les budgets
+        supérieurs, et que l'entrée la moins récemment utilisée est évincée.
+        """
+        table = TranspositionTable(capacity=2)
+        table.store(1, 5, False)
+        table.store(1, 8, True)
+        self.assertFalse(table.lookup(1, 4))
+        self.assertTrue(table.lookup(1, 9))
+        self.assertIsNone(table.lookup(1, 6))
+        self.assertEqual((table.hits, table.misses), (2, 1))
+
+        table.store(2, 3, False)
+        table.lookup(1, 4)  # 1 devient l'entrée la plus récente
+        table.store(3, 3, False)
+        self.assertEqual(table.evictions, 1)
+        self.assertIsNone(table.lookup(2, 0))
+        self.assertFalse(table.lookup(1, 5))
+
+    def test_fingerprint_order_independent(self):
+        """
+        Vérifie que l'empreinte ne dépend que de l'ensemble des sommets présents et qu'elle
+        est restaurée par l'annulation.
+        """
+        g = CompactGraph.from_networkx(nx.petersen_graph())
+        g.enable_fingerprint(seed=7)
+        root = g.fingerprint
+        h = g.copy()
+        g.remove_nodes_from([1, 4, 6])
+        h.remove_nodes_from([6, 1, 4])
+        self.assertEqual(g.fingerprint, h.fingerprint)
+        self.assertNotEqual(g.fingerprint, root)
+        g.undo(0)
+        self.assertEqual(g.fingerprint, root)
+
+    def test_search_with_table(self):
+        """
+        Vérifie que la recherche avec table (y compris minuscule, donc avec évictions) donne
+        les mêmes réponses et des témoins valides, et que la table évite des nœuds.
+        """
+        for seed in range(6):
+            g = nx.gnm_random_graph(14, 28, seed=seed)
+            for k in range(4, 10):
+                expected = vcb_degree(g, k)
+                for size in (8, 4096):
+                    self.assertEqual(vcb_recursive(g, k, table_size=size), expected)
+                    self.assertEqual(vcb_degree(g, k, table_size=size, split_components=True), expected)
+                    cover = find_vertex_cover(g, k, "edge", table_size=size, interleave=True)
+                    self.assertEqual(cover is not None, expected)
+                    if cover is not None:
+                        self.assertTrue(is_vertex_cover(g, cover))
+
+        g = nx.gnm_random_graph(20, 45, seed=2)
+        plain, cached = {}, {}
+        self.assertFalse(vcb_recursive(g, 10, plain))
+        self.assertFalse(vcb_recursive(g, 10, cached, table_size=4096))
+        self.assertGreater(cached["table"]["hits"], 0)
+        self.assertLess(cached["nodes"], plain["nodes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
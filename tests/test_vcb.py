@@ -1,6 +1,8 @@
 import unittest
 import networkx as nx
-from src.vcb import vcb_recursive
+from src.compact_graph import CompactGraph
+from src.graph_utils import is_vertex_cover
+from src.vcb import vcb_recursive, vcb_degree, min_cover_size_max_degree_two, find_vertex_cover
 
 
 class TestVCB(unittest.TestCase):
@@ -77,3 +79,89 @@ class TestVCB(unittest.TestCase):
         g.add_edges_from([(1, 2), (3, 4), (5, 6)])
         self.assertTrue(vcb_recursive(g, 3))  # Chaque arête requiert au moins un sommet dans le cover
         self.assertFalse(vcb_recursive(g, 2))  # 2 sommets ne suffisent pas pour 3 arêtes
+
+    def test_vcb_leaves_graph_unchanged(self):
+        """
+        Vérifie que la recherche en place restaure entièrement le graphe :
+        - l'entrée nx.Graph n'est pas modifiée ;
+        - un graphe compact retrouve ses sommets et arêtes après la recherche.
+        """
+        g = nx.petersen_graph()
+        self.assertFalse(vcb_recursive(g, 5))
+        self.assertEqual(g.number_of_edges(), 15)
+
+        cg = CompactGraph.from_networkx(g)
+        self.assertTrue(vcb_recursive(cg, 6))
+        self.assertEqual(cg.number_of_nodes(), 10)
+        self.assertEqual(cg.number_of_edges(), 15)
+
+    def test_vcb_degree_matches_edge_branching(self):
+        """
+        Vérifie que le branchement sur le sommet de degré maximum donne les mêmes réponses
+        que le branchement sur une arête, avec un arbre de recherche plus petit.
+        """
+        for seed in range(20):
+            g = nx.gnm_random_graph(12, 24, seed=seed)
+            for k in range(3, 9):
+                self.assertEqual(vcb_degree(g, k), vcb_recursive(g, k))
+
+        g = nx.petersen_graph()
+        edge_stats, degree_stats = {}, {}
+        self.assertFalse(vcb_recursive(g, 5, edge_stats))
+        self.assertFalse(vcb_degree(g, 5, degree_stats))
+        self.assertLess(degree_stats["nodes"], edge_stats["nodes"])
+
+    def test_min_cover_paths_and_cycles(self):
+        """
+        Vérifie la résolution polynomiale des graphes de degré maximum ≤ 2 :
+        ⌊p/2⌋ pour un chemin à p sommets, ⌈c/2⌉ pour un cycle à c sommets.
+        """
+        g = nx.disjoint_union_all([nx.path_graph(5), nx.cycle_graph(5), nx.path_graph(2)])
+        self.assertEqual(min_cover_size_max_degree_two(g), 2 + 3 + 1)
+        self.assertTrue(vcb_degree(g, 6))
+        self.assertFalse(vcb_degree(g, 5))
+
+    def test_vcb_interleaved_reductions(self):
+        """
+        Vérifie que les réductions entrelacées donnent les mêmes réponses, réduisent
+        l'arbre de recherche et sont annulées au retour arrière.
+        """
+        g = nx.gnm_random_graph(30, 45, seed=2)
+        for k in range(12, 16):
+            expected = vcb_degree(g, k)
+            self.assertEqual(vcb_recursive(g, k, interleave=True), expected)
+            self.assertEqual(vcb_degree(g, k, interleave=True, crown_every=2), expected)
+
+        plain, interleaved = {}, {}
+        vcb_recursive(g, 14, plain)
+        vcb_recursive(g, 14, interleaved, interleave=True, crown_every=1)
+        self.assertLess(interleaved["nodes"], plain["nodes"])
+        self.assertGreater(interleaved["reductions"]["degree_one"], 0)
+
+    def test_vcb_split_components(self):
+        """
+        Vérifie la résolution composante par composante : mêmes réponses,
+        décomposition détectée à la racine et après suppressions.
+        """
+        g = nx.disjoint_union_all([nx.cycle_graph(5), nx.petersen_graph(), nx.path_graph(4)])
+        # Couverture minimale : 3 + 6 + 2 = 11
+        for engine in (vcb_recursive, vcb_degree):
+            stats = {}
+            self.assertTrue(engine(g, 11, stats, split_components=True))
+            self.assertGreaterEqual(stats["components"], 1)
+            self.assertFalse(engine(g, 10, split_components=True, interleave=True))
+
+    def test_find_vertex_cover_witness(self):
+        """
+        Vérifie que la recherche renvoie un témoin valide de taille ≤ k (étiquettes d'origine),
+        et None quand k est trop petit, pour les deux moteurs et avec toutes les options.
+        """
+        g = nx.relabel_nodes(nx.gnm_random_graph(24, 40, seed=4), lambda v: f"v{v}")
+        size = next(j for j in range(25) if vcb_degree(g, j))
+        options = {"interleave": True, "crown_every": 2, "split_components": True}
+        for algo in ("edge", "degree"):
+            self.assertIsNone(find_vertex_cover(g, size - 1, algo))
+            for opts in ({}, options):
+                cover = find_vertex_cover(g, size, algo, **opts)
+                self.assertEqual(len(cover), size)
+                self.assertTrue(is_vertex_cover(g, cover))